@@ -0,0 +1,202 @@
+"""Add news storage tables for PostgreSQL backend
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-01-03
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+# 分区父表删除时一并删除所有月分区
+_TABLES = [
+    'rss_crawl_status',
+    'rss_crawl_records',
+    'rss_items',
+    'rss_feeds',
+    'push_records',
+    'crawl_source_status',
+    'crawl_records',
+    'rank_history',
+    'title_changes',
+    'news_items',
+    'platforms',
+]
+
+# 本修订创建时 trendradar/storage/postgres_schema.sql 的内容（固定在迁移中，不随应用代码变化）
+# 月分区（news_items_p202501 等）由存储后端写入时按需创建
+_SCHEMA_SQL = """
+-- ============================================
+-- 平台信息表（跨日期共享，名称取最新一次抓取）
+-- ============================================
+CREATE TABLE IF NOT EXISTS platforms (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    is_active BOOLEAN DEFAULT TRUE,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ============================================
+-- 新闻条目表（按月分区）
+-- 同一天内以 URL + platform_id 为唯一标识，写入时按日期加锁保证去重
+-- ============================================
+CREATE TABLE IF NOT EXISTS news_items (
+    id BIGSERIAL,
+    crawl_date DATE NOT NULL,
+    title TEXT NOT NULL,
+    platform_id TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    url TEXT DEFAULT '',
+    mobile_url TEXT DEFAULT '',
+    first_crawl_time TEXT NOT NULL,      -- 首次抓取时间（HH-MM）
+    last_crawl_time TEXT NOT NULL,       -- 最后抓取时间（HH-MM）
+    crawl_count INTEGER DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (crawl_date, id)
+) PARTITION BY RANGE (crawl_date);
+
+-- ============================================
+-- 标题变更历史表（按月分区）
+-- ============================================
+CREATE TABLE IF NOT EXISTS title_changes (
+    id BIGSERIAL,
+    crawl_date DATE NOT NULL,
+    news_item_id BIGINT NOT NULL,
+    old_title TEXT NOT NULL,
+    new_title TEXT NOT NULL,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (crawl_date, id)
+) PARTITION BY RANGE (crawl_date);
+
+-- ============================================
+-- 排名历史表（按月分区）
+-- ============================================
+CREATE TABLE IF NOT EXISTS rank_history (
+    id BIGSERIAL,
+    crawl_date DATE NOT NULL,
+    news_item_id BIGINT NOT NULL,
+    rank INTEGER NOT NULL,
+    crawl_time TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (crawl_date, id)
+) PARTITION BY RANGE (crawl_date);
+
+-- ============================================
+-- 抓取记录与来源状态表
+-- ============================================
+CREATE TABLE IF NOT EXISTS crawl_records (
+    crawl_date DATE NOT NULL,
+    crawl_time TEXT NOT NULL,
+    total_items INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (crawl_date, crawl_time)
+);
+
+CREATE TABLE IF NOT EXISTS crawl_source_status (
+    crawl_date DATE NOT NULL,
+    crawl_time TEXT NOT NULL,
+    platform_id TEXT NOT NULL,
+    status TEXT NOT NULL CHECK(status IN ('success', 'failed')),
+    PRIMARY KEY (crawl_date, crawl_time, platform_id)
+);
+
+-- ============================================
+-- 推送记录表
+-- ============================================
+CREATE TABLE IF NOT EXISTS push_records (
+    date DATE PRIMARY KEY,
+    pushed BOOLEAN DEFAULT FALSE,
+    push_time TEXT,
+    report_type TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ============================================
+-- RSS 源信息表（跨日期共享）
+-- ============================================
+CREATE TABLE IF NOT EXISTS rss_feeds (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    feed_url TEXT DEFAULT '',
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ============================================
+-- RSS 条目表（按月分区）
+-- ============================================
+CREATE TABLE IF NOT EXISTS rss_items (
+    id BIGSERIAL,
+    crawl_date DATE NOT NULL,
+    title TEXT NOT NULL,
+    feed_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    published_at TEXT,
+    summary TEXT,
+    author TEXT,
+    first_crawl_time TEXT NOT NULL,
+    last_crawl_time TEXT NOT NULL,
+    crawl_count INTEGER DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (crawl_date, id)
+) PARTITION BY RANGE (crawl_date);
+
+CREATE TABLE IF NOT EXISTS rss_crawl_records (
+    crawl_date DATE NOT NULL,
+    crawl_time TEXT NOT NULL,
+    total_items INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (crawl_date, crawl_time)
+);
+
+CREATE TABLE IF NOT EXISTS rss_crawl_status (
+    crawl_date DATE NOT NULL,
+    crawl_time TEXT NOT NULL,
+    feed_id TEXT NOT NULL,
+    status TEXT NOT NULL CHECK(status IN ('success', 'failed')),
+    error_message TEXT,
+    PRIMARY KEY (crawl_date, crawl_time, feed_id)
+);
+
+-- ============================================
+-- 索引定义（建在分区父表上，自动应用到每个分区）
+-- ============================================
+
+-- 同日 URL 去重查找
+CREATE INDEX IF NOT EXISTS idx_pg_news_url_platform ON news_items(crawl_date, platform_id, url);
+
+-- 最新一次抓取的数据
+CREATE INDEX IF NOT EXISTS idx_pg_news_last_crawl ON news_items(crawl_date, last_crawl_time);
+
+-- 新增标题检测（按首次抓取时间取历史标题）
+CREATE INDEX IF NOT EXISTS idx_pg_news_first_crawl ON news_items(crawl_date, first_crawl_time, platform_id, title);
+
+-- 单条新闻的排名历史
+CREATE INDEX IF NOT EXISTS idx_pg_rank_history_item_time ON rank_history(crawl_date, news_item_id, crawl_time, rank);
+
+CREATE INDEX IF NOT EXISTS idx_pg_title_changes_item ON title_changes(crawl_date, news_item_id);
+
+CREATE INDEX IF NOT EXISTS idx_pg_rss_url_feed ON rss_items(crawl_date, feed_id, url);
+
+CREATE INDEX IF NOT EXISTS idx_pg_rss_last_crawl ON rss_items(crawl_date, last_crawl_time);
+
+CREATE INDEX IF NOT EXISTS idx_pg_rss_published ON rss_items(crawl_date, published_at DESC);
+"""
+
+
+def upgrade() -> None:
+    # 均为 IF NOT EXISTS，存储后端已先行建表时不受影响
+    op.execute(_SCHEMA_SQL)
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"DROP TABLE IF EXISTS {table} CASCADE")
@@ -1,56 +1,327 @@
 """
 缓存服务
 
-实现TTL缓存机制，提升数据访问性能。
+实现带容量上限的 LRU + TTL 缓存机制，提升数据访问性能。
+
+- 按条目数和估算字节数双重限制，超出时淘汰最久未使用的条目
+- 按命名空间（缓存键第一个 ":" 之前的部分）配置默认 TTL
+- 并发未命中同一个键时只执行一次加载（singleflight）
+- 条目可携带数据版本（如单日数据库签名），版本变化即失效，配合 NO_EXPIRY 可长期缓存；
+  没有版本的条目始终按 TTL 过期
 """
 
+import sys
 import time
-from typing import Any, Optional
-from threading import Lock
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from threading import Event, Lock
+
+
+# 各命名空间的默认 TTL（秒），未列出的命名空间使用 default_ttl
+DEFAULT_NAMESPACE_TTLS: Dict[str, int] = {
+    "read_all": 900,
+    "latest_news": 900,
+    "news_by_date": 1800,
+    "trending_topics": 1800,
+    "config": 3600,
+    "latest_rss": 900,
+    "search_rss": 900,
+    "rss_feeds_status": 300,
+}
+
+# 永不过期（用于携带数据版本的条目，失效由版本变化决定）
+NO_EXPIRY = float("inf")
+
+# 估算对象大小时的最大遍历对象数，避免超大结构拖慢写入
+_SIZE_ESTIMATE_LIMIT = 200000
+
+
+def estimate_size(value: Any) -> int:
+    """
+    粗略估算对象占用的字节数（递归累加容器及其元素的 sys.getsizeof）
+
+    Args:
+        value: 任意对象
+
+    Returns:
+        估算字节数
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    visited = 0
+    while stack and visited < _SIZE_ESTIMATE_LIMIT:
+        obj = stack.pop()
+        obj_id = id(obj)
+        if obj_id in seen:
+            continue
+        seen.add(obj_id)
+        visited += 1
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return total
+
+
+class _CacheEntry:
+    """缓存条目"""
+
+    __slots__ = ("value", "timestamp", "size", "ttl", "version")
+
+    def __init__(
+        self,
+        value: Any,
+        timestamp: float,
+        size: int,
+        ttl: Optional[float] = None,
+        version: Optional[str] = None,
+    ):
+        self.value = value
+        self.timestamp = timestamp
+        self.size = size
+        self.ttl = ttl
+        self.version = version
+
+
+class _Flight:
+    """一次进行中的加载，供同键的并发请求等待"""
+
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
 
 
 class CacheService:
     """缓存服务类"""
 
-    def __init__(self):
-        """初始化缓存服务"""
-        self._cache = {}
-        self._timestamps = {}
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 256 * 1024 * 1024,
+        default_ttl: int = 900,
+        namespace_ttls: Optional[Dict[str, int]] = None,
+        cleanup_interval: int = 60,
+    ):
+        """
+        初始化缓存服务
+
+        Args:
+            max_entries: 最大条目数（<=0 表示不限制）
+            max_bytes: 最大估算字节数（<=0 表示不限制）
+            default_ttl: 未配置命名空间时的默认 TTL（秒）
+            namespace_ttls: 命名空间 TTL 配置，默认使用 DEFAULT_NAMESPACE_TTLS
+            cleanup_interval: 写入时顺带清理过期条目的最小间隔（秒）
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.namespace_ttls = dict(DEFAULT_NAMESPACE_TTLS)
+        if namespace_ttls:
+            self.namespace_ttls.update(namespace_ttls)
+        self.cleanup_interval = cleanup_interval
+
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self._flights: Dict[Tuple[str, Optional[str]], _Flight] = {}
+        self._last_cleanup = time.time()
         self._lock = Lock()
 
-    def get(self, key: str, ttl: int = 900) -> Optional[Any]:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._loads = 0
+        self._coalesced = 0
+
+    @staticmethod
+    def _namespace(key: str) -> str:
+        """缓存键的命名空间（第一个 ':' 之前的部分）"""
+        return key.split(":", 1)[0]
+
+    def _resolve_ttl(
+        self,
+        key: str,
+        ttl: Optional[float],
+        entry: Optional[_CacheEntry] = None,
+    ) -> float:
+        """显式 TTL 优先，其次为写入时指定的 TTL，否则使用命名空间 TTL"""
+        if ttl is not None:
+            return ttl
+        if entry is not None and entry.ttl is not None:
+            return entry.ttl
+        return self.namespace_ttls.get(self._namespace(key), self.default_ttl)
+
+    def _remove(self, key: str) -> None:
+        """删除条目（调用方持有锁）"""
+        entry = self._cache.pop(key)
+        self._total_bytes -= entry.size
+
+    def _lookup(
+        self,
+        key: str,
+        ttl: Optional[float],
+        version: Optional[str] = None,
+    ) -> Optional[Any]:
+        """查找未过期且版本一致的缓存并更新 LRU 顺序与计数（调用方持有锁）"""
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry.version != version:
+                # 数据已更新（含版本变为/不再为 None），旧条目失效
+                self._remove(key)
+                self._invalidations += 1
+            elif time.time() - entry.timestamp < self._resolve_ttl(key, ttl, entry):
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return entry.value
+            else:
+                # 已过期，删除缓存
+                self._remove(key)
+                self._expirations += 1
+        self._misses += 1
+        return None
+
+    def get(
+        self,
+        key: str,
+        ttl: Optional[float] = None,
+        version: Optional[str] = None,
+    ) -> Optional[Any]:
         """
         获取缓存数据
 
         Args:
             key: 缓存键
-            ttl: 存活时间（秒），默认15分钟
+            ttl: 存活时间（秒），默认使用写入时指定的 TTL 或命名空间 TTL
+            version: 当前数据版本（可选），与写入时的版本不一致时视为失效
 
         Returns:
-            缓存的值，如果不存在或已过期则返回None
+            缓存的值，如果不存在、已过期或版本不一致则返回None
         """
         with self._lock:
-            if key in self._cache:
-                # 检查是否过期
-                if time.time() - self._timestamps[key] < ttl:
-                    return self._cache[key]
-                else:
-                    # 已过期，删除缓存
-                    del self._cache[key]
-                    del self._timestamps[key]
-        return None
+            return self._lookup(key, ttl, version)
 
-    def set(self, key: str, value: Any) -> None:
+    def set(
+        self,
+        key: str,
+        value: Any,
+        size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        version: Optional[str] = None,
+    ) -> None:
         """
         设置缓存数据
 
         Args:
             key: 缓存键
             value: 缓存值
+            size: 条目字节数（可选，默认自动估算）
+            ttl: 条目存活时间（秒，可选，默认使用命名空间 TTL；NO_EXPIRY 表示不过期）
+            version: 数据版本（可选；为 None 时无法按版本失效，NO_EXPIRY 退化为命名空间 TTL）
         """
+        if version is None and ttl == NO_EXPIRY:
+            ttl = None
+        if size is None:
+            size = estimate_size(value) if self.max_bytes > 0 else 0
+
         with self._lock:
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
+            if key in self._cache:
+                self._remove(key)
+            self._cache[key] = _CacheEntry(value, time.time(), size, ttl, version)
+            self._total_bytes += size
+            self._maybe_cleanup()
+            self._evict()
+
+    def _evict(self) -> None:
+        """按 LRU 顺序淘汰超出容量的条目，最新写入的条目始终保留（调用方持有锁）"""
+        while len(self._cache) > 1 and (
+            (self.max_entries > 0 and len(self._cache) > self.max_entries)
+            or (self.max_bytes > 0 and self._total_bytes > self.max_bytes)
+        ):
+            oldest_key = next(iter(self._cache))
+            self._remove(oldest_key)
+            self._evictions += 1
+
+    def _maybe_cleanup(self) -> None:
+        """写入时按间隔顺带清理过期条目（调用方持有锁）"""
+        now = time.time()
+        if now - self._last_cleanup < self.cleanup_interval:
+            return
+        self._last_cleanup = now
+        self._cleanup_locked(None, now)
+
+    def _cleanup_locked(self, ttl: Optional[float], now: float) -> int:
+        expired_keys = [
+            key for key, entry in self._cache.items()
+            if now - entry.timestamp >= self._resolve_ttl(key, ttl, entry)
+        ]
+        for key in expired_keys:
+            self._remove(key)
+        self._expirations += len(expired_keys)
+        return len(expired_keys)
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None,
+        version: Optional[str] = None,
+    ) -> Any:
+        """
+        获取缓存数据，未命中时调用 loader 加载并写入缓存
+
+        同一个键的并发未命中只会执行一次 loader，其余请求等待并共享结果；
+        loader 返回假值时不写入缓存，抛出的异常会传递给所有等待者。
+
+        Args:
+            key: 缓存键
+            loader: 无参加载函数
+            ttl: 存活时间（秒），默认使用命名空间 TTL
+            version: 当前数据版本（可选），同时作为新条目的版本写入
+
+        Returns:
+            缓存或新加载的值
+        """
+        with self._lock:
+            value = self._lookup(key, ttl, version)
+            if value is not None:
+                return value
+            flight_key = (key, version)
+            flight = self._flights.get(flight_key)
+            if flight is None:
+                flight = _Flight()
+                self._flights[flight_key] = flight
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = loader()
+            if value:
+                self.set(key, value, ttl=ttl, version=version)
+            flight.value = value
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._loads += 1
+                self._flights.pop(flight_key, None)
+            flight.event.set()
 
     def delete(self, key: str) -> bool:
         """
@@ -64,8 +335,7 @@ class CacheService:
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
                 return True
         return False
 
@@ -73,30 +343,20 @@ class CacheService:
         """清空所有缓存"""
         with self._lock:
             self._cache.clear()
-            self._timestamps.clear()
+            self._total_bytes = 0
 
-    def cleanup_expired(self, ttl: int = 900) -> int:
+    def cleanup_expired(self, ttl: Optional[float] = None) -> int:
         """
         清理过期缓存
 
         Args:
-            ttl: 存活时间（秒）
+            ttl: 存活时间（秒），默认使用各命名空间 TTL
 
         Returns:
             清理的条目数量
         """
         with self._lock:
-            current_time = time.time()
-            expired_keys = [
-                key for key, timestamp in self._timestamps.items()
-                if current_time - timestamp >= ttl
-            ]
-
-            for key in expired_keys:
-                del self._cache[key]
-                del self._timestamps[key]
-
-            return len(expired_keys)
+            return self._cleanup_locked(ttl, time.time())
 
     def get_stats(self) -> dict:
         """
@@ -106,16 +366,24 @@ class CacheService:
             统计信息字典
         """
         with self._lock:
+            now = time.time()
+            timestamps = [entry.timestamp for entry in self._cache.values()]
+            lookups = self._hits + self._misses
             return {
                 "total_entries": len(self._cache),
-                "oldest_entry_age": (
-                    time.time() - min(self._timestamps.values())
-                    if self._timestamps else 0
-                ),
-                "newest_entry_age": (
-                    time.time() - max(self._timestamps.values())
-                    if self._timestamps else 0
-                )
+                "total_bytes": self._total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "loads": self._loads,
+                "coalesced_loads": self._coalesced,
+                "oldest_entry_age": now - min(timestamps) if timestamps else 0,
+                "newest_entry_age": now - max(timestamps) if timestamps else 0,
             }
 
 
@@ -9,7 +9,7 @@ from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
-from .cache_service import get_cache
+from .cache_service import NO_EXPIRY, get_cache
 from .parser_service import ParserService
 from ..utils.errors import DataNotFoundError
 
@@ -65,7 +65,8 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"latest_news:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=900)  # 15分钟缓存
+        version = self.parser.get_data_version()
+        cached = self.cache.get(cache_key, version=version)
         if cached:
             return cached
 
@@ -112,8 +113,8 @@ class DataService:
         # 限制返回数量
         result = news_list[:limit]
 
-        # 缓存结果
-        self.cache.set(cache_key, result)
+        # 缓存结果（有新的抓取写入前一直有效）
+        self.cache.set(cache_key, result, ttl=NO_EXPIRY, version=version)
 
         return result
 
@@ -150,7 +151,8 @@ class DataService:
         # 尝试从缓存获取
         date_str = target_date.strftime("%Y-%m-%d")
         cache_key = f"news_by_date:{date_str}:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
+        version = self.parser.get_data_version(target_date)
+        cached = self.cache.get(cache_key, version=version)
         if cached:
             return cached
 
@@ -192,8 +194,8 @@ class DataService:
         # 限制返回数量
         result = news_list[:limit]
 
-        # 缓存结果(历史数据缓存更久)
-        self.cache.set(cache_key, result)
+        # 缓存结果（按数据版本失效，历史数据不再变化即长期有效）
+        self.cache.set(cache_key, result, ttl=NO_EXPIRY, version=version)
 
         return result
 
@@ -234,7 +236,9 @@ class DataService:
         current_date = start_date
         while current_date <= end_date:
             try:
-                all_titles, id_to_name, _ = self.parser.read_all_titles_for_date(
+                # 全文索引只返回匹配的条目
+                all_titles, id_to_name, _ = self.parser.search_titles_for_date(
+                    keyword,
                     date=current_date,
                     platform_ids=platforms
                 )
@@ -353,7 +357,11 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"trending_topics:{top_n}:{mode}:{extract_mode}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
+        version = self.parser.get_data_version()
+        if extract_mode == "keywords":
+            # 关注词配置变化同样需要重新统计
+            version = f"{version}|{self._get_frequency_words_version()}"
+        cached = self.cache.get(cache_key, version=version)
         if cached:
             return cached
 
@@ -429,10 +437,18 @@ class DataService:
         }
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=NO_EXPIRY, version=version)
 
         return result
 
+    def _get_frequency_words_version(self) -> str:
+        """关注词配置文件的版本（mtime 和大小），文件不存在时返回 '-'"""
+        try:
+            stat = (self.parser.project_root / "config" / "frequency_words.txt").stat()
+            return f"{stat.st_mtime_ns}:{stat.st_size}"
+        except FileNotFoundError:
+            return "-"
+
     def _get_mode_description(self, mode: str, extract_mode: str = "keywords") -> str:
         """获取模式描述"""
         mode_desc = {
@@ -462,7 +478,7 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"config:{section}"
-        cached = self.cache.get(cache_key, ttl=3600)  # 1小时缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -692,7 +708,8 @@ class DataService:
             DataNotFoundError: 数据不存在
         """
         cache_key = f"latest_rss:{','.join(feeds or [])}:{limit}:{include_summary}"
-        cached = self.cache.get(cache_key, ttl=900)
+        version = self.parser.get_data_version(db_type="rss")
+        cached = self.cache.get(cache_key, version=version)
         if cached:
             return cached
 
@@ -738,7 +755,7 @@ class DataService:
         result = rss_list[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=NO_EXPIRY, version=version)
 
         return result
 
@@ -764,7 +781,7 @@ class DataService:
             匹配的 RSS 条目列表
         """
         cache_key = f"search_rss:{keyword}:{','.join(feeds or [])}:{days}:{limit}:{include_summary}"
-        cached = self.cache.get(cache_key, ttl=900)
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -775,7 +792,9 @@ class DataService:
             target_date = today - timedelta(days=i)
 
             try:
-                all_items, id_to_name, _ = self.parser.read_all_titles_for_date(
+                # 全文索引只返回标题或摘要匹配的条目
+                all_items, id_to_name, _ = self.parser.search_titles_for_date(
+                    keyword,
                     date=target_date,
                     platform_ids=feeds,
                     db_type="rss"
@@ -825,7 +844,7 @@ class DataService:
             RSS 源状态信息
         """
         cache_key = "rss_feeds_status"
-        cached = self.cache.get(cache_key, ttl=300)
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
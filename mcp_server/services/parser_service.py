@@ -8,13 +8,25 @@ v2.0.0: 仅支持 SQLite 数据库，移除 TXT 文件支持
 import re
 import sqlite3
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from typing import Dict, Iterator, List, Tuple, Optional
+from datetime import datetime, timedelta
 
 import yaml
 
+from trendradar.storage.archive import ArchiveStore
+from trendradar.storage.cold import COLD_CACHE_DIR, COLD_SUFFIXES, find_cold_file, open_cold_db
+from trendradar.storage.sqlite_helpers import (
+    build_item_filter,
+    connect_sqlite,
+    get_db_signature,
+    get_schema_version,
+    has_table,
+    parse_ranks,
+    rank_history_column,
+)
+
 from ..utils.errors import FileParseError, DataNotFoundError
-from .cache_service import get_cache
+from .cache_service import NO_EXPIRY, get_cache
 
 
 class ParserService:
@@ -34,6 +46,8 @@ class ParserService:
             self.project_root = Path(project_root)
 
         self.cache = get_cache()
+        self._storage_config: Optional[Dict] = None
+        self._archive = None
 
     @staticmethod
     def clean_title(title: str) -> str:
@@ -61,6 +75,7 @@ class ParserService:
         获取数据库文件路径
 
         新结构：output/{type}/{date}.db
+        已转为冷存储（{date}.db.zst 等）的日期返回解压缓存中的数据库
 
         Args:
             date: 日期对象，默认为今天
@@ -73,8 +88,63 @@ class ParserService:
         db_path = self.project_root / "output" / db_type / f"{date_str}.db"
         if db_path.exists():
             return db_path
+
+        cold_path = find_cold_file(db_path)
+        if cold_path is not None:
+            try:
+                return open_cold_db(cold_path, self.project_root / "output" / COLD_CACHE_DIR / db_type)
+            except Exception as e:
+                print(f"Warning: 解压冷存储文件失败 {cold_path.name}: {e}")
         return None
 
+    def get_data_version(self, date: datetime = None, db_type: str = "news") -> Optional[str]:
+        """
+        获取单日数据库的数据版本（文件签名，两次 stat 即可得到）
+
+        新的抓取写入后签名随之变化，缓存以此判断是否失效；冷存储日期使用冷存储文件的签名。
+
+        Args:
+            date: 日期对象，默认为今天
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            版本字符串，数据库不存在时返回 None
+        """
+        date_str = self.get_date_folder_name(date)
+        db_path = self.project_root / "output" / db_type / f"{date_str}.db"
+        signature = get_db_signature(db_path)
+        if signature is None:
+            cold_path = find_cold_file(db_path)
+            if cold_path is not None:
+                signature = get_db_signature(cold_path)
+        return signature
+
+    def _get_storage_config(self) -> Dict:
+        """获取 config.yaml 中的 storage 配置（读取失败时返回空字典）"""
+        if self._storage_config is None:
+            try:
+                config = self.parse_yaml_config() or {}
+                self._storage_config = config.get("storage") or {}
+            except FileParseError:
+                self._storage_config = {}
+        return self._storage_config
+
+    def _get_sqlite_profile(self) -> Dict:
+        """获取 SQLite 连接参数（来自 storage.sqlite，未配置时使用默认值）"""
+        return self._get_storage_config().get("sqlite") or {}
+
+    def _get_archive(self) -> Optional[ArchiveStore]:
+        """获取多日汇总归档（未启用时返回 None）"""
+        if self._archive is None:
+            if self._get_storage_config().get("archive", {}).get("enabled", False):
+                self._archive = ArchiveStore(
+                    str(self.project_root / "output"),
+                    self._get_sqlite_profile(),
+                )
+            else:
+                self._archive = False
+        return self._archive or None
+
     def _read_from_sqlite(
         self,
         date: datetime = None,
@@ -101,8 +171,8 @@ class ParserService:
         all_timestamps = {}
 
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
+            # 只读连接：不会与爬虫写入争抢写锁，也不会意外修改数据
+            conn = connect_sqlite(db_path, self._get_sqlite_profile(), read_only=True)
             cursor = conn.cursor()
 
             if db_type == "news":
@@ -126,12 +196,8 @@ class ParserService:
         all_timestamps: Dict
     ) -> Optional[Tuple[Dict, Dict, Dict]]:
         """从热榜数据库读取数据"""
-        # 检查表是否存在
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='news_items'
-        """)
-        if not cursor.fetchone():
+        # 检查表是否存在（已版本化的数据库无需查询 sqlite_master）
+        if not has_table(cursor, "news_items"):
             return None
 
         # 构建查询
@@ -140,44 +206,37 @@ class ParserService:
             query = f"""
                 SELECT n.id, n.platform_id, p.name as platform_name, n.title,
                        n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                       {rank_history_column()} AS ranks
                 FROM news_items n
                 LEFT JOIN platforms p ON n.platform_id = p.id
                 WHERE n.platform_id IN ({placeholders})
             """
             cursor.execute(query, platform_ids)
         else:
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT n.id, n.platform_id, p.name as platform_name, n.title,
                        n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                       {rank_history_column()} AS ranks
                 FROM news_items n
                 LEFT JOIN platforms p ON n.platform_id = p.id
             """)
 
         rows = cursor.fetchall()
 
-        # 收集所有 news_item_id 用于查询历史排名
-        news_ids = [row['id'] for row in rows]
-        rank_history_map = {}
+        self._fill_news_titles(rows, all_titles, id_to_name)
+        self._fill_crawl_timestamps(cursor, "crawl_records", all_timestamps)
 
-        if news_ids:
-            placeholders = ",".join("?" * len(news_ids))
-            cursor.execute(f"""
-                SELECT news_item_id, rank FROM rank_history
-                WHERE news_item_id IN ({placeholders})
-                ORDER BY news_item_id, crawl_time
-            """, news_ids)
-
-            for rh_row in cursor.fetchall():
-                news_id = rh_row['news_item_id']
-                rank = rh_row['rank']
-                if news_id not in rank_history_map:
-                    rank_history_map[news_id] = []
-                rank_history_map[news_id].append(rank)
+        if not all_titles:
+            return None
 
+        return (all_titles, id_to_name, all_timestamps)
+
+    @staticmethod
+    def _fill_news_titles(rows: List, all_titles: Dict, id_to_name: Dict) -> None:
+        """将 news_items 查询结果（含聚合的排名历史）填充为 {platform_id: {title: info}} 结构"""
         for row in rows:
-            news_id = row['id']
             platform_id = row['platform_id']
             platform_name = row['platform_name'] or platform_id
             title = row['title']
@@ -188,20 +247,25 @@ class ParserService:
             if platform_id not in all_titles:
                 all_titles[platform_id] = {}
 
-            ranks = rank_history_map.get(news_id, [row['rank']])
+            all_titles[platform_id][title] = ParserService._news_row_info(row)
 
-            all_titles[platform_id][title] = {
-                "ranks": ranks,
-                "url": row['url'] or "",
-                "mobileUrl": row['mobile_url'] or "",
-                "first_time": row['first_crawl_time'] or "",
-                "last_time": row['last_crawl_time'] or "",
-                "count": row['crawl_count'] or 1,
-            }
+    @staticmethod
+    def _news_row_info(row) -> Dict:
+        """将一行 news_items 查询结果转换为标题信息字典"""
+        return {
+            "ranks": parse_ranks(row['ranks'], row['rank']),
+            "url": row['url'] or "",
+            "mobileUrl": row['mobile_url'] or "",
+            "first_time": row['first_crawl_time'] or "",
+            "last_time": row['last_crawl_time'] or "",
+            "count": row['crawl_count'] or 1,
+        }
 
-        # 获取抓取时间作为 timestamps
-        cursor.execute("""
-            SELECT crawl_time, created_at FROM crawl_records
+    @staticmethod
+    def _fill_crawl_timestamps(cursor, table: str, all_timestamps: Dict) -> None:
+        """读取抓取记录作为 timestamps（{crawl_time}.db -> timestamp）"""
+        cursor.execute(f"""
+            SELECT crawl_time, created_at FROM {table}
             ORDER BY crawl_time
         """)
         for row in cursor.fetchall():
@@ -213,11 +277,6 @@ class ParserService:
                 ts = datetime.now().timestamp()
             all_timestamps[f"{crawl_time}.db"] = ts
 
-        if not all_titles:
-            return None
-
-        return (all_titles, id_to_name, all_timestamps)
-
     def _read_rss_from_sqlite(
         self,
         cursor,
@@ -227,12 +286,8 @@ class ParserService:
         all_timestamps: Dict
     ) -> Optional[Tuple[Dict, Dict, Dict]]:
         """从 RSS 数据库读取数据"""
-        # 检查表是否存在
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='rss_items'
-        """)
-        if not cursor.fetchone():
+        # 检查表是否存在（已版本化的数据库无需查询 sqlite_master）
+        if not has_table(cursor, "rss_items"):
             return None
 
         # 构建查询
@@ -260,6 +315,17 @@ class ParserService:
 
         rows = cursor.fetchall()
 
+        self._fill_rss_items(rows, all_items, id_to_name)
+        self._fill_crawl_timestamps(cursor, "rss_crawl_records", all_timestamps)
+
+        if not all_items:
+            return None
+
+        return (all_items, id_to_name, all_timestamps)
+
+    @staticmethod
+    def _fill_rss_items(rows: List, all_items: Dict, id_to_name: Dict) -> None:
+        """将 rss_items 查询结果填充为 {feed_id: {title: info}} 结构"""
         for row in rows:
             feed_id = row['feed_id']
             feed_name = row['feed_name'] or feed_id
@@ -271,34 +337,26 @@ class ParserService:
             if feed_id not in all_items:
                 all_items[feed_id] = {}
 
-            all_items[feed_id][title] = {
-                "url": row['url'] or "",
-                "published_at": row['published_at'] or "",
-                "summary": row['summary'] or "",
-                "author": row['author'] or "",
-                "first_time": row['first_crawl_time'] or "",
-                "last_time": row['last_crawl_time'] or "",
-                "count": row['crawl_count'] or 1,
-            }
-
-        # 获取抓取时间
-        cursor.execute("""
-            SELECT crawl_time, created_at FROM rss_crawl_records
-            ORDER BY crawl_time
-        """)
-        for row in cursor.fetchall():
-            crawl_time = row['crawl_time']
-            created_at = row['created_at']
-            try:
-                ts = datetime.strptime(created_at, "%Y-%m-%d %H:%M:%S").timestamp()
-            except (ValueError, TypeError):
-                ts = datetime.now().timestamp()
-            all_timestamps[f"{crawl_time}.db"] = ts
+            all_items[feed_id][title] = ParserService._rss_row_info(row)
 
-        if not all_items:
-            return None
+    @staticmethod
+    def _rss_row_info(row) -> Dict:
+        """将一行 rss_items 查询结果转换为条目信息字典"""
+        return {
+            "url": row['url'] or "",
+            "published_at": row['published_at'] or "",
+            "summary": row['summary'] or "",
+            "author": row['author'] or "",
+            "first_time": row['first_crawl_time'] or "",
+            "last_time": row['last_crawl_time'] or "",
+            "count": row['crawl_count'] or 1,
+        }
 
-        return (all_items, id_to_name, all_timestamps)
+    @staticmethod
+    def _read_all_cache_key(date_str: str, platform_ids: Optional[List[str]], db_type: str) -> str:
+        """生成单日数据的缓存键"""
+        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
+        return f"read_all:{db_type}:{date_str}:{platform_key}"
 
     def read_all_titles_for_date(
         self,
@@ -321,19 +379,19 @@ class ParserService:
             DataNotFoundError: 数据不存在
         """
         date_str = self.get_date_folder_name(date)
-        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
-        cache_key = f"read_all:{db_type}:{date_str}:{platform_key}"
+        cache_key = self._read_all_cache_key(date_str, platform_ids, db_type)
 
-        is_today = (date is None) or (date.date() == datetime.now().date())
-        ttl = 900 if is_today else 3600
+        # 缓存按数据版本失效：数据库未更新前一直有效，有新的抓取写入后重新读取
+        version = self.get_data_version(date, db_type)
 
-        cached = self.cache.get(cache_key, ttl=ttl)
-        if cached:
-            return cached
-
-        result = self._read_from_sqlite(date, platform_ids, db_type)
+        # 并发未命中同一日期时只读取一次 SQLite
+        result = self.cache.get_or_load(
+            cache_key,
+            lambda: self._read_from_sqlite(date, platform_ids, db_type),
+            ttl=NO_EXPIRY,
+            version=version,
+        )
         if result:
-            self.cache.set(cache_key, result)
             return result
 
         raise DataNotFoundError(
@@ -341,6 +399,300 @@ class ParserService:
             suggestion="请先运行爬虫或检查日期是否正确"
         )
 
+    def prefetch_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None,
+        db_type: str = "news"
+    ) -> int:
+        """
+        预加载日期范围内的数据到缓存
+
+        启用汇总归档时，整个范围通过一次查询读出，
+        之后对范围内各日期调用 read_all_titles_for_date 将直接命中缓存。
+        未启用归档、单日范围或读取失败时不做处理，逐日读取照常进行。
+
+        Args:
+            start_date: 开始日期（含）
+            end_date: 结束日期（含）
+            platform_ids: 平台/Feed ID列表，None表示所有
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            已预加载的日期数量
+        """
+        archive = self._get_archive()
+        # 单日查询直接读取当日文件即可
+        if archive is None or start_date.date() >= end_date.date():
+            return 0
+
+        start_str = self.get_date_folder_name(start_date)
+        end_str = self.get_date_folder_name(end_date)
+
+        # 先取版本再查询：查询期间若有新写入，下次读取会因版本变化而重新加载
+        versions = {}
+        current = start_date
+        while current.date() <= end_date.date():
+            versions[self.get_date_folder_name(current)] = self.get_data_version(current, db_type)
+            current += timedelta(days=1)
+
+        try:
+            if db_type == "rss":
+                result = archive.query_rss_range(start_str, end_str, platform_ids)
+            else:
+                result = archive.query_news_range(start_str, end_str, platform_ids)
+        except Exception as e:
+            print(f"Warning: 从汇总归档读取数据失败: {e}")
+            return 0
+
+        for date_str, data in result.items():
+            self.cache.set(
+                self._read_all_cache_key(date_str, platform_ids, db_type),
+                data,
+                ttl=NO_EXPIRY,
+                version=versions.get(date_str),
+            )
+
+        return len(result)
+
+    def iter_titles(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None,
+        keyword: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        db_type: str = "news"
+    ) -> Iterator[Tuple[str, str, str, str, Dict]]:
+        """
+        流式读取日期范围内的条目
+
+        逐日打开只读连接，平台、时间段、关键词过滤在 SQL 中完成，结果逐行产出、不经过缓存，
+        内存占用与日期跨度无关，适合 30～365 天的范围统计。
+        同一天内同一平台的同名标题只产出第一条（与 read_all_titles_for_date 按标题去重一致）。
+
+        Args:
+            start_date: 开始日期（含）
+            end_date: 结束日期（含）
+            platform_ids: 平台/Feed ID列表，None表示所有
+            keyword: 关键词（子串匹配，ASCII 字母不区分大小写；RSS 同时匹配摘要）
+            start_time: 开始抓取时间（HH-MM，含），条目在时间段内出现过即返回
+            end_time: 结束抓取时间（HH-MM，含）
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Yields:
+            (date_str, source_id, source_name, title, info) 元组，
+            info 结构与 read_all_titles_for_date 中的条目一致；没有数据的日期直接跳过
+        """
+        current = start_date
+        while current.date() <= end_date.date():
+            db_path = self._get_db_path(current, db_type)
+            if db_path is not None:
+                yield from self._iter_titles_from_sqlite(
+                    db_path, self.get_date_folder_name(current),
+                    platform_ids, keyword, start_time, end_time, db_type,
+                )
+            current += timedelta(days=1)
+
+    def _iter_titles_from_sqlite(
+        self,
+        db_path: Path,
+        date_str: str,
+        platform_ids: Optional[List[str]],
+        keyword: Optional[str],
+        start_time: Optional[str],
+        end_time: Optional[str],
+        db_type: str
+    ) -> Iterator[Tuple[str, str, str, str, Dict]]:
+        """从单日数据库逐行读取符合条件的条目"""
+        if db_type == "rss":
+            table, source_column, name_table, keyword_columns = "rss_items", "feed_id", "rss_feeds", ("title", "summary")
+            columns = "i.url, i.published_at, i.summary, i.author"
+            row_info = self._rss_row_info
+        else:
+            table, source_column, name_table, keyword_columns = "news_items", "platform_id", "platforms", ("title",)
+            columns = f"i.rank, i.url, i.mobile_url, {rank_history_column('i')} AS ranks"
+            row_info = self._news_row_info
+
+        where, params = build_item_filter(
+            "i", source_column, platform_ids, start_time, end_time, keyword, keyword_columns
+        )
+
+        conn = None
+        try:
+            conn = connect_sqlite(db_path, self._get_sqlite_profile(), read_only=True)
+            if not has_table(conn, table):
+                return
+            cursor = conn.execute(f"""
+                SELECT i.{source_column} AS source_id, s.name AS source_name, i.title,
+                       {columns},
+                       i.first_crawl_time, i.last_crawl_time, i.crawl_count
+                FROM {table} i
+                LEFT JOIN {name_table} s ON i.{source_column} = s.id
+                {where}
+            """, params)
+
+            seen = set()
+            for row in cursor:
+                source_id = row['source_id']
+                title = row['title']
+                if (source_id, title) in seen:
+                    continue
+                seen.add((source_id, title))
+                yield (date_str, source_id, row['source_name'] or source_id, title, row_info(row))
+        except sqlite3.Error as e:
+            print(f"Warning: 流式读取 {date_str} 的 {db_type} 数据失败: {e}")
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def search_titles_for_date(
+        self,
+        keyword: str,
+        date: datetime = None,
+        platform_ids: Optional[List[str]] = None,
+        db_type: str = "news"
+    ) -> Tuple[Dict, Dict, Dict]:
+        """
+        搜索指定日期中包含关键词的条目
+
+        优先使用 FTS5 全文索引（按 bm25 相关度排序，RSS 同时匹配标题和摘要）；
+        数据库不支持全文索引时回退为读取全部数据后逐条匹配。
+
+        Args:
+            keyword: 搜索关键词（子串匹配，不区分大小写）
+            date: 日期对象，默认为今天
+            platform_ids: 平台/Feed ID列表，None表示所有
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组，结构与 read_all_titles_for_date 一致，
+            只包含匹配的条目
+
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
+        db_path = self._get_db_path(date, db_type)
+        if db_path is None:
+            raise DataNotFoundError(
+                f"未找到 {self.get_date_folder_name(date)} 的 {db_type} 数据",
+                suggestion="请先运行爬虫或检查日期是否正确"
+            )
+
+        result = self._search_from_fts(db_path, keyword, platform_ids, db_type)
+        if result is not None:
+            return result
+
+        # 回退：读取全部数据后逐条匹配
+        all_titles, id_to_name, all_timestamps = self.read_all_titles_for_date(date, platform_ids, db_type)
+        keyword_lower = keyword.lower()
+        matched = {}
+        for source_id, titles in all_titles.items():
+            for title, info in titles.items():
+                if keyword_lower in title.lower() or keyword_lower in info.get("summary", "").lower():
+                    matched.setdefault(source_id, {})[title] = info
+        return (matched, id_to_name, all_timestamps)
+
+    def _search_from_fts(
+        self,
+        db_path: Path,
+        keyword: str,
+        platform_ids: Optional[List[str]],
+        db_type: str
+    ) -> Optional[Tuple[Dict, Dict, Dict]]:
+        """
+        使用全文索引查询匹配条目
+
+        trigram 分词至少需要 3 个字符，更短的关键词改用 LIKE 匹配。
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组，数据库没有全文索引时返回 None
+        """
+        all_titles = {}
+        id_to_name = {}
+        all_timestamps = {}
+
+        try:
+            conn = connect_sqlite(db_path, self._get_sqlite_profile(), read_only=True)
+        except sqlite3.Error as e:
+            print(f"Warning: 打开数据库失败: {e}")
+            return None
+
+        try:
+            cursor = conn.cursor()
+            # 版本 2 起包含全文索引
+            if get_schema_version(conn) < 2:
+                return None
+
+            if db_type == "rss":
+                fts_table, item_alias, owner_column = "rss_items_fts", "i", "feed_id"
+                select = """
+                    SELECT i.id, i.feed_id, f.name as feed_name, i.title,
+                           i.url, i.published_at, i.summary, i.author,
+                           i.first_crawl_time, i.last_crawl_time, i.crawl_count
+                """
+                joins = "LEFT JOIN rss_feeds f ON i.feed_id = f.id"
+                like_columns = ["i.title", "i.summary"]
+                base_table = "rss_items i"
+            else:
+                fts_table, item_alias, owner_column = "news_items_fts", "n", "platform_id"
+                select = f"""
+                    SELECT n.id, n.platform_id, p.name as platform_name, n.title,
+                           n.rank, n.url, n.mobile_url,
+                           n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                           {rank_history_column()} AS ranks
+                """
+                joins = "LEFT JOIN platforms p ON n.platform_id = p.id"
+                like_columns = ["n.title"]
+                base_table = "news_items n"
+
+            if len(keyword) >= 3:
+                # 整体作为短语匹配，等价于子串搜索
+                phrase = '"' + keyword.replace('"', '""') + '"'
+                query = f"""
+                    {select}
+                    FROM {fts_table}
+                    JOIN {base_table} ON {item_alias}.id = {fts_table}.rowid
+                    {joins}
+                    WHERE {fts_table} MATCH ?
+                """
+                params = [phrase]
+                order_by = f"ORDER BY {fts_table}.rank"
+            else:
+                pattern = "%" + re.sub(r"([\\%_])", r"\\\1", keyword) + "%"
+                like_clause = " OR ".join(f"{col} LIKE ? ESCAPE '\\'" for col in like_columns)
+                query = f"""
+                    {select}
+                    FROM {base_table}
+                    {joins}
+                    WHERE ({like_clause})
+                """
+                params = [pattern] * len(like_columns)
+                order_by = f"ORDER BY {item_alias}.id"
+
+            if platform_ids:
+                query += f" AND {item_alias}.{owner_column} IN ({','.join('?' * len(platform_ids))})"
+                params.extend(platform_ids)
+            cursor.execute(f"{query} {order_by}", params)
+            rows = cursor.fetchall()
+
+            if db_type == "rss":
+                self._fill_rss_items(rows, all_titles, id_to_name)
+                self._fill_crawl_timestamps(cursor, "rss_crawl_records", all_timestamps)
+            else:
+                self._fill_news_titles(rows, all_titles, id_to_name)
+                self._fill_crawl_timestamps(cursor, "crawl_records", all_timestamps)
+
+            return (all_titles, id_to_name, all_timestamps)
+
+        except sqlite3.OperationalError:
+            # 全文索引不存在（SQLite 不支持 FTS5 时创建会被跳过）
+            return None
+        finally:
+            conn.close()
+
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
         解析YAML配置文件
@@ -418,11 +770,12 @@ class ParserService:
         if not db_dir.exists():
             return []
 
-        dates = []
-        for db_file in db_dir.glob("*.db"):
-            date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.db$', db_file.name)
-            if date_match:
-                dates.append(date_match.group(1))
+        dates = set()
+        for pattern in ("*.db",) + tuple(f"*{suffix}" for suffix in COLD_SUFFIXES):
+            for db_file in db_dir.glob(pattern):
+                date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.db', db_file.name)
+                if date_match:
+                    dates.add(date_match.group(1))
 
         return sorted(dates, reverse=True)
 
@@ -306,38 +306,28 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # 收集趋势数据
+            # 流式读取包含话题的标题（关键词过滤在 SQL 中完成），只保留每日计数和样本
+            daily_counts: Dict[str, int] = {}
+            daily_samples: Dict[str, List[str]] = {}
+            for date_str, _, _, title, _ in self.data_service.parser.iter_titles(
+                start_date, end_date, keyword=topic
+            ):
+                daily_counts[date_str] = daily_counts.get(date_str, 0) + 1
+                samples = daily_samples.setdefault(date_str, [])
+                if len(samples) < 3:  # 只保留前3个样本
+                    samples.append(title)
+
+            # 收集趋势数据（没有数据的日期计为 0）
             trend_data = []
             current_date = start_date
 
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该时间点的话题出现次数
-                    count = 0
-                    matched_titles = []
-
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-                                matched_titles.append(title)
-
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count,
-                        "sample_titles": matched_titles[:3]  # 只保留前3个样本
-                    })
-
-                except DataNotFoundError:
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0,
-                        "sample_titles": []
-                    })
+                date_str = current_date.strftime("%Y-%m-%d")
+                trend_data.append({
+                    "date": date_str,
+                    "count": daily_counts.get(date_str, 0),
+                    "sample_titles": daily_samples.get(date_str, [])
+                })
 
                 # 按天增加时间
                 current_date += timedelta(days=1)
@@ -449,6 +439,7 @@ class AnalyticsTools:
             })
 
             # 遍历日期范围
+            self.data_service.parser.prefetch_date_range(start_date, end_date)
             current_date = start_date
             while current_date <= end_date:
                 try:
@@ -693,6 +684,7 @@ class AnalyticsTools:
 
             # 收集新闻数据（支持多天）
             all_news_items = []
+            self.data_service.parser.prefetch_date_range(start_date, end_date, platform_ids=platforms)
             current_date = start_date
 
             while current_date <= end_date:
@@ -1201,6 +1193,7 @@ class AnalyticsTools:
             all_platforms_news = defaultdict(int)
             all_titles_list = []
 
+            self.data_service.parser.prefetch_date_range(start_date, end_date)
             current_date = start_date
             while current_date <= end_date:
                 try:
@@ -1374,6 +1367,7 @@ class AnalyticsTools:
             })
 
             # 遍历日期范围
+            self.data_service.parser.prefetch_date_range(start_date, end_date)
             current_date = start_date
             while current_date <= end_date:
                 try:
@@ -1501,32 +1495,22 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # 收集话题历史数据
+            # 流式统计每日话题出现次数（关键词过滤在 SQL 中完成）
+            daily_counts: Dict[str, int] = {}
+            for date_str, _, _, _, _ in self.data_service.parser.iter_titles(
+                start_date, end_date, keyword=topic
+            ):
+                daily_counts[date_str] = daily_counts.get(date_str, 0) + 1
+
+            # 收集话题历史数据（没有数据的日期计为 0）
             lifecycle_data = []
             current_date = start_date
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该日的话题出现次数
-                    count = 0
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count
-                    })
-
-                except DataNotFoundError:
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0
-                    })
+                date_str = current_date.strftime("%Y-%m-%d")
+                lifecycle_data.append({
+                    "date": date_str,
+                    "count": daily_counts.get(date_str, 0)
+                })
 
                 current_date += timedelta(days=1)
 
@@ -2032,6 +2016,7 @@ class AnalyticsTools:
 
             # 收集所有新闻
             all_news = []
+            self.data_service.parser.prefetch_date_range(start_date, end_date, platform_ids=platforms)
             current_date = start_date
 
             while current_date <= end_date:
@@ -2356,6 +2341,7 @@ class AnalyticsTools:
         all_keywords = Counter()
         platform_stats = Counter()
 
+        self.data_service.parser.prefetch_date_range(start_date, end_date, platform_ids=platforms)
         current_date = start_date
         while current_date <= end_date:
             try:
@@ -127,14 +127,24 @@ class SearchTools:
 
             # 收集所有匹配的新闻
             all_matches = []
+            if search_mode != "keyword":
+                self.data_service.parser.prefetch_date_range(start_date, end_date, platform_ids=platforms)
             current_date = start_date
 
             while current_date <= end_date:
                 try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
+                    if search_mode == "keyword":
+                        # 关键词模式使用全文索引，只读取匹配的条目
+                        all_titles, id_to_name, timestamps = self.data_service.parser.search_titles_for_date(
+                            query,
+                            date=current_date,
+                            platform_ids=platforms
+                        )
+                    else:
+                        all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
+                            date=current_date,
+                            platform_ids=platforms
+                        )
 
                     # 根据搜索模式执行不同的搜索逻辑
                     if search_mode == "keyword":
@@ -619,6 +629,7 @@ class SearchTools:
 
             # 收集所有相关新闻
             all_related_news = []
+            self.data_service.parser.prefetch_date_range(search_start, search_end)
             current_date = search_start
 
             while current_date <= search_end:
@@ -929,8 +940,9 @@ class SearchTools:
 
         while current_date <= end_date:
             try:
-                # 读取该日期的 RSS 数据
-                all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
+                # 使用全文索引读取该日期标题或摘要匹配的 RSS 条目
+                all_titles, id_to_name, _ = self.data_service.parser.search_titles_for_date(
+                    query,
                     date=current_date,
                     platform_ids=None,
                     db_type="rss"
@@ -13,6 +13,8 @@ from typing import Dict, List, Optional
 
 import yaml
 
+from trendradar.storage.cold import is_cold_file
+
 from ..utils.errors import MCPError
 
 
@@ -64,6 +66,7 @@ class StorageSyncTools:
             "access_key_id": remote_config.get("access_key_id") or os.environ.get("S3_ACCESS_KEY_ID", ""),
             "secret_access_key": remote_config.get("secret_access_key") or os.environ.get("S3_SECRET_ACCESS_KEY", ""),
             "region": remote_config.get("region") or os.environ.get("S3_REGION", ""),
+            "compact_segments": remote_config.get("compact_segments", 12),
         }
 
     def _has_remote_config(self) -> bool:
@@ -98,6 +101,8 @@ class StorageSyncTools:
                 endpoint_url=remote_config["endpoint_url"],
                 region=remote_config.get("region", ""),
                 timezone=timezone,
+                sqlite_profile=config.get("storage", {}).get("sqlite"),
+                compact_segments=remote_config.get("compact_segments", 12),
             )
             return self._remote_backend
         except ImportError:
@@ -156,13 +161,24 @@ class StorageSyncTools:
         if not local_dir.exists():
             return dates
 
+        # 当前结构：{data_dir}/news/{date}.db（冷存储为 {date}.db.zst 等）
+        news_dir = local_dir / "news"
+        if news_dir.exists():
+            for db_file in news_dir.iterdir():
+                if not (db_file.name.endswith(".db") or is_cold_file(db_file.name)):
+                    continue
+                file_date = self._parse_date_folder_name(db_file.name)
+                if file_date:
+                    dates.append(file_date.strftime("%Y-%m-%d"))
+
+        # 旧结构：{data_dir}/{date}/
         for item in local_dir.iterdir():
             if item.is_dir() and not item.name.startswith('.'):
                 folder_date = self._parse_date_folder_name(item.name)
                 if folder_date:
                     dates.append(folder_date.strftime("%Y-%m-%d"))
 
-        return sorted(dates, reverse=True)
+        return sorted(set(dates), reverse=True)
 
     def _calculate_dir_size(self, path: Path) -> int:
         """计算目录大小（字节）"""
@@ -211,11 +227,8 @@ class StorageSyncTools:
             local_dir = self._get_local_data_dir()
             local_dir.mkdir(parents=True, exist_ok=True)
 
-            # 获取远程可用日期
-            remote_dates = remote_backend.list_remote_dates()
-
-            # 获取本地已有日期
-            local_dates = set(self._get_local_dates())
+            # 一次列举远程对象（各日期的基础库 ETag 和增量分段）
+            remote_days = remote_backend.scan_remote_days("news")
 
             # 计算需要拉取的日期（最近 N 天）
             from trendradar.utils.time import get_configured_time
@@ -227,37 +240,28 @@ class StorageSyncTools:
             for i in range(days):
                 date = now - timedelta(days=i)
                 date_str = date.strftime("%Y-%m-%d")
-                if date_str in remote_dates:
+                if date_str in remote_days:
                     target_dates.append(date_str)
 
-            # 执行拉取
+            # 并发拉取（本地已是最新或为本地抓取数据的日期会跳过）
+            results = remote_backend.pull_dates(target_dates, str(local_dir), "news", remote_days)
+
             synced_dates = []
             skipped_dates = []
             failed_dates = []
 
             for date_str in target_dates:
-                # 检查本地是否已存在
-                if date_str in local_dates:
-                    skipped_dates.append(date_str)
-                    continue
-
-                # 拉取单个日期
-                try:
-                    local_date_dir = local_dir / date_str
-                    local_db_path = local_date_dir / "news.db"
-                    remote_key = f"news/{date_str}.db"
-
-                    local_date_dir.mkdir(parents=True, exist_ok=True)
-                    remote_backend.s3_client.download_file(
-                        remote_backend.bucket_name,
-                        remote_key,
-                        str(local_db_path)
-                    )
+                status = results.get(date_str)
+                if isinstance(status, Exception):
+                    failed_dates.append({"date": date_str, "error": str(status)})
+                    print(f"[存储同步] 拉取失败 ({date_str}): {status}")
+                elif status in ("downloaded", "updated"):
                     synced_dates.append(date_str)
                     print(f"[存储同步] 已拉取: {date_str}")
-                except Exception as e:
-                    failed_dates.append({"date": date_str, "error": str(e)})
-                    print(f"[存储同步] 拉取失败 ({date_str}): {e}")
+                elif status is None:
+                    failed_dates.append({"date": date_str, "error": "远程数据不存在"})
+                else:
+                    skipped_dates.append(date_str)
 
             return {
                 "success": True,
@@ -266,7 +270,7 @@ class StorageSyncTools:
                 "skipped_dates": skipped_dates,
                 "failed_dates": failed_dates,
                 "message": f"成功同步 {len(synced_dates)} 天数据" + (
-                    f"，跳过 {len(skipped_dates)} 天（本地已存在）" if skipped_dates else ""
+                    f"，跳过 {len(skipped_dates)} 天（本地已是最新）" if skipped_dates else ""
                 ) + (
                     f"，失败 {len(failed_dates)} 天" if failed_dates else ""
                 )
@@ -152,7 +152,10 @@ class SystemManagementTools:
             # 执行爬取
             results, id_to_name, failed_ids = fetcher.crawl_websites(
                 ids_list=ids,
-                request_interval=request_interval
+                request_interval=request_interval,
+                max_workers=crawler_config.get("max_workers", 1),
+                per_host_concurrency=crawler_config.get("per_host_concurrency", 4),
+                per_host_rate=crawler_config.get("per_host_rate", 0),
             )
 
             # 获取当前时间（统一使用 trendradar 的时间工具）
@@ -176,7 +179,8 @@ class SystemManagementTools:
                 data_dir=str(self.project_root / "output"),
                 enable_txt=True,
                 enable_html=True,
-                timezone=timezone
+                timezone=timezone,
+                sqlite_profile=config_data.get("storage", {}).get("sqlite"),
             )
 
             # 尝试持久化数据
@@ -599,11 +599,19 @@ class NewsAnalyzer:
         print(
             f"配置的监控平台: {[p.get('name', p['id']) for p in self.ctx.platforms]}"
         )
-        print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
+        max_workers = self.ctx.config.get("MAX_WORKERS", 1)
+        if max_workers > 1:
+            print(f"开始并发爬取数据，线程数 {max_workers}")
+        else:
+            print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
         Path("output").mkdir(parents=True, exist_ok=True)
 
         results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
-            ids, self.request_interval
+            ids,
+            self.request_interval,
+            max_workers=max_workers,
+            per_host_concurrency=self.ctx.config.get("PER_HOST_CONCURRENCY", 4),
+            per_host_rate=self.ctx.config.get("PER_HOST_RATE", 0),
         )
 
         # 转换为 NewsData 格式并保存到存储后端
@@ -693,6 +701,11 @@ class NewsAnalyzer:
             freshness_config = rss_config.get("FRESHNESS_FILTER", {})
             freshness_enabled = freshness_config.get("ENABLED", True)
             default_max_age_days = freshness_config.get("MAX_AGE_DAYS", 3)
+            # 条件请求缓存（与 RSS 数据库放在同一目录）
+            rss_cache_path = None
+            if rss_config.get("CONDITIONAL_GET", False):
+                data_dir = self.ctx.config["STORAGE"]["LOCAL"]["DATA_DIR"]
+                rss_cache_path = str(Path(data_dir) / "rss" / "feed_cache.json")
 
             fetcher = RSSFetcher(
                 feeds=feeds,
@@ -703,6 +716,10 @@ class NewsAnalyzer:
                 timezone=timezone,
                 freshness_enabled=freshness_enabled,
                 default_max_age_days=default_max_age_days,
+                max_workers=rss_config.get("MAX_WORKERS", 1),
+                per_domain_concurrency=rss_config.get("PER_DOMAIN_CONCURRENCY", 2),
+                per_domain_rate=rss_config.get("PER_DOMAIN_RATE", 0),
+                cache_path=rss_cache_path,
             )
 
             # 抓取数据
@@ -37,8 +37,10 @@ from trendradar.notification import (
     split_content_into_batches,
     NotificationDispatcher,
     PushRecordManager,
+    close_smtp_pool,
 )
 from trendradar.storage import get_storage_manager
+from trendradar.utils.http_client import configure_http, close_sessions
 
 
 class AppContext:
@@ -73,6 +75,16 @@ class AppContext:
         self.config = config
         self._storage_manager = None
 
+        # 爬虫与通知渠道共用的连接池
+        http_config = config.get("HTTP", {})
+        if http_config:
+            configure_http(
+                pool_connections=http_config.get("POOL_CONNECTIONS", 16),
+                pool_maxsize=http_config.get("POOL_MAXSIZE", 16),
+                max_retries=http_config.get("MAX_RETRIES", 2),
+                backoff_factor=http_config.get("BACKOFF_FACTOR", 0.5),
+            )
+
     # === 配置访问 ===
 
     @property
@@ -152,6 +164,8 @@ class AppContext:
             remote_config = storage_config.get("REMOTE", {})
             local_config = storage_config.get("LOCAL", {})
             pull_config = storage_config.get("PULL", {})
+            sqlite_config = storage_config.get("SQLITE", {})
+            postgres_config = storage_config.get("POSTGRES", {})
 
             self._storage_manager = get_storage_manager(
                 backend_type=storage_config.get("BACKEND", "auto"),
@@ -164,12 +178,22 @@ class AppContext:
                     "secret_access_key": remote_config.get("SECRET_ACCESS_KEY", ""),
                     "endpoint_url": remote_config.get("ENDPOINT_URL", ""),
                     "region": remote_config.get("REGION", ""),
+                    "compact_segments": remote_config.get("COMPACT_SEGMENTS", 12),
                 },
                 local_retention_days=local_config.get("RETENTION_DAYS", 0),
                 remote_retention_days=remote_config.get("RETENTION_DAYS", 0),
                 pull_enabled=pull_config.get("ENABLED", False),
                 pull_days=pull_config.get("DAYS", 7),
                 timezone=self.timezone,
+                sqlite_profile={key.lower(): value for key, value in sqlite_config.items()},
+                archive_enabled=storage_config.get("ARCHIVE", {}).get("ENABLED", False),
+                cold_after_days=storage_config.get("COLD", {}).get("AFTER_DAYS", 0),
+                cold_codec=storage_config.get("COLD", {}).get("CODEC", "zstd"),
+                postgres_config={
+                    "url": postgres_config.get("URL", ""),
+                    "pool_size": postgres_config.get("POOL_SIZE", 5),
+                    "max_overflow": postgres_config.get("MAX_OVERFLOW", 10),
+                },
             )
         return self._storage_manager
 
@@ -434,3 +458,5 @@ class AppContext:
             self._storage_manager.cleanup_old_data()
             self._storage_manager.cleanup()
             self._storage_manager = None
+        close_sessions()
+        close_smtp_pool()
@@ -10,7 +10,12 @@ from trendradar.core.config import (
     get_account_at_index,
 )
 from trendradar.core.loader import load_config
-from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.core.frequency import (
+    load_frequency_words,
+    matches_word_groups,
+    compile_word_matcher,
+    WordGroupMatcher,
+)
 from trendradar.core.data import (
     save_titles_to_file,
     read_all_today_titles_from_storage,
@@ -34,6 +39,8 @@ __all__ = [
     "load_config",
     "load_frequency_words",
     "matches_word_groups",
+    "compile_word_matcher",
+    "WordGroupMatcher",
     # 数据处理
     "save_titles_to_file",
     "read_all_today_titles_from_storage",
@@ -95,7 +95,8 @@ def read_all_today_titles_from_storage(
         current_platform_ids: 当前监控的平台 ID 列表（用于过滤）
 
     Returns:
-        Tuple[Dict, Dict, Dict]: (all_results, id_to_name, title_info)
+        Tuple[Dict, Dict, Dict]: (all_results, id_to_name, title_info)，
+        两者中同一标题的条目为同一个字典
     """
     try:
         news_data = storage_manager.get_today_all_data()
@@ -127,13 +128,8 @@ def read_all_today_titles_from_storage(
                 last_time = getattr(item, 'last_time', item.crawl_time)
                 count = getattr(item, 'count', 1)
 
-                all_results[source_id][title] = {
-                    "ranks": ranks,
-                    "url": item.url or "",
-                    "mobileUrl": item.mobile_url or "",
-                }
-
-                title_info[source_id][title] = {
+                # all_results 与 title_info 共享同一个字典，每个标题只创建一份
+                info = {
                     "first_time": first_time,
                     "last_time": last_time,
                     "count": count,
@@ -141,6 +137,8 @@ def read_all_today_titles_from_storage(
                     "url": item.url or "",
                     "mobileUrl": item.mobile_url or "",
                 }
+                all_results[source_id][title] = info
+                title_info[source_id][title] = info
 
         return all_results, final_id_to_name, title_info
 
@@ -14,8 +14,9 @@
 
 import os
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Dict, List, Tuple, Optional, Set, Union
 
 
 def _parse_word(word: str) -> Dict:
@@ -88,6 +89,319 @@ def _word_matches(word_config: Union[str, Dict], title_lower: str) -> bool:
         return word_config["word"].lower() in title_lower
 
 
+class _AhoCorasick:
+    """
+    纯 Python 实现的 Aho-Corasick 多模式子串匹配自动机
+
+    一次扫描文本即可找出所有出现过的模式串，复杂度与文本长度线性相关，
+    与模式数量无关。
+    """
+
+    __slots__ = ("_goto", "_fail", "_output", "_built")
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        self._built = False
+
+    def add(self, pattern: str, term_id: int) -> None:
+        """添加模式串（pattern 不能为空）"""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = self._output[state] + (term_id,)
+        self._built = False
+
+    def build(self) -> None:
+        """构建失败指针，并沿失败链合并输出"""
+        goto, fail, output = self._goto, self._fail, self._output
+        queue = list(goto[0].values())
+        for state in queue:
+            fail[state] = 0
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                candidate = goto[fallback].get(char, 0)
+                fail[next_state] = candidate if candidate != next_state else 0
+                if output[fail[next_state]]:
+                    output[next_state] = output[next_state] + output[fail[next_state]]
+        self._built = True
+
+    def find(self, text: str) -> Set[int]:
+        """返回文本中出现过的所有模式 ID"""
+        if not self._built:
+            self.build()
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+
+# 正则中的反向引用在合并为一个交替表达式后组号会错位，这类正则单独匹配
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class WordGroupMatcher:
+    """
+    编译后的频率词匹配器
+
+    将所有词组的普通词、必须词、过滤词以及全局过滤词统一编号：
+    - 普通子串词放入 Aho-Corasick 自动机，一次扫描得到全部命中词
+    - 正则词合并为一个交替表达式做预筛，未命中时跳过全部正则
+
+    匹配语义与 matches_word_groups 完全一致。
+    """
+
+    def __init__(
+        self,
+        word_groups: List[Dict],
+        filter_words: List,
+        global_filters: Optional[List[str]] = None,
+    ):
+        self._term_ids: Dict[Tuple[bool, str], int] = {}
+        self._automaton = _AhoCorasick()
+        self._always_terms: Set[int] = set()
+        self._regex_terms: List[Tuple[int, "re.Pattern"]] = []
+
+        self.group_count = len(word_groups)
+        self._global_ids: Set[int] = {
+            self._add_term(word) for word in (global_filters or [])
+        }
+        self._filter_ids: Set[int] = {self._add_term(word) for word in filter_words}
+
+        # 每个词组：(必须词 ID 集合, 普通词 ID 集合)
+        self._groups: List[Tuple[frozenset, frozenset]] = []
+        # 词 ID -> 包含该词的词组下标（用于只检查可能命中的词组）
+        self._term_groups: Dict[int, List[int]] = {}
+        # 没有任何词的词组（如“全部新闻”虚拟词组）对任何标题都成立
+        self._empty_groups: List[int] = []
+
+        for index, group in enumerate(word_groups):
+            required = frozenset(self._add_term(w) for w in group.get("required", []))
+            normal = frozenset(self._add_term(w) for w in group.get("normal", []))
+            self._groups.append((required, normal))
+            if not required and not normal:
+                self._empty_groups.append(index)
+            for term_id in required | normal:
+                groups = self._term_groups.setdefault(term_id, [])
+                if not groups or groups[-1] != index:
+                    groups.append(index)
+
+        self._automaton.build()
+        self._regex_prefilter = self._compile_prefilter()
+
+    def _add_term(self, word_config: Union[str, Dict]) -> int:
+        """注册一个词并返回其 ID，相同的词共享同一个 ID"""
+        if isinstance(word_config, str):
+            is_regex, pattern = False, None
+            text = word_config.lower()
+        elif word_config.get("is_regex") and word_config.get("pattern"):
+            is_regex, pattern = True, word_config["pattern"]
+            text = pattern.pattern
+        else:
+            is_regex, pattern = False, None
+            text = word_config["word"].lower()
+
+        key = (is_regex, text)
+        term_id = self._term_ids.get(key)
+        if term_id is not None:
+            return term_id
+
+        term_id = len(self._term_ids)
+        self._term_ids[key] = term_id
+        if is_regex:
+            self._regex_terms.append((term_id, pattern))
+        elif text:
+            self._automaton.add(text, term_id)
+        else:
+            # 空字符串是任何标题的子串
+            self._always_terms.add(term_id)
+        return term_id
+
+    def _compile_prefilter(self) -> Optional["re.Pattern"]:
+        """将可合并的正则编译为一个交替表达式，用于快速判断是否需要逐个匹配"""
+        combinable = [
+            pattern.pattern for _, pattern in self._regex_terms
+            if not _BACKREF_RE.search(pattern.pattern)
+        ]
+        # 存在无法合并的正则时预筛不成立，需要逐个匹配
+        if not combinable or len(combinable) != len(self._regex_terms):
+            return None
+        try:
+            return re.compile(
+                "|".join(f"(?:{p})" for p in combinable), re.IGNORECASE
+            )
+        except re.error:
+            return None
+
+    def _matched_terms(self, title_lower: str) -> Set[int]:
+        """一次扫描返回标题命中的全部词 ID"""
+        matched = self._automaton.find(title_lower)
+        if self._always_terms:
+            matched |= self._always_terms
+        if self._regex_terms:
+            prefilter = self._regex_prefilter
+            if prefilter is None or prefilter.search(title_lower):
+                for term_id, pattern in self._regex_terms:
+                    if term_id not in matched and pattern.search(title_lower):
+                        matched.add(term_id)
+        return matched
+
+    def _groups_from_terms(self, matched: Set[int], first_only: bool) -> List[int]:
+        """根据命中词计算成立的词组下标（升序）"""
+        candidates = set(self._empty_groups)
+        term_groups = self._term_groups
+        for term_id in matched:
+            groups = term_groups.get(term_id)
+            if groups:
+                candidates.update(groups)
+
+        result = []
+        for index in sorted(candidates):
+            required, normal = self._groups[index]
+            if required and not required <= matched:
+                continue
+            if normal and normal.isdisjoint(matched):
+                continue
+            result.append(index)
+            if first_only:
+                break
+        return result
+
+    def match_lower(self, title_lower: str, first_only: bool = False) -> Optional[List[int]]:
+        """
+        对已小写的标题做匹配
+
+        Args:
+            title_lower: 小写标题（调用方保证非空）
+            first_only: 只返回第一个成立的词组
+
+        Returns:
+            被全局过滤词或过滤词排除时返回 None，否则返回成立的词组下标列表
+        """
+        matched = self._matched_terms(title_lower)
+        if self._global_ids and not self._global_ids.isdisjoint(matched):
+            return None
+        if self._filter_ids and self.group_count and not self._filter_ids.isdisjoint(matched):
+            return None
+        return self._groups_from_terms(matched, first_only)
+
+    def match_groups(self, title: str) -> List[int]:
+        """
+        返回标题命中的全部词组下标（一次扫描）
+
+        Args:
+            title: 标题文本
+
+        Returns:
+            成立的词组下标列表（升序），被过滤或无效标题返回空列表
+        """
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return []
+        return self.match_lower(title.lower()) or []
+
+    def first_group(self, title: str) -> Optional[int]:
+        """
+        返回标题命中的第一个词组下标
+
+        Args:
+            title: 标题文本
+
+        Returns:
+            词组下标，未命中、被过滤或无效标题返回 None
+        """
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return None
+        groups = self.match_lower(title.lower(), first_only=True)
+        return groups[0] if groups else None
+
+    def matches(self, title: str) -> bool:
+        """
+        检查标题是否匹配词组规则，语义与 matches_word_groups 一致
+
+        Args:
+            title: 标题文本
+
+        Returns:
+            是否匹配
+        """
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return False
+        groups = self.match_lower(title.lower(), first_only=True)
+        if groups is None:
+            return False
+        # 没有配置词组时匹配所有标题
+        return not self.group_count or bool(groups)
+
+
+# 编译结果缓存：以词组列表对象本身为键，保留引用以保证 id 不被复用
+_MATCHER_CACHE: "OrderedDict[Tuple[int, int, int], Tuple[List, List, Optional[List], WordGroupMatcher]]" = OrderedDict()
+_MATCHER_CACHE_SIZE = 16
+
+
+def compile_word_matcher(
+    word_groups: List[Dict],
+    filter_words: List,
+    global_filters: Optional[List[str]] = None,
+) -> WordGroupMatcher:
+    """
+    获取词组配置对应的编译匹配器（按列表对象缓存）
+
+    同一份 load_frequency_words 结果只编译一次；词组配置视为只读，
+    修改列表内容后需传入新的列表对象。
+
+    Args:
+        word_groups: 词组列表
+        filter_words: 过滤词列表
+        global_filters: 全局过滤词列表
+
+    Returns:
+        WordGroupMatcher 实例
+    """
+    key = (id(word_groups), id(filter_words), id(global_filters))
+    cached = _MATCHER_CACHE.get(key)
+    if (
+        cached is not None
+        and cached[0] is word_groups
+        and cached[1] is filter_words
+        and cached[2] is global_filters
+    ):
+        _MATCHER_CACHE.move_to_end(key)
+        return cached[3]
+
+    matcher = WordGroupMatcher(word_groups, filter_words, global_filters)
+    _MATCHER_CACHE[key] = (word_groups, filter_words, global_filters, matcher)
+    while len(_MATCHER_CACHE) > _MATCHER_CACHE_SIZE:
+        _MATCHER_CACHE.popitem(last=False)
+    return matcher
+
+
 def load_frequency_words(
     frequency_file: Optional[str] = None,
 ) -> Tuple[List[Dict], List[str], List[str]]:
@@ -109,7 +423,8 @@ def load_frequency_words(
         frequency_file: 频率词配置文件路径，默认从环境变量 FREQUENCY_WORDS_PATH 获取或使用 config/frequency_words.txt
 
     Returns:
-        (词组列表, 词组内过滤词, 全局过滤词)
+        (词组列表, 词组内过滤词, 全局过滤词)，对应的编译匹配器会同时预编译缓存，
+        可通过 compile_word_matcher 取得
 
     Raises:
         FileNotFoundError: 频率词文件不存在
@@ -213,6 +528,8 @@ def load_frequency_words(
                 }
             )
 
+    compile_word_matcher(processed_groups, filter_words, global_filters)
+
     return processed_groups, filter_words, global_filters
 
 
@@ -234,49 +551,4 @@ def matches_word_groups(
     Returns:
         是否匹配
     """
-    # 防御性类型检查：确保 title 是有效字符串
-    if not isinstance(title, str):
-        title = str(title) if title is not None else ""
-    if not title.strip():
-        return False
-
-    title_lower = title.lower()
-
-    # 全局过滤检查（优先级最高）
-    if global_filters:
-        if any(global_word.lower() in title_lower for global_word in global_filters):
-            return False
-
-    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
-    if not word_groups:
-        return True
-
-    # 过滤词检查（兼容新旧格式）
-    for filter_item in filter_words:
-        if _word_matches(filter_item, title_lower):
-            return False
-
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
-
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                _word_matches(req_item, title_lower) for req_item in required_words
-            )
-            if not all_required_present:
-                continue
-
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                _word_matches(normal_item, title_lower) for normal_item in normal_words
-            )
-            if not any_normal_present:
-                continue
-
-        return True
-
-    return False
+    return compile_word_matcher(word_groups, filter_words, global_filters).matches(title)
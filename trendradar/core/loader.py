@@ -56,6 +56,9 @@ def _load_crawler_config(config_data: Dict) -> Dict:
     enable_crawler_env = _get_env_bool("ENABLE_CRAWLER")
     return {
         "REQUEST_INTERVAL": crawler_config.get("request_interval", 100),
+        "MAX_WORKERS": crawler_config.get("max_workers", 1),
+        "PER_HOST_CONCURRENCY": crawler_config.get("per_host_concurrency", 4),
+        "PER_HOST_RATE": crawler_config.get("per_host_rate", 0),
         "USE_PROXY": crawler_config.get("use_proxy", False),
         "DEFAULT_PROXY": crawler_config.get("default_proxy", ""),
         "ENABLE_CRAWLER": enable_crawler_env if enable_crawler_env is not None else crawler_config.get("enabled", True),
@@ -100,6 +103,19 @@ def _load_notification_config(config_data: Dict) -> Dict:
         "BATCH_SEND_INTERVAL": advanced.get("batch_send_interval", 1.0),
         "FEISHU_MESSAGE_SEPARATOR": advanced.get("feishu_message_separator", "---"),
         "MAX_ACCOUNTS_PER_CHANNEL": _get_env_int("MAX_ACCOUNTS_PER_CHANNEL") or advanced.get("max_accounts_per_channel", 3),
+        "NOTIFICATION_MAX_WORKERS": _get_env_int("NOTIFICATION_WORKERS") or advanced.get("notification_workers", 1),
+    }
+
+
+def _load_http_config(config_data: Dict) -> Dict:
+    """加载 HTTP 连接池配置（爬虫与通知渠道共用）"""
+    advanced = config_data.get("advanced", {})
+    http_config = advanced.get("http", {})
+    return {
+        "POOL_CONNECTIONS": http_config.get("pool_connections", 16),
+        "POOL_MAXSIZE": http_config.get("pool_maxsize", 16),
+        "MAX_RETRIES": http_config.get("max_retries", 2),
+        "BACKOFF_FACTOR": http_config.get("backoff_factor", 0.5),
     }
 
 
@@ -161,6 +177,10 @@ def _load_rss_config(config_data: Dict) -> Dict:
         "ENABLED": rss.get("enabled", False),
         "REQUEST_INTERVAL": advanced_rss.get("request_interval", 2000),
         "TIMEOUT": advanced_rss.get("timeout", 15),
+        "MAX_WORKERS": advanced_rss.get("max_workers", 1),
+        "PER_DOMAIN_CONCURRENCY": advanced_rss.get("per_domain_concurrency", 2),
+        "PER_DOMAIN_RATE": advanced_rss.get("per_domain_rate", 0),
+        "CONDITIONAL_GET": advanced_rss.get("conditional_get", False),
         "USE_PROXY": advanced_rss.get("use_proxy", False),
         "PROXY_URL": rss_proxy_url,
         "FEEDS": rss.get("feeds", []),
@@ -181,6 +201,10 @@ def _load_storage_config(config_data: Dict) -> Dict:
     local = storage.get("local", {})
     remote = storage.get("remote", {})
     pull = storage.get("pull", {})
+    sqlite = storage.get("sqlite", {})
+    archive = storage.get("archive", {})
+    cold = storage.get("cold", {})
+    postgres = storage.get("postgres", {})
 
     txt_enabled_env = _get_env_bool("STORAGE_TXT_ENABLED")
     html_enabled_env = _get_env_bool("STORAGE_HTML_ENABLED")
@@ -204,11 +228,32 @@ def _load_storage_config(config_data: Dict) -> Dict:
             "SECRET_ACCESS_KEY": _get_env_str("S3_SECRET_ACCESS_KEY") or remote.get("secret_access_key", ""),
             "REGION": _get_env_str("S3_REGION") or remote.get("region", ""),
             "RETENTION_DAYS": _get_env_int("REMOTE_RETENTION_DAYS") or remote.get("retention_days", 0),
+            "COMPACT_SEGMENTS": remote.get("compact_segments", 12),
+        },
+        "POSTGRES": {
+            "URL": _get_env_str("DATABASE_URL") or postgres.get("url", ""),
+            "POOL_SIZE": postgres.get("pool_size", 5),
+            "MAX_OVERFLOW": postgres.get("max_overflow", 10),
         },
         "PULL": {
             "ENABLED": pull_enabled_env if pull_enabled_env is not None else pull.get("enabled", False),
             "DAYS": _get_env_int("PULL_DAYS") or pull.get("days", 7),
         },
+        "SQLITE": {
+            "JOURNAL_MODE": sqlite.get("journal_mode", "WAL"),
+            "SYNCHRONOUS": sqlite.get("synchronous", "NORMAL"),
+            "MMAP_SIZE": sqlite.get("mmap_size", 268435456),
+            "CACHE_SIZE": sqlite.get("cache_size", -65536),
+            "TEMP_STORE": sqlite.get("temp_store", "MEMORY"),
+            "BUSY_TIMEOUT": sqlite.get("busy_timeout", 5000),
+        },
+        "ARCHIVE": {
+            "ENABLED": archive.get("enabled", False),
+        },
+        "COLD": {
+            "AFTER_DAYS": cold.get("after_days", 0),
+            "CODEC": cold.get("codec", "zstd"),
+        },
     }
 
 
@@ -244,6 +289,7 @@ def _load_webhook_config(config_data: Dict) -> Dict:
         "EMAIL_TO": _get_env_str("EMAIL_TO") or email.get("to", ""),
         "EMAIL_SMTP_SERVER": _get_env_str("EMAIL_SMTP_SERVER") or email.get("smtp_server", ""),
         "EMAIL_SMTP_PORT": _get_env_str("EMAIL_SMTP_PORT") or email.get("smtp_port", ""),
+        "EMAIL_MAX_CONNECTIONS": _get_env_int("EMAIL_MAX_CONNECTIONS") or email.get("max_connections", 4),
         # ntfy
         "NTFY_SERVER_URL": _get_env_str("NTFY_SERVER_URL") or ntfy.get("server_url") or "https://ntfy.sh",
         "NTFY_TOPIC": _get_env_str("NTFY_TOPIC") or ntfy.get("topic", ""),
@@ -370,6 +416,9 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     # 通知配置
     config.update(_load_notification_config(config_data))
 
+    # HTTP 连接池配置
+    config["HTTP"] = _load_http_config(config_data)
+
     # 推送窗口配置
     config["PUSH_WINDOW"] = _load_push_window_config(config_data)
 
@@ -4,5 +4,6 @@
 """
 
 from trendradar.crawler.fetcher import DataFetcher
+from trendradar.crawler.limiter import HostRateLimiter, TokenBucket
 
-__all__ = ["DataFetcher"]
+__all__ = ["DataFetcher", "HostRateLimiter", "TokenBucket"]
@@ -7,14 +7,19 @@
 - 批量平台数据爬取
 - 自动重试机制
 - 代理支持
+- 连接复用（共享连接池，保持长连接）
+- 并发抓取（按主机限制并发数和请求速率）
 """
 
 import json
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from typing import Dict, List, Tuple, Optional, Union
 
-import requests
+from trendradar.crawler.limiter import HostRateLimiter
+from trendradar.utils.http_client import create_session
 
 
 class DataFetcher:
@@ -46,6 +51,9 @@ class DataFetcher:
         """
         self.proxy_url = proxy_url
         self.api_url = api_url or self.DEFAULT_API_URL
+        # 所有平台请求同一 API 主机，复用连接池中的长连接
+        # 重试由 fetch_data 负责（每次重试都经过限流器），连接层不再重试
+        self.session = create_session(proxy_url, self.DEFAULT_HEADERS, max_retries=0)
 
     def fetch_data(
         self,
@@ -53,6 +61,7 @@ class DataFetcher:
         max_retries: int = 2,
         min_retry_wait: int = 3,
         max_retry_wait: int = 5,
+        limiter: Optional[HostRateLimiter] = None,
     ) -> Tuple[Optional[str], str, str]:
         """
         获取指定ID数据，支持重试
@@ -62,6 +71,7 @@ class DataFetcher:
             max_retries: 最大重试次数
             min_retry_wait: 最小重试等待时间（秒）
             max_retry_wait: 最大重试等待时间（秒）
+            limiter: 按主机限流器（可选，并发抓取时使用；重试等待期间不占用并发名额）
 
         Returns:
             (响应文本, 平台ID, 别名) 元组，失败时响应文本为 None
@@ -74,19 +84,11 @@ class DataFetcher:
 
         url = f"{self.api_url}?id={id_value}&latest"
 
-        proxies = None
-        if self.proxy_url:
-            proxies = {"http": self.proxy_url, "https": self.proxy_url}
-
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
-                    url,
-                    proxies=proxies,
-                    headers=self.DEFAULT_HEADERS,
-                    timeout=10,
-                )
+                with limiter.limit(url) if limiter else nullcontext():
+                    response = self.session.get(url, timeout=10)
                 response.raise_for_status()
 
                 data_text = response.text
@@ -114,21 +116,78 @@ class DataFetcher:
 
         return None, id_value, alias
 
+    def _parse_response(
+        self, id_value: str, response: str
+    ) -> Optional[Dict[str, Dict]]:
+        """
+        解析单个平台的响应文本
+
+        Args:
+            id_value: 平台ID
+            response: 响应文本
+
+        Returns:
+            {标题: {"ranks": [...], "url": ..., "mobileUrl": ...}}，解析失败返回 None
+        """
+        try:
+            data = json.loads(response)
+            titles = {}
+
+            for index, item in enumerate(data.get("items", []), 1):
+                title = item.get("title")
+                # 跳过无效标题（None、float、空字符串）
+                if title is None or isinstance(title, float) or not str(title).strip():
+                    continue
+                title = str(title).strip()
+                url = item.get("url", "")
+                mobile_url = item.get("mobileUrl", "")
+
+                if title in titles:
+                    titles[title]["ranks"].append(index)
+                else:
+                    titles[title] = {
+                        "ranks": [index],
+                        "url": url,
+                        "mobileUrl": mobile_url,
+                    }
+            return titles
+        except json.JSONDecodeError:
+            print(f"解析 {id_value} 响应失败")
+            return None
+        except Exception as e:
+            print(f"处理 {id_value} 数据出错: {e}")
+            return None
+
     def crawl_websites(
         self,
         ids_list: List[Union[str, Tuple[str, str]]],
         request_interval: int = 100,
+        max_workers: int = 1,
+        per_host_concurrency: int = 4,
+        per_host_rate: float = 0,
     ) -> Tuple[Dict, Dict, List]:
         """
         爬取多个网站数据
 
+        max_workers > 1 时启用并发模式：各平台在线程池中并行抓取，
+        同一主机的请求受 per_host_concurrency 和 per_host_rate 约束，
+        request_interval 不再生效。
+
         Args:
             ids_list: 平台ID列表，每个元素可以是字符串或 (平台ID, 别名) 元组
-            request_interval: 请求间隔（毫秒）
+            request_interval: 请求间隔（毫秒，仅串行模式）
+            max_workers: 并发线程数（1=串行）
+            per_host_concurrency: 同一主机最大并发请求数（仅并发模式）
+            per_host_rate: 同一主机每秒最大请求数，0=不限速（仅并发模式）
 
         Returns:
             (结果字典, ID到名称的映射, 失败ID列表) 元组
         """
+        if max_workers > 1 and len(ids_list) > 1:
+            return self._crawl_websites_concurrent(
+                ids_list, max_workers, per_host_concurrency, per_host_rate
+            )
+
         results = {}
         id_to_name = {}
         failed_ids = []
@@ -143,34 +202,9 @@ class DataFetcher:
             id_to_name[id_value] = name
             response, _, _ = self.fetch_data(id_info)
 
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item.get("title")
-                        # 跳过无效标题（None、float、空字符串）
-                        if title is None or isinstance(title, float) or not str(title).strip():
-                            continue
-                        title = str(title).strip()
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"处理 {id_value} 数据出错: {e}")
-                    failed_ids.append(id_value)
+            titles = self._parse_response(id_value, response) if response else None
+            if titles is not None:
+                results[id_value] = titles
             else:
                 failed_ids.append(id_value)
 
@@ -182,3 +216,47 @@ class DataFetcher:
 
         print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
         return results, id_to_name, failed_ids
+
+    def _crawl_websites_concurrent(
+        self,
+        ids_list: List[Union[str, Tuple[str, str]]],
+        max_workers: int,
+        per_host_concurrency: int,
+        per_host_rate: float,
+    ) -> Tuple[Dict, Dict, List]:
+        """
+        并发爬取多个网站数据
+
+        结果按 ids_list 的顺序组装，与串行模式输出一致。
+        """
+        limiter = HostRateLimiter(
+            max_concurrency=per_host_concurrency,
+            rate=per_host_rate,
+            burst=max(1, per_host_concurrency),
+        )
+
+        workers = min(max_workers, len(ids_list))
+        print(f"并发爬取 {len(ids_list)} 个平台（线程数 {workers}）")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.fetch_data, id_info, limiter=limiter)
+                for id_info in ids_list
+            ]
+            responses = [future.result() for future in futures]
+
+        results = {}
+        id_to_name = {}
+        failed_ids = []
+
+        for response, id_value, name in responses:
+            id_to_name[id_value] = name
+
+            titles = self._parse_response(id_value, response) if response else None
+            if titles is not None:
+                results[id_value] = titles
+            else:
+                failed_ids.append(id_value)
+
+        print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        return results, id_to_name, failed_ids
@@ -0,0 +1,132 @@
+# coding=utf-8
+"""
+请求限流模块
+
+为并发抓取提供按主机维度的限流能力：
+- TokenBucket: 令牌桶速率限制
+- HostRateLimiter: 按主机限制并发数和请求速率
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    线程安全的令牌桶
+
+    以 rate 个/秒的速度补充令牌，最多积累 capacity 个。
+    rate <= 0 表示不限速。
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒补充的令牌数（<=0 表示不限速）
+            capacity: 桶容量（允许的突发请求数），默认等于 max(1, rate)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        获取令牌，不足时阻塞等待
+
+        Args:
+            tokens: 需要的令牌数
+
+        Returns:
+            实际等待的秒数
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated_at
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated_at = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+
+                wait_time = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait_time)
+            waited += wait_time
+
+
+class HostRateLimiter:
+    """
+    按主机限流器
+
+    同一主机共享一个并发信号量和一个令牌桶，不同主机互不影响。
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        rate: float = 0,
+        burst: Optional[float] = None,
+    ):
+        """
+        初始化限流器
+
+        Args:
+            max_concurrency: 单个主机的最大并发请求数（<=0 表示不限制）
+            rate: 单个主机每秒最大请求数（<=0 表示不限速）
+            burst: 令牌桶容量，默认等于 max(1, rate)
+        """
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.burst = burst
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        """从 URL 提取主机名（含端口）"""
+        return urlparse(url).netloc.lower()
+
+    def _get_host_state(self, host: str):
+        """获取（或创建）主机对应的信号量和令牌桶"""
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+                if self.max_concurrency > 0:
+                    self._semaphores[host] = threading.BoundedSemaphore(
+                        self.max_concurrency
+                    )
+            return self._semaphores.get(host), self._buckets[host]
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[None]:
+        """
+        在限流约束下执行请求
+
+        用法:
+            with limiter.limit(url):
+                response = session.get(url)
+        """
+        semaphore, bucket = self._get_host_state(self.get_host(url))
+
+        if semaphore is not None:
+            semaphore.acquire()
+        try:
+            bucket.acquire()
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
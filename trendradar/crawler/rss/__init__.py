@@ -7,5 +7,6 @@ RSS 抓取模块
 
 from .parser import RSSParser
 from .fetcher import RSSFetcher, RSSFeedConfig
+from .cache import FeedValidatorCache
 
-__all__ = ["RSSParser", "RSSFetcher", "RSSFeedConfig"]
+__all__ = ["RSSParser", "RSSFetcher", "RSSFeedConfig", "FeedValidatorCache"]
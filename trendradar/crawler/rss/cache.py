@@ -0,0 +1,118 @@
+# coding=utf-8
+"""
+RSS 条件请求缓存
+
+持久化保存每个 RSS 源的 ETag、Last-Modified、内容哈希及上次解析结果，
+用于发送 If-None-Match / If-Modified-Since 条件请求，
+并在 304 或内容未变化时跳过解析。
+"""
+
+import json
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .parser import ParsedRSSItem
+
+
+@dataclass
+class FeedCacheEntry:
+    """单个 RSS 源的缓存条目"""
+    url: str                            # 缓存对应的 URL（URL 变化时缓存失效）
+    etag: str = ""                      # 响应头 ETag
+    last_modified: str = ""             # 响应头 Last-Modified
+    content_hash: str = ""              # 响应内容 SHA-256
+    items: List[ParsedRSSItem] = field(default_factory=list)  # 上次解析结果
+
+    def to_dict(self) -> Dict:
+        """转换为可序列化的字典"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FeedCacheEntry":
+        """从字典创建缓存条目"""
+        return cls(
+            url=data.get("url", ""),
+            etag=data.get("etag", ""),
+            last_modified=data.get("last_modified", ""),
+            content_hash=data.get("content_hash", ""),
+            items=[ParsedRSSItem(**item) for item in data.get("items", [])],
+        )
+
+
+class FeedValidatorCache:
+    """
+    RSS 源验证器缓存
+
+    以 JSON 文件持久化，线程安全，可在并发抓取中共享。
+    """
+
+    def __init__(self, cache_path: str):
+        """
+        初始化缓存
+
+        Args:
+            cache_path: 缓存文件路径
+        """
+        self.cache_path = Path(cache_path)
+        self._entries: Dict[str, FeedCacheEntry] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """从磁盘加载缓存（文件损坏时忽略）"""
+        if not self.cache_path.exists():
+            return
+
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._entries = {
+                feed_id: FeedCacheEntry.from_dict(entry)
+                for feed_id, entry in data.items()
+            }
+        except Exception as e:
+            print(f"[RSS] 加载条件请求缓存失败，将重新抓取: {e}")
+            self._entries = {}
+
+    def get(self, feed_id: str, url: str) -> Optional[FeedCacheEntry]:
+        """
+        获取缓存条目
+
+        Args:
+            feed_id: 源 ID
+            url: 当前配置的 URL
+
+        Returns:
+            缓存条目，不存在或 URL 已变化时返回 None
+        """
+        with self._lock:
+            entry = self._entries.get(feed_id)
+        if entry and entry.url == url:
+            return entry
+        return None
+
+    def set(self, feed_id: str, entry: FeedCacheEntry) -> None:
+        """写入缓存条目"""
+        with self._lock:
+            self._entries[feed_id] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """保存缓存到磁盘（无变化时跳过）"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {feed_id: entry.to_dict() for feed_id, entry in self._entries.items()}
+            self._dirty = False
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            tmp_path.replace(self.cache_path)
+        except Exception as e:
+            print(f"[RSS] 保存条件请求缓存失败: {e}")
@@ -5,17 +5,23 @@ RSS 抓取器
 负责从配置的 RSS 源抓取数据并转换为标准格式
 """
 
+import hashlib
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple, Callable
 
 import requests
 
+from .cache import FeedCacheEntry, FeedValidatorCache
 from .parser import RSSParser, ParsedRSSItem
+from trendradar.crawler.limiter import HostRateLimiter
 from trendradar.storage.base import RSSItem, RSSData
 from trendradar.utils.time import get_configured_time, is_within_days, DEFAULT_TIMEZONE
+from trendradar.utils.http_client import create_session
 
 
 @dataclass
@@ -42,6 +48,10 @@ class RSSFetcher:
         timezone: str = DEFAULT_TIMEZONE,
         freshness_enabled: bool = True,
         default_max_age_days: int = 3,
+        max_workers: int = 1,
+        per_domain_concurrency: int = 2,
+        per_domain_rate: float = 0,
+        cache_path: Optional[str] = None,
     ):
         """
         初始化抓取器
@@ -55,6 +65,10 @@ class RSSFetcher:
             timezone: 时区配置（如 'Asia/Shanghai'）
             freshness_enabled: 是否启用新鲜度过滤
             default_max_age_days: 默认最大文章年龄（天）
+            max_workers: 并发线程数（1=串行，按 request_interval 间隔请求）
+            per_domain_concurrency: 同一域名最大并发请求数（仅并发模式）
+            per_domain_rate: 同一域名每秒最大请求数，0=不限速（仅并发模式）
+            cache_path: 条件请求缓存文件路径（None=不启用缓存）
         """
         self.feeds = [f for f in feeds if f.enabled]
         self.request_interval = request_interval
@@ -64,26 +78,24 @@ class RSSFetcher:
         self.timezone = timezone
         self.freshness_enabled = freshness_enabled
         self.default_max_age_days = default_max_age_days
+        self.max_workers = max_workers
+        self.per_domain_concurrency = per_domain_concurrency
+        self.per_domain_rate = per_domain_rate
 
+        self.cache = FeedValidatorCache(cache_path) if cache_path else None
         self.parser = RSSParser()
         self.session = self._create_session()
 
     def _create_session(self) -> requests.Session:
-        """创建请求会话"""
-        session = requests.Session()
-        session.headers.update({
-            "User-Agent": "TrendRadar/2.0 RSS Reader (https://github.com/trendradar)",
-            "Accept": "application/feed+json, application/json, application/rss+xml, application/atom+xml, application/xml, text/xml, */*",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        })
-
-        if self.use_proxy and self.proxy_url:
-            session.proxies = {
-                "http": self.proxy_url,
-                "https": self.proxy_url,
-            }
-
-        return session
+        """创建请求会话（使用共享的连接池与重试配置）"""
+        return create_session(
+            self.proxy_url if self.use_proxy else None,
+            headers={
+                "User-Agent": "TrendRadar/2.0 RSS Reader (https://github.com/trendradar)",
+                "Accept": "application/feed+json, application/json, application/rss+xml, application/atom+xml, application/xml, text/xml, */*",
+                "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+            },
+        )
 
     def _filter_by_freshness(
         self,
@@ -127,21 +139,77 @@ class RSSFetcher:
         filtered_count = len(items) - len(filtered)
         return filtered, filtered_count
 
-    def fetch_feed(self, feed: RSSFeedConfig) -> Tuple[List[RSSItem], Optional[str]]:
+    def _request_feed(
+        self,
+        feed: RSSFeedConfig,
+        limiter: Optional[HostRateLimiter] = None,
+    ) -> List[ParsedRSSItem]:
+        """
+        请求并解析单个 RSS 源，启用缓存时使用条件请求
+
+        返回 304 或内容哈希未变化时直接复用上次的解析结果。
+
+        Args:
+            feed: RSS 源配置
+            limiter: 按域名限流器（可选）
+
+        Returns:
+            解析后的条目列表
+        """
+        cached = self.cache.get(feed.id, feed.url) if self.cache else None
+
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        with limiter.limit(feed.url) if limiter else nullcontext():
+            response = self.session.get(feed.url, timeout=self.timeout, headers=headers)
+
+        if response.status_code == 304 and cached:
+            print(f"[RSS] {feed.name}: 未更新 (304)，复用缓存")
+            return cached.items
+
+        response.raise_for_status()
+
+        if not self.cache:
+            return self.parser.parse(response.text, feed.url)
+
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        if cached and cached.content_hash == content_hash:
+            print(f"[RSS] {feed.name}: 内容未变化，复用缓存")
+            parsed_items = cached.items
+        else:
+            parsed_items = self.parser.parse(response.text, feed.url)
+
+        self.cache.set(feed.id, FeedCacheEntry(
+            url=feed.url,
+            etag=response.headers.get("ETag", ""),
+            last_modified=response.headers.get("Last-Modified", ""),
+            content_hash=content_hash,
+            items=parsed_items,
+        ))
+        return parsed_items
+
+    def fetch_feed(
+        self,
+        feed: RSSFeedConfig,
+        limiter: Optional[HostRateLimiter] = None,
+    ) -> Tuple[List[RSSItem], Optional[str]]:
         """
         抓取单个 RSS 源
 
         Args:
             feed: RSS 源配置
+            limiter: 按域名限流器（可选，并发抓取时使用）
 
         Returns:
             (条目列表, 错误信息) 元组
         """
         try:
-            response = self.session.get(feed.url, timeout=self.timeout)
-            response.raise_for_status()
-
-            parsed_items = self.parser.parse(response.text, feed.url)
+            parsed_items = self._request_feed(feed, limiter)
 
             # 限制条目数量（0=不限制）
             if feed.max_items > 0:
@@ -211,15 +279,7 @@ class RSSFetcher:
 
         print(f"[RSS] 开始抓取 {len(self.feeds)} 个 RSS 源...")
 
-        for i, feed in enumerate(self.feeds):
-            # 请求间隔（带随机波动）
-            if i > 0:
-                interval = self.request_interval / 1000
-                jitter = random.uniform(-0.2, 0.2) * interval
-                time.sleep(interval + jitter)
-
-            items, error = self.fetch_feed(feed)
-
+        for feed, (items, error) in zip(self.feeds, self._fetch_feeds()):
             id_to_name[feed.id] = feed.name
 
             if error:
@@ -227,6 +287,9 @@ class RSSFetcher:
             else:
                 all_items[feed.id] = items
 
+        if self.cache:
+            self.cache.save()
+
         total_items = sum(len(items) for items in all_items.values())
         print(f"[RSS] 抓取完成: {len(all_items)} 个源成功, {len(failed_ids)} 个失败, 共 {total_items} 条")
 
@@ -238,6 +301,38 @@ class RSSFetcher:
             failed_ids=failed_ids,
         )
 
+    def _fetch_feeds(self) -> List[Tuple[List[RSSItem], Optional[str]]]:
+        """
+        抓取所有 RSS 源，返回与 self.feeds 顺序一致的结果列表
+
+        max_workers > 1 时并发抓取，同一域名的请求受
+        per_domain_concurrency 和 per_domain_rate 约束；
+        否则串行抓取并按 request_interval 间隔请求。
+        """
+        if self.max_workers > 1 and len(self.feeds) > 1:
+            limiter = HostRateLimiter(
+                max_concurrency=self.per_domain_concurrency,
+                rate=self.per_domain_rate,
+            )
+            workers = min(self.max_workers, len(self.feeds))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self.fetch_feed, feed, limiter)
+                    for feed in self.feeds
+                ]
+                return [future.result() for future in futures]
+
+        results = []
+        for i, feed in enumerate(self.feeds):
+            # 请求间隔（带随机波动）
+            if i > 0:
+                interval = self.request_interval / 1000
+                jitter = random.uniform(-0.2, 0.2) * interval
+                time.sleep(interval + jitter)
+
+            results.append(self.fetch_feed(feed))
+        return results
+
     @classmethod
     def from_config(cls, config: Dict) -> "RSSFetcher":
         """
@@ -248,6 +343,9 @@ class RSSFetcher:
                 {
                     "enabled": true,
                     "request_interval": 2000,
+                    "max_workers": 8,
+                    "per_domain_concurrency": 2,
+                    "cache_path": "output/rss/feed_cache.json",
                     "freshness_filter": {
                         "enabled": true,
                         "max_age_days": 3
@@ -302,4 +400,8 @@ class RSSFetcher:
             timezone=config.get("timezone", DEFAULT_TIMEZONE),
             freshness_enabled=freshness_enabled,
             default_max_age_days=default_max_age_days,
+            max_workers=config.get("max_workers", 1),
+            per_domain_concurrency=config.get("per_domain_concurrency", 2),
+            per_domain_rate=config.get("per_domain_rate", 0),
+            cache_path=config.get("cache_path"),
         )
@@ -13,6 +13,7 @@
 - batch: 批次处理工具
 - renderer: 通知内容渲染
 - splitter: 消息分批拆分
+- mailer: SMTP 连接池与报告邮件
 - senders: 消息发送器（各渠道发送函数）
 - dispatcher: 多账号通知调度器
 """
@@ -45,7 +46,14 @@ from trendradar.notification.senders import (
     send_to_ntfy,
     send_to_bark,
     send_to_slack,
+)
+from trendradar.notification.mailer import (
     SMTP_CONFIGS,
+    SMTPConnectionPool,
+    EmailReport,
+    get_smtp_pool,
+    close_smtp_pool,
+    send_emails,
 )
 from trendradar.notification.dispatcher import NotificationDispatcher
 
@@ -76,6 +84,12 @@ __all__ = [
     "send_to_bark",
     "send_to_slack",
     "SMTP_CONFIGS",
+    # 邮件
+    "SMTPConnectionPool",
+    "EmailReport",
+    "get_smtp_pool",
+    "close_smtp_pool",
+    "send_emails",
     # 通知调度器
     "NotificationDispatcher",
 ]
@@ -4,13 +4,15 @@
 
 提供统一的通知分发接口。
 支持所有通知渠道的多账号配置，使用 `;` 分隔多个账号。
+max_workers > 1 时各渠道、同一渠道的各账号并发发送，每个账号内仍按顺序逐批发送。
 
 使用示例:
     dispatcher = NotificationDispatcher(config, get_time_func, split_content_func)
     results = dispatcher.dispatch_all(report_data, report_type, ...)
 """
 
-from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from trendradar.core.config import (
     get_account_at_index,
@@ -18,6 +20,7 @@ from trendradar.core.config import (
     parse_multi_account_config,
     validate_paired_configs,
 )
+from trendradar.utils.http_client import get_session
 
 from .senders import (
     send_to_bark,
@@ -62,6 +65,34 @@ class NotificationDispatcher:
         self.get_time_func = get_time_func
         self.split_content_func = split_content_func
         self.max_accounts = config.get("MAX_ACCOUNTS_PER_CHANNEL", 3)
+        self.max_workers = config.get("NOTIFICATION_MAX_WORKERS", 1)
+
+    def _run_tasks(self, tasks: List[Callable[[], bool]], parallel: bool = True) -> List[bool]:
+        """
+        执行发送任务，返回与 tasks 顺序一致的结果列表
+
+        max_workers > 1 且 parallel 为 True 时并发执行，否则串行执行。
+        每个任务内部的分批发送和批次间隔不受影响。
+
+        Args:
+            tasks: 发送任务列表（无参数，返回是否成功）
+            parallel: 是否允许并发（共享同一服务端限速的任务应串行）
+
+        Returns:
+            List[bool]: 各任务的发送结果
+        """
+        if parallel and self.max_workers > 1 and len(tasks) > 1:
+            workers = min(self.max_workers, len(tasks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(task) for task in tasks]
+                return [future.result() for future in futures]
+
+        return [task() for task in tasks]
+
+    def _run_channels(self, channel_tasks: List[Tuple[str, Callable[[], bool]]]) -> Dict[str, bool]:
+        """执行各渠道的发送任务，返回 {渠道名: 是否成功}（顺序与任务一致）"""
+        results = self._run_tasks([task for _, task in channel_tasks])
+        return {name: result for (name, _), result in zip(channel_tasks, results)}
 
     def dispatch_all(
         self,
@@ -90,49 +121,36 @@ class NotificationDispatcher:
         Returns:
             Dict[str, bool]: 每个渠道的发送结果，key 为渠道名，value 为是否成功
         """
-        results = {}
+        channel_tasks: List[Tuple[str, Callable[[], bool]]] = []
+        args = (report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items)
 
         # 飞书
         if self.config.get("FEISHU_WEBHOOK_URL"):
-            results["feishu"] = self._send_feishu(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            channel_tasks.append(("feishu", lambda: self._send_feishu(*args)))
 
         # 钉钉
         if self.config.get("DINGTALK_WEBHOOK_URL"):
-            results["dingtalk"] = self._send_dingtalk(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            channel_tasks.append(("dingtalk", lambda: self._send_dingtalk(*args)))
 
         # 企业微信
         if self.config.get("WEWORK_WEBHOOK_URL"):
-            results["wework"] = self._send_wework(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            channel_tasks.append(("wework", lambda: self._send_wework(*args)))
 
         # Telegram（需要配对验证）
         if self.config.get("TELEGRAM_BOT_TOKEN") and self.config.get("TELEGRAM_CHAT_ID"):
-            results["telegram"] = self._send_telegram(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            channel_tasks.append(("telegram", lambda: self._send_telegram(*args)))
 
         # ntfy（需要配对验证）
         if self.config.get("NTFY_SERVER_URL") and self.config.get("NTFY_TOPIC"):
-            results["ntfy"] = self._send_ntfy(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            channel_tasks.append(("ntfy", lambda: self._send_ntfy(*args)))
 
         # Bark
         if self.config.get("BARK_URL"):
-            results["bark"] = self._send_bark(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            channel_tasks.append(("bark", lambda: self._send_bark(*args)))
 
         # Slack
         if self.config.get("SLACK_WEBHOOK_URL"):
-            results["slack"] = self._send_slack(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            channel_tasks.append(("slack", lambda: self._send_slack(*args)))
 
         # 邮件（保持原有逻辑，已支持多收件人）
         if (
@@ -140,9 +158,9 @@ class NotificationDispatcher:
             and self.config.get("EMAIL_PASSWORD")
             and self.config.get("EMAIL_TO")
         ):
-            results["email"] = self._send_email(report_type, html_file_path)
+            channel_tasks.append(("email", lambda: self._send_email(report_type, html_file_path)))
 
-        return results
+        return self._run_channels(channel_tasks)
 
     def _send_to_multi_accounts(
         self,
@@ -168,14 +186,18 @@ class NotificationDispatcher:
             return False
 
         accounts = limit_accounts(accounts, self.max_accounts, channel_name)
-        results = []
+        tasks = []
 
         for i, account in enumerate(accounts):
             if account:
                 account_label = f"账号{i+1}" if len(accounts) > 1 else ""
-                result = send_func(account, account_label=account_label, **kwargs)
-                results.append(result)
+                tasks.append(
+                    lambda account=account, account_label=account_label: send_func(
+                        account, account_label=account_label, **kwargs
+                    )
+                )
 
+        results = self._run_tasks(tasks)
         return any(results) if results else False
 
     def _send_feishu(
@@ -300,13 +322,13 @@ class NotificationDispatcher:
         telegram_tokens = limit_accounts(telegram_tokens, self.max_accounts, "Telegram")
         telegram_chat_ids = telegram_chat_ids[: len(telegram_tokens)]
 
-        results = []
+        tasks = []
         for i in range(len(telegram_tokens)):
             token = telegram_tokens[i]
             chat_id = telegram_chat_ids[i]
             if token and chat_id:
                 account_label = f"账号{i+1}" if len(telegram_tokens) > 1 else ""
-                result = send_to_telegram(
+                tasks.append(lambda token=token, chat_id=chat_id, account_label=account_label: send_to_telegram(
                     bot_token=token,
                     chat_id=chat_id,
                     report_data=report_data,
@@ -320,9 +342,9 @@ class NotificationDispatcher:
                     split_content_func=self.split_content_func,
                     rss_items=rss_items,
                     rss_new_items=rss_new_items,
-                )
-                results.append(result)
+                ))
 
+        results = self._run_tasks(tasks)
         return any(results) if results else False
 
     def _send_ntfy(
@@ -355,12 +377,12 @@ class NotificationDispatcher:
         if ntfy_tokens:
             ntfy_tokens = ntfy_tokens[: len(ntfy_topics)]
 
-        results = []
+        tasks = []
         for i, topic in enumerate(ntfy_topics):
             if topic:
                 token = get_account_at_index(ntfy_tokens, i, "") if ntfy_tokens else ""
                 account_label = f"账号{i+1}" if len(ntfy_topics) > 1 else ""
-                result = send_to_ntfy(
+                tasks.append(lambda topic=topic, token=token, account_label=account_label: send_to_ntfy(
                     server_url=ntfy_server_url,
                     topic=topic,
                     token=token,
@@ -374,9 +396,10 @@ class NotificationDispatcher:
                     split_content_func=self.split_content_func,
                     rss_items=rss_items,
                     rss_new_items=rss_new_items,
-                )
-                results.append(result)
+                ))
 
+        # 同一 ntfy 服务器按客户端 IP 限速，各 topic 串行发送
+        results = self._run_tasks(tasks, parallel=False)
         return any(results) if results else False
 
     def _send_bark(
@@ -454,6 +477,7 @@ class NotificationDispatcher:
             custom_smtp_server=self.config.get("EMAIL_SMTP_SERVER", ""),
             custom_smtp_port=self.config.get("EMAIL_SMTP_PORT", ""),
             get_time_func=self.get_time_func,
+            max_connections=self.config.get("EMAIL_MAX_CONNECTIONS", 4),
         )
 
     # === RSS 通知方法 ===
@@ -488,50 +512,37 @@ class NotificationDispatcher:
             print("[RSS通知] 没有 RSS 内容，跳过通知")
             return {}
 
-        results = {}
+        channel_tasks: List[Tuple[str, Callable[[], bool]]] = []
         report_type = "RSS 订阅更新"
+        args = (rss_items, feeds_info, proxy_url)
 
         # 飞书
         if self.config.get("FEISHU_WEBHOOK_URL"):
-            results["feishu"] = self._send_rss_feishu(
-                rss_items, feeds_info, proxy_url
-            )
+            channel_tasks.append(("feishu", lambda: self._send_rss_feishu(*args)))
 
         # 钉钉
         if self.config.get("DINGTALK_WEBHOOK_URL"):
-            results["dingtalk"] = self._send_rss_dingtalk(
-                rss_items, feeds_info, proxy_url
-            )
+            channel_tasks.append(("dingtalk", lambda: self._send_rss_dingtalk(*args)))
 
         # 企业微信
         if self.config.get("WEWORK_WEBHOOK_URL"):
-            results["wework"] = self._send_rss_markdown(
-                rss_items, feeds_info, proxy_url, "wework"
-            )
+            channel_tasks.append(("wework", lambda: self._send_rss_markdown(*args, "wework")))
 
         # Telegram
         if self.config.get("TELEGRAM_BOT_TOKEN") and self.config.get("TELEGRAM_CHAT_ID"):
-            results["telegram"] = self._send_rss_markdown(
-                rss_items, feeds_info, proxy_url, "telegram"
-            )
+            channel_tasks.append(("telegram", lambda: self._send_rss_markdown(*args, "telegram")))
 
         # ntfy
         if self.config.get("NTFY_SERVER_URL") and self.config.get("NTFY_TOPIC"):
-            results["ntfy"] = self._send_rss_markdown(
-                rss_items, feeds_info, proxy_url, "ntfy"
-            )
+            channel_tasks.append(("ntfy", lambda: self._send_rss_markdown(*args, "ntfy")))
 
         # Bark
         if self.config.get("BARK_URL"):
-            results["bark"] = self._send_rss_markdown(
-                rss_items, feeds_info, proxy_url, "bark"
-            )
+            channel_tasks.append(("bark", lambda: self._send_rss_markdown(*args, "bark")))
 
         # Slack
         if self.config.get("SLACK_WEBHOOK_URL"):
-            results["slack"] = self._send_rss_markdown(
-                rss_items, feeds_info, proxy_url, "slack"
-            )
+            channel_tasks.append(("slack", lambda: self._send_rss_markdown(*args, "slack")))
 
         # 邮件
         if (
@@ -539,9 +550,9 @@ class NotificationDispatcher:
             and self.config.get("EMAIL_PASSWORD")
             and self.config.get("EMAIL_TO")
         ):
-            results["email"] = self._send_email(report_type, html_file_path)
+            channel_tasks.append(("email", lambda: self._send_email(report_type, html_file_path)))
 
-        return results
+        return self._run_channels(channel_tasks)
 
     def _send_rss_feishu(
         self,
@@ -550,8 +561,6 @@ class NotificationDispatcher:
         proxy_url: Optional[str],
     ) -> bool:
         """发送 RSS 到飞书"""
-        import requests
-
         content = render_rss_feishu_content(
             rss_items=rss_items,
             feeds_info=feeds_info,
@@ -561,12 +570,7 @@ class NotificationDispatcher:
         webhooks = parse_multi_account_config(self.config["FEISHU_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "飞书")
 
-        results = []
-        for i, webhook_url in enumerate(webhooks):
-            if not webhook_url:
-                continue
-
-            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+        def send(webhook_url: str, account_label: str) -> bool:
             try:
                 # 分批发送
                 batches = self.split_content_func(
@@ -590,16 +594,25 @@ class NotificationDispatcher:
                         },
                     }
 
-                    proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    session = get_session(proxy_url)
+                    resp = session.post(webhook_url, json=payload, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ 飞书{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ 飞书{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
+
+        tasks = []
+        for i, webhook_url in enumerate(webhooks):
+            if not webhook_url:
+                continue
 
+            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+            tasks.append(lambda webhook_url=webhook_url, account_label=account_label: send(webhook_url, account_label))
+
+        results = self._run_tasks(tasks)
         return any(results) if results else False
 
     def _send_rss_dingtalk(
@@ -609,8 +622,6 @@ class NotificationDispatcher:
         proxy_url: Optional[str],
     ) -> bool:
         """发送 RSS 到钉钉"""
-        import requests
-
         content = render_rss_dingtalk_content(
             rss_items=rss_items,
             feeds_info=feeds_info,
@@ -620,12 +631,7 @@ class NotificationDispatcher:
         webhooks = parse_multi_account_config(self.config["DINGTALK_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "钉钉")
 
-        results = []
-        for i, webhook_url in enumerate(webhooks):
-            if not webhook_url:
-                continue
-
-            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+        def send(webhook_url: str, account_label: str) -> bool:
             try:
                 batches = self.split_content_func(
                     content, self.config.get("DINGTALK_BATCH_SIZE", 20000)
@@ -641,16 +647,25 @@ class NotificationDispatcher:
                         },
                     }
 
-                    proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    session = get_session(proxy_url)
+                    resp = session.post(webhook_url, json=payload, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ 钉钉{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ 钉钉{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
 
+        tasks = []
+        for i, webhook_url in enumerate(webhooks):
+            if not webhook_url:
+                continue
+
+            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+            tasks.append(lambda webhook_url=webhook_url, account_label=account_label: send(webhook_url, account_label))
+
+        results = self._run_tasks(tasks)
         return any(results) if results else False
 
     def _send_rss_markdown(
@@ -661,8 +676,6 @@ class NotificationDispatcher:
         channel: str,
     ) -> bool:
         """发送 RSS 到 Markdown 兼容渠道（企业微信、Telegram、ntfy、Bark、Slack）"""
-        import requests
-
         content = render_rss_markdown_content(
             rss_items=rss_items,
             feeds_info=feeds_info,
@@ -688,17 +701,10 @@ class NotificationDispatcher:
 
     def _send_rss_wework(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到企业微信"""
-        import requests
-
         webhooks = parse_multi_account_config(self.config["WEWORK_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "企业微信")
 
-        results = []
-        for i, webhook_url in enumerate(webhooks):
-            if not webhook_url:
-                continue
-
-            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+        def send(webhook_url: str, account_label: str) -> bool:
             try:
                 batches = self.split_content_func(
                     content, self.config.get("MESSAGE_BATCH_SIZE", 4000)
@@ -710,37 +716,36 @@ class NotificationDispatcher:
                         "markdown": {"content": batch_content},
                     }
 
-                    proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    session = get_session(proxy_url)
+                    resp = session.post(webhook_url, json=payload, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ 企业微信{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ 企业微信{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
 
+        tasks = []
+        for i, webhook_url in enumerate(webhooks):
+            if not webhook_url:
+                continue
+
+            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+            tasks.append(lambda webhook_url=webhook_url, account_label=account_label: send(webhook_url, account_label))
+
+        results = self._run_tasks(tasks)
         return any(results) if results else False
 
     def _send_rss_telegram(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Telegram"""
-        import requests
-
         tokens = parse_multi_account_config(self.config["TELEGRAM_BOT_TOKEN"])
         chat_ids = parse_multi_account_config(self.config["TELEGRAM_CHAT_ID"])
 
         if not tokens or not chat_ids:
             return False
 
-        results = []
-        for i in range(min(len(tokens), len(chat_ids), self.max_accounts)):
-            token = tokens[i]
-            chat_id = chat_ids[i]
-
-            if not token or not chat_id:
-                continue
-
-            account_label = f"账号{i+1}" if len(tokens) > 1 else ""
+        def send(token: str, chat_id: str, account_label: str) -> bool:
             try:
                 batches = self.split_content_func(
                     content, self.config.get("MESSAGE_BATCH_SIZE", 4000)
@@ -754,22 +759,32 @@ class NotificationDispatcher:
                         "parse_mode": "Markdown",
                     }
 
-                    proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(url, json=payload, proxies=proxies, timeout=30)
+                    session = get_session(proxy_url)
+                    resp = session.post(url, json=payload, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ Telegram{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ Telegram{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
+
+        tasks = []
+        for i in range(min(len(tokens), len(chat_ids), self.max_accounts)):
+            token = tokens[i]
+            chat_id = chat_ids[i]
+
+            if not token or not chat_id:
+                continue
+
+            account_label = f"账号{i+1}" if len(tokens) > 1 else ""
+            tasks.append(lambda token=token, chat_id=chat_id, account_label=account_label: send(token, chat_id, account_label))
 
+        results = self._run_tasks(tasks)
         return any(results) if results else False
 
     def _send_rss_ntfy(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 ntfy"""
-        import requests
-
         server_url = self.config["NTFY_SERVER_URL"]
         topics = parse_multi_account_config(self.config["NTFY_TOPIC"])
         tokens = parse_multi_account_config(self.config.get("NTFY_TOKEN", ""))
@@ -779,14 +794,7 @@ class NotificationDispatcher:
 
         topics = limit_accounts(topics, self.max_accounts, "ntfy")
 
-        results = []
-        for i, topic in enumerate(topics):
-            if not topic:
-                continue
-
-            token = tokens[i] if tokens and i < len(tokens) else ""
-            account_label = f"账号{i+1}" if len(topics) > 1 else ""
-
+        def send(topic: str, token: str, account_label: str) -> bool:
             try:
                 batches = self.split_content_func(content, 3800)
 
@@ -796,35 +804,40 @@ class NotificationDispatcher:
                     if token:
                         headers["Authorization"] = f"Bearer {token}"
 
-                    proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(
+                    session = get_session(proxy_url)
+                    resp = session.post(
                         url, data=batch_content.encode("utf-8"),
-                        headers=headers, proxies=proxies, timeout=30
+                        headers=headers, timeout=30
                     )
                     resp.raise_for_status()
 
                 print(f"✅ ntfy{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ ntfy{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
 
+        tasks = []
+        for i, topic in enumerate(topics):
+            if not topic:
+                continue
+
+            token = tokens[i] if tokens and i < len(tokens) else ""
+            account_label = f"账号{i+1}" if len(topics) > 1 else ""
+            tasks.append(lambda topic=topic, token=token, account_label=account_label: send(topic, token, account_label))
+
+        # 同一 ntfy 服务器按客户端 IP 限速，各 topic 串行发送
+        results = self._run_tasks(tasks, parallel=False)
         return any(results) if results else False
 
     def _send_rss_bark(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Bark"""
-        import requests
         import urllib.parse
 
         urls = parse_multi_account_config(self.config["BARK_URL"])
         urls = limit_accounts(urls, self.max_accounts, "Bark")
 
-        results = []
-        for i, bark_url in enumerate(urls):
-            if not bark_url:
-                continue
-
-            account_label = f"账号{i+1}" if len(urls) > 1 else ""
+        def send(bark_url: str, account_label: str) -> bool:
             try:
                 batches = self.split_content_func(
                     content, self.config.get("BARK_BATCH_SIZE", 3600)
@@ -835,31 +848,33 @@ class NotificationDispatcher:
                     body = urllib.parse.quote(batch_content)
                     url = f"{bark_url.rstrip('/')}/{title}/{body}"
 
-                    proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.get(url, proxies=proxies, timeout=30)
+                    session = get_session(proxy_url)
+                    resp = session.get(url, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ Bark{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ Bark{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
+
+        tasks = []
+        for i, bark_url in enumerate(urls):
+            if not bark_url:
+                continue
+
+            account_label = f"账号{i+1}" if len(urls) > 1 else ""
+            tasks.append(lambda bark_url=bark_url, account_label=account_label: send(bark_url, account_label))
 
+        results = self._run_tasks(tasks)
         return any(results) if results else False
 
     def _send_rss_slack(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Slack"""
-        import requests
-
         webhooks = parse_multi_account_config(self.config["SLACK_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "Slack")
 
-        results = []
-        for i, webhook_url in enumerate(webhooks):
-            if not webhook_url:
-                continue
-
-            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+        def send(webhook_url: str, account_label: str) -> bool:
             try:
                 batches = self.split_content_func(
                     content, self.config.get("SLACK_BATCH_SIZE", 4000)
@@ -878,14 +893,23 @@ class NotificationDispatcher:
                         ]
                     }
 
-                    proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    session = get_session(proxy_url)
+                    resp = session.post(webhook_url, json=payload, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ Slack{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ Slack{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
+
+        tasks = []
+        for i, webhook_url in enumerate(webhooks):
+            if not webhook_url:
+                continue
+
+            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+            tasks.append(lambda webhook_url=webhook_url, account_label=account_label: send(webhook_url, account_label))
 
+        results = self._run_tasks(tasks)
         return any(results) if results else False
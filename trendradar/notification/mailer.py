@@ -0,0 +1,539 @@
+# coding=utf-8
+"""
+SMTP 邮件发送模块
+
+- SMTPConnectionPool: 按 (服务器, 端口, 加密方式, 账号) 保持已登录的 SMTP 连接，
+  同一连接上依次发送多封邮件，每个服务器的并发连接数有上限
+- EmailReport: 同一份报告的 MIME 正文只生成一次，每封邮件只追加收件人等头部
+- send_emails: 多个用户（收件人组）的邮件并发发送
+"""
+
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from email import policy
+from email.header import Header
+from email.message import Message
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.utils import formataddr, formatdate, make_msgid
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+# === SMTP 邮件配置 ===
+SMTP_CONFIGS = {
+    # Gmail（使用 STARTTLS）
+    "gmail.com": {"server": "smtp.gmail.com", "port": 587, "encryption": "TLS"},
+    # QQ邮箱（使用 SSL，更稳定）
+    "qq.com": {"server": "smtp.qq.com", "port": 465, "encryption": "SSL"},
+    # Outlook（使用 STARTTLS）
+    "outlook.com": {"server": "smtp-mail.outlook.com", "port": 587, "encryption": "TLS"},
+    "hotmail.com": {"server": "smtp-mail.outlook.com", "port": 587, "encryption": "TLS"},
+    "live.com": {"server": "smtp-mail.outlook.com", "port": 587, "encryption": "TLS"},
+    # 网易邮箱（使用 SSL，更稳定）
+    "163.com": {"server": "smtp.163.com", "port": 465, "encryption": "SSL"},
+    "126.com": {"server": "smtp.126.com", "port": 465, "encryption": "SSL"},
+    # 新浪邮箱（使用 SSL）
+    "sina.com": {"server": "smtp.sina.com", "port": 465, "encryption": "SSL"},
+    # 搜狐邮箱（使用 SSL）
+    "sohu.com": {"server": "smtp.sohu.com", "port": 465, "encryption": "SSL"},
+    # 天翼邮箱（使用 SSL）
+    "189.cn": {"server": "smtp.189.cn", "port": 465, "encryption": "SSL"},
+    # 阿里云邮箱（使用 TLS）
+    "aliyun.com": {"server": "smtp.aliyun.com", "port": 465, "encryption": "TLS"},
+    # Yandex邮箱（使用 TLS）
+    "yandex.com": {"server": "smtp.yandex.com", "port": 465, "encryption": "TLS"},
+    # iCloud邮箱（使用 SSL）
+    "icloud.com": {"server": "smtp.mail.me.com", "port": 587, "encryption": "SSL"},
+}
+
+# 每个 SMTP 服务器的默认最大连接数
+DEFAULT_MAX_CONNECTIONS = 4
+
+# 空闲连接保留时间（秒），超过后不再复用（多数服务器数分钟无操作会断开）
+DEFAULT_IDLE_TIMEOUT = 60
+
+# 邮件按 SMTP 要求使用 CRLF 换行
+_SMTP_POLICY = policy.compat32.clone(linesep="\r\n")
+
+# (服务器, 端口, 是否 STARTTLS, 登录账号)
+SMTPKey = Tuple[str, int, bool, str]
+
+
+def resolve_smtp_server(
+    from_email: str,
+    custom_smtp_server: Optional[str] = None,
+    custom_smtp_port: Optional[int] = None,
+) -> Tuple[str, int, bool]:
+    """
+    确定 SMTP 服务器、端口和加密方式
+
+    Args:
+        from_email: 发件人邮箱
+        custom_smtp_server: 自定义 SMTP 服务器（可选）
+        custom_smtp_port: 自定义 SMTP 端口（可选）
+
+    Returns:
+        (服务器, 端口, 是否使用 STARTTLS) 元组，False 表示 SSL 模式
+    """
+    domain = from_email.split("@")[-1].lower()
+
+    if custom_smtp_server and custom_smtp_port:
+        # 使用自定义 SMTP 配置
+        smtp_port = int(custom_smtp_port)
+        # 根据端口判断加密方式：465=SSL, 587=TLS，其他端口优先尝试 TLS
+        return custom_smtp_server, smtp_port, smtp_port != 465
+
+    if domain in SMTP_CONFIGS:
+        # 使用预设配置
+        config = SMTP_CONFIGS[domain]
+        return config["server"], config["port"], config["encryption"] == "TLS"
+
+    print(f"未识别的邮箱服务商: {domain}，使用通用 SMTP 配置")
+    return f"smtp.{domain}", 587, True
+
+
+class SMTPConnectionPool:
+    """
+    SMTP 连接池
+
+    连接登录后放回池中复用，下一封邮件直接发送，无需重新握手和认证。
+    取出空闲连接时先发送 NOOP 确认连接仍然可用。
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        """
+        初始化连接池
+
+        Args:
+            max_connections: 每个 SMTP 服务器（及账号）的最大连接数
+            idle_timeout: 空闲连接保留时间（秒）
+        """
+        self.max_connections = max(1, max_connections)
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[SMTPKey, List[Tuple[smtplib.SMTP, float]]] = {}
+        # 每个服务器正在使用的连接数
+        self._in_use: Dict[SMTPKey, int] = {}
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+
+    def set_max_connections(self, max_connections: int) -> None:
+        """
+        调整每个服务器的最大连接数（正在使用的连接不受影响，之后的取用按新上限等待）
+
+        Args:
+            max_connections: 每个 SMTP 服务器（及账号）的最大连接数
+        """
+        with self._lock:
+            self.max_connections = max(1, max_connections)
+            self._released.notify_all()
+
+    def _acquire_slot(self, key: SMTPKey) -> None:
+        """等待服务器的连接名额"""
+        with self._lock:
+            while self._in_use.get(key, 0) >= self.max_connections:
+                self._released.wait()
+            self._in_use[key] = self._in_use.get(key, 0) + 1
+
+    def _release_slot(self, key: SMTPKey) -> None:
+        """归还服务器的连接名额"""
+        with self._lock:
+            self._in_use[key] -= 1
+            self._released.notify_all()
+
+    def _take_idle(self, key: SMTPKey) -> Optional[smtplib.SMTP]:
+        """取出一个仍可用的空闲连接"""
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                server, last_used = idle.pop()
+
+            if time.monotonic() - last_used <= self.idle_timeout:
+                try:
+                    if server.noop()[0] == 250:
+                        return server
+                except (smtplib.SMTPException, OSError):
+                    pass
+            _close_quietly(server)
+
+    @staticmethod
+    def _open(key: SMTPKey, password: str) -> smtplib.SMTP:
+        """建立连接并登录"""
+        smtp_server, smtp_port, use_tls, username = key
+        if use_tls:
+            # TLS 模式
+            server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
+            server.set_debuglevel(0)  # 设为1可以查看详细调试信息
+            server.ehlo()
+            server.starttls()
+            server.ehlo()
+        else:
+            # SSL 模式
+            server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
+            server.set_debuglevel(0)
+            server.ehlo()
+
+        try:
+            server.login(username, password)
+        except Exception:
+            _close_quietly(server)
+            raise
+        return server
+
+    @contextmanager
+    def connection(
+        self, smtp_server: str, smtp_port: int, use_tls: bool, username: str, password: str
+    ) -> Iterator[Tuple[smtplib.SMTP, bool]]:
+        """
+        获取已登录的连接（用完自动放回池中，出错时关闭）
+
+        Args:
+            smtp_server: SMTP 服务器
+            smtp_port: SMTP 端口
+            use_tls: 是否使用 STARTTLS（False 为 SSL 模式）
+            username: 登录账号
+            password: 密码/授权码
+
+        Yields:
+            (smtplib.SMTP 连接, 是否为复用的空闲连接) 元组
+        """
+        key = (smtp_server, smtp_port, use_tls, username)
+        self._acquire_slot(key)
+        try:
+            server = self._take_idle(key)
+            reused = server is not None
+            if server is None:
+                server = self._open(key, password)
+            try:
+                yield server, reused
+            except BaseException:
+                _close_quietly(server)
+                raise
+            with self._lock:
+                self._idle.setdefault(key, []).append((server, time.monotonic()))
+        finally:
+            self._release_slot(key)
+
+    def close_all(self) -> None:
+        """关闭所有空闲连接"""
+        with self._lock:
+            idle_lists = list(self._idle.values())
+            self._idle.clear()
+        for idle in idle_lists:
+            for server, _ in idle:
+                _close_quietly(server)
+
+
+def _close_quietly(server: smtplib.SMTP) -> None:
+    """关闭连接（忽略已断开等错误）"""
+    try:
+        server.quit()
+    except Exception:
+        try:
+            server.close()
+        except Exception:
+            pass
+
+
+_pool: Optional[SMTPConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_smtp_pool(max_connections: Optional[int] = None) -> SMTPConnectionPool:
+    """
+    获取共享的 SMTP 连接池
+
+    Args:
+        max_connections: 每个服务器的最大连接数（可选，与现有上限不同时原地调整，
+            已有连接继续使用）
+
+    Returns:
+        SMTPConnectionPool 对象
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SMTPConnectionPool(max_connections or DEFAULT_MAX_CONNECTIONS)
+        elif max_connections and max_connections != _pool.max_connections:
+            _pool.set_max_connections(max_connections)
+        return _pool
+
+
+def close_smtp_pool() -> None:
+    """关闭共享连接池中的所有连接"""
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close_all()
+
+
+class EmailReport:
+    """
+    报告邮件
+
+    报告的 MIME 正文（纯文本 + HTML）在创建时生成一次，发给不同收件人时
+    只生成 To、Date、Message-ID 头部并拼接到正文前。
+    """
+
+    def __init__(
+        self,
+        html_content: str,
+        report_type: str,
+        from_email: str,
+        now: Optional[datetime] = None,
+        sender_name: str = "TrendRadar",
+    ):
+        """
+        生成报告邮件正文
+
+        Args:
+            html_content: HTML 报告内容
+            report_type: 报告类型
+            from_email: 发件人邮箱
+            now: 报告时间（可选，默认当前时间）
+            sender_name: 发件人名称
+        """
+        now = now or datetime.now()
+        self.from_email = from_email
+        self.report_type = report_type
+
+        msg = MIMEMultipart("alternative")
+
+        # 严格按照 RFC 标准设置 From header
+        msg["From"] = formataddr((sender_name, from_email))
+
+        # 设置邮件主题
+        subject = f"TrendRadar 热点分析报告 - {report_type} - {now.strftime('%m月%d日 %H:%M')}"
+        msg["Subject"] = Header(subject, "utf-8")
+
+        # 设置其他标准 header
+        msg["MIME-Version"] = "1.0"
+
+        # 添加纯文本部分（作为备选）
+        text_content = f"""
+TrendRadar 热点分析报告
+========================
+报告类型：{report_type}
+生成时间：{now.strftime('%Y-%m-%d %H:%M:%S')}
+
+请使用支持HTML的邮件客户端查看完整报告内容。
+        """
+        msg.attach(MIMEText(text_content, "plain", "utf-8"))
+        msg.attach(MIMEText(html_content, "html", "utf-8"))
+
+        # 收件人相关头部在 to_bytes 中插入到公共头部与正文之间（其末尾带有空行）
+        head, _, body = msg.as_bytes(policy=_SMTP_POLICY).partition(b"\r\n\r\n")
+        self._head = head + b"\r\n"
+        self._body = body
+
+    @classmethod
+    def from_file(
+        cls,
+        html_file_path: str,
+        report_type: str,
+        from_email: str,
+        now: Optional[datetime] = None,
+    ) -> "EmailReport":
+        """从 HTML 报告文件生成邮件"""
+        with open(html_file_path, "r", encoding="utf-8") as f:
+            return cls(f.read(), report_type, from_email, now)
+
+    def to_bytes(self, recipients: Sequence[str]) -> bytes:
+        """
+        生成发给指定收件人的完整邮件
+
+        Args:
+            recipients: 收件人列表
+
+        Returns:
+            邮件内容（CRLF 换行）
+        """
+        headers = Message()
+        headers["To"] = recipients[0] if len(recipients) == 1 else ", ".join(recipients)
+        headers["Date"] = formatdate(localtime=True)
+        headers["Message-ID"] = make_msgid()
+        return self._head + headers.as_bytes(policy=_SMTP_POLICY) + self._body
+
+    def send(
+        self,
+        recipients: Sequence[str],
+        password: str,
+        smtp_server: str,
+        smtp_port: int,
+        use_tls: bool,
+        pool: Optional[SMTPConnectionPool] = None,
+    ) -> None:
+        """
+        通过连接池发送给指定收件人（一封邮件）
+
+        复用的空闲连接在发送信封（MAIL/RCPT）时被服务器断开的，换新连接重发一次；
+        新建连接上的失败以及开始传输正文（DATA）之后的失败不重发，避免重复投递。
+
+        Raises:
+            smtplib.SMTPException: 发送失败
+        """
+        pool = pool or get_smtp_pool()
+        message = self.to_bytes(recipients)
+        while True:
+            try:
+                with pool.connection(
+                    smtp_server, smtp_port, use_tls, self.from_email, password
+                ) as (server, reused):
+                    try:
+                        _send_envelope(server, self.from_email, recipients)
+                    except smtplib.SMTPServerDisconnected as e:
+                        if reused:
+                            raise _StaleConnection() from e
+                        raise
+                    code, resp = server.data(message)
+                    if code != 250:
+                        server.rset()
+                        raise smtplib.SMTPDataError(code, resp)
+                return
+            except _StaleConnection:
+                # 连接池中的其他空闲连接同样可能已失效，继续取用直到新建连接
+                continue
+
+
+class _StaleConnection(Exception):
+    """复用的空闲连接在发送正文前已被服务器断开"""
+
+
+def _send_envelope(server: smtplib.SMTP, from_email: str, recipients: Sequence[str]) -> None:
+    """
+    发送信封（MAIL FROM / RCPT TO），与 smtplib.SMTP.sendmail 的前半部分一致
+
+    Raises:
+        smtplib.SMTPSenderRefused: 发件人被拒绝
+        smtplib.SMTPRecipientsRefused: 所有收件人均被拒绝
+    """
+    server.ehlo_or_helo_if_needed()
+    code, resp = server.mail(from_email)
+    if code != 250:
+        if code == 421:
+            server.close()
+        else:
+            server.rset()
+        raise smtplib.SMTPSenderRefused(code, resp, from_email)
+
+    refused = {}
+    for recipient in recipients:
+        code, resp = server.rcpt(recipient)
+        if code not in (250, 251):
+            refused[recipient] = (code, resp)
+        if code == 421:
+            server.close()
+            raise smtplib.SMTPRecipientsRefused(refused)
+    if len(refused) == len(recipients):
+        server.rset()
+        raise smtplib.SMTPRecipientsRefused(refused)
+
+
+def _print_send_error(
+    error: Exception,
+    report_type: str,
+    recipients: Sequence[str],
+    smtp_server: str,
+    smtp_port: int,
+) -> None:
+    """按错误类型输出邮件发送失败原因"""
+    target = ", ".join(recipients)
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        print(f"邮件发送失败 -> {target}：服务器意外断开连接，请检查网络或稍后重试")
+    elif isinstance(error, smtplib.SMTPAuthenticationError):
+        print("邮件发送失败：认证错误，请检查邮箱和密码/授权码")
+        print(f"详细错误: {str(error)}")
+    elif isinstance(error, smtplib.SMTPRecipientsRefused):
+        print(f"邮件发送失败：收件人地址被拒绝 {error}")
+    elif isinstance(error, smtplib.SMTPSenderRefused):
+        print(f"邮件发送失败：发件人地址被拒绝 {error}")
+    elif isinstance(error, smtplib.SMTPDataError):
+        print(f"邮件发送失败 -> {target}：邮件数据错误 {error}")
+    elif isinstance(error, smtplib.SMTPConnectError):
+        print(f"邮件发送失败：无法连接到 SMTP 服务器 {smtp_server}:{smtp_port}")
+        print(f"详细错误: {str(error)}")
+    else:
+        print(f"邮件发送失败 [{report_type}] -> {target}：{error}")
+
+
+def send_emails(
+    from_email: str,
+    password: str,
+    deliveries: Sequence[Tuple[Sequence[str], str]],
+    report_type: str,
+    custom_smtp_server: Optional[str] = None,
+    custom_smtp_port: Optional[int] = None,
+    *,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    get_time_func: Callable = None,
+) -> List[bool]:
+    """
+    向多个用户发送报告邮件（每个用户一封，并发发送）
+
+    相同 HTML 报告文件的邮件正文只生成一次；同一 SMTP 服务器最多同时使用
+    max_connections 个连接，每个连接依次发送多封邮件。
+
+    Args:
+        from_email: 发件人邮箱
+        password: 邮箱密码/授权码
+        deliveries: [(收件人列表, HTML 报告文件路径), ...]，每项发送一封邮件
+        report_type: 报告类型
+        custom_smtp_server: 自定义 SMTP 服务器（可选）
+        custom_smtp_port: 自定义 SMTP 端口（可选）
+        max_connections: 每个 SMTP 服务器的最大连接数
+        get_time_func: 获取当前时间的函数
+
+    Returns:
+        与 deliveries 顺序一致的发送结果列表
+    """
+    if not deliveries:
+        return []
+
+    smtp_server, smtp_port, use_tls = resolve_smtp_server(
+        from_email, custom_smtp_server, custom_smtp_port
+    )
+    print(f"SMTP 服务器: {smtp_server}:{smtp_port}")
+    print(f"发件人: {from_email}")
+    pool = get_smtp_pool(max_connections)
+    now = get_time_func() if get_time_func else datetime.now()
+
+    # 每份报告只生成一次正文
+    reports: Dict[str, Optional[EmailReport]] = {}
+    for _, html_file_path in deliveries:
+        if html_file_path in reports:
+            continue
+        if html_file_path and Path(html_file_path).exists():
+            reports[html_file_path] = EmailReport.from_file(
+                html_file_path, report_type, from_email, now
+            )
+        else:
+            print(f"错误：HTML文件不存在或未提供: {html_file_path}")
+            reports[html_file_path] = None
+
+    def deliver(recipients: Sequence[str], html_file_path: str) -> bool:
+        report = reports[html_file_path]
+        if report is None:
+            return False
+        try:
+            report.send(recipients, password, smtp_server, smtp_port, use_tls, pool)
+            print(f"邮件发送成功 [{report_type}] -> {', '.join(recipients)}")
+            return True
+        except Exception as e:
+            _print_send_error(e, report_type, recipients, smtp_server, smtp_port)
+            return False
+
+    with ThreadPoolExecutor(max_workers=max(1, max_connections)) as executor:
+        futures = [
+            executor.submit(deliver, recipients, html_file_path)
+            for recipients, html_file_path in deliveries
+        ]
+        return [future.result() for future in futures]
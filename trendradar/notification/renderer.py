@@ -8,7 +8,7 @@
 from datetime import datetime
 from typing import Dict, Optional, Callable
 
-from trendradar.report.formatter import format_title_for_platform
+from trendradar.report.formatter import format_title_for_platform, render_title
 
 
 def render_feishu_content(
@@ -79,10 +79,8 @@ def render_feishu_content(
             )
 
             for j, title_data in enumerate(source_data["titles"], 1):
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
-                formatted_title = format_title_for_platform(
-                    "feishu", title_data_copy, show_source=False
+                formatted_title = render_title(
+                    "feishu", title_data, show_source=False, hide_new=True
                 )
                 new_titles_content += f"  {j}. {formatted_title}\n"
 
@@ -218,10 +216,8 @@ def render_dingtalk_content(
             new_titles_content += f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
 
             for j, title_data in enumerate(source_data["titles"], 1):
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
-                formatted_title = format_title_for_platform(
-                    "dingtalk", title_data_copy, show_source=False
+                formatted_title = render_title(
+                    "dingtalk", title_data, show_source=False, hide_new=True
                 )
                 new_titles_content += f"  {j}. {formatted_title}\n"
 
@@ -18,46 +18,17 @@
 import smtplib
 import time
 from datetime import datetime
-from email.header import Header
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.utils import formataddr, formatdate, make_msgid
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
 import requests
 
+from trendradar.utils.http_client import get_session
+
 from .batch import add_batch_headers, get_max_batch_header_size
 from .formatters import convert_markdown_to_mrkdwn, strip_markdown
-
-
-# === SMTP 邮件配置 ===
-SMTP_CONFIGS = {
-    # Gmail（使用 STARTTLS）
-    "gmail.com": {"server": "smtp.gmail.com", "port": 587, "encryption": "TLS"},
-    # QQ邮箱（使用 SSL，更稳定）
-    "qq.com": {"server": "smtp.qq.com", "port": 465, "encryption": "SSL"},
-    # Outlook（使用 STARTTLS）
-    "outlook.com": {"server": "smtp-mail.outlook.com", "port": 587, "encryption": "TLS"},
-    "hotmail.com": {"server": "smtp-mail.outlook.com", "port": 587, "encryption": "TLS"},
-    "live.com": {"server": "smtp-mail.outlook.com", "port": 587, "encryption": "TLS"},
-    # 网易邮箱（使用 SSL，更稳定）
-    "163.com": {"server": "smtp.163.com", "port": 465, "encryption": "SSL"},
-    "126.com": {"server": "smtp.126.com", "port": 465, "encryption": "SSL"},
-    # 新浪邮箱（使用 SSL）
-    "sina.com": {"server": "smtp.sina.com", "port": 465, "encryption": "SSL"},
-    # 搜狐邮箱（使用 SSL）
-    "sohu.com": {"server": "smtp.sohu.com", "port": 465, "encryption": "SSL"},
-    # 天翼邮箱（使用 SSL）
-    "189.cn": {"server": "smtp.189.cn", "port": 465, "encryption": "SSL"},
-    # 阿里云邮箱（使用 TLS）
-    "aliyun.com": {"server": "smtp.aliyun.com", "port": 465, "encryption": "TLS"},
-    # Yandex邮箱（使用 TLS）
-    "yandex.com": {"server": "smtp.yandex.com", "port": 465, "encryption": "TLS"},
-    # iCloud邮箱（使用 SSL）
-    "icloud.com": {"server": "smtp.mail.me.com", "port": 587, "encryption": "SSL"},
-}
+from .mailer import EmailReport, get_smtp_pool, resolve_smtp_server
 
 
 def send_to_feishu(
@@ -98,9 +69,7 @@ def send_to_feishu(
         bool: 发送是否成功
     """
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_session(proxy_url)
 
     # 日志前缀
     log_prefix = f"飞书{account_label}" if account_label else "飞书"
@@ -145,8 +114,8 @@ def send_to_feishu(
         }
 
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = session.post(
+                webhook_url, headers=headers, json=payload, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
@@ -211,9 +180,7 @@ def send_to_dingtalk(
         bool: 发送是否成功
     """
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_session(proxy_url)
 
     # 日志前缀
     log_prefix = f"钉钉{account_label}" if account_label else "钉钉"
@@ -251,8 +218,8 @@ def send_to_dingtalk(
         }
 
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = session.post(
+                webhook_url, headers=headers, json=payload, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
@@ -317,9 +284,7 @@ def send_to_wework(
         bool: 发送是否成功
     """
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_session(proxy_url)
 
     # 日志前缀
     log_prefix = f"企业微信{account_label}" if account_label else "企业微信"
@@ -366,8 +331,8 @@ def send_to_wework(
         )
 
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = session.post(
+                webhook_url, headers=headers, json=payload, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
@@ -434,9 +399,7 @@ def send_to_telegram(
     headers = {"Content-Type": "application/json"}
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_session(proxy_url)
 
     # 日志前缀
     log_prefix = f"Telegram{account_label}" if account_label else "Telegram"
@@ -469,8 +432,8 @@ def send_to_telegram(
         }
 
         try:
-            response = requests.post(
-                url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = session.post(
+                url, headers=headers, json=payload, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
@@ -507,9 +470,10 @@ def send_to_email(
     custom_smtp_port: Optional[int] = None,
     *,
     get_time_func: Callable = None,
+    max_connections: Optional[int] = None,
 ) -> bool:
     """
-    发送邮件通知
+    发送邮件通知（所有收件人共用一封邮件，复用连接池中已登录的 SMTP 连接）
 
     Args:
         from_email: 发件人邮箱
@@ -520,6 +484,7 @@ def send_to_email(
         custom_smtp_server: 自定义 SMTP 服务器（可选）
         custom_smtp_port: 自定义 SMTP 端口（可选）
         get_time_func: 获取当前时间的函数
+        max_connections: 每个 SMTP 服务器的最大连接数（可选）
 
     Returns:
         bool: 发送是否成功
@@ -530,97 +495,25 @@ def send_to_email(
             return False
 
         print(f"使用HTML文件: {html_file_path}")
-        with open(html_file_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
-
-        domain = from_email.split("@")[-1].lower()
-
-        if custom_smtp_server and custom_smtp_port:
-            # 使用自定义 SMTP 配置
-            smtp_server = custom_smtp_server
-            smtp_port = int(custom_smtp_port)
-            # 根据端口判断加密方式：465=SSL, 587=TLS
-            if smtp_port == 465:
-                use_tls = False  # SSL 模式（SMTP_SSL）
-            elif smtp_port == 587:
-                use_tls = True  # TLS 模式（STARTTLS）
-            else:
-                # 其他端口优先尝试 TLS（更安全，更广泛支持）
-                use_tls = True
-        elif domain in SMTP_CONFIGS:
-            # 使用预设配置
-            config = SMTP_CONFIGS[domain]
-            smtp_server = config["server"]
-            smtp_port = config["port"]
-            use_tls = config["encryption"] == "TLS"
-        else:
-            print(f"未识别的邮箱服务商: {domain}，使用通用 SMTP 配置")
-            smtp_server = f"smtp.{domain}"
-            smtp_port = 587
-            use_tls = True
-
-        msg = MIMEMultipart("alternative")
+        smtp_server, smtp_port, use_tls = resolve_smtp_server(
+            from_email, custom_smtp_server, custom_smtp_port
+        )
 
-        # 严格按照 RFC 标准设置 From header
-        sender_name = "TrendRadar"
-        msg["From"] = formataddr((sender_name, from_email))
+        now = get_time_func() if get_time_func else datetime.now()
+        report = EmailReport.from_file(html_file_path, report_type, from_email, now)
 
         # 设置收件人
         recipients = [addr.strip() for addr in to_email.split(",")]
-        if len(recipients) == 1:
-            msg["To"] = recipients[0]
-        else:
-            msg["To"] = ", ".join(recipients)
-
-        # 设置邮件主题
-        now = get_time_func() if get_time_func else datetime.now()
-        subject = f"TrendRadar 热点分析报告 - {report_type} - {now.strftime('%m月%d日 %H:%M')}"
-        msg["Subject"] = Header(subject, "utf-8")
-
-        # 设置其他标准 header
-        msg["MIME-Version"] = "1.0"
-        msg["Date"] = formatdate(localtime=True)
-        msg["Message-ID"] = make_msgid()
-
-        # 添加纯文本部分（作为备选）
-        text_content = f"""
-TrendRadar 热点分析报告
-========================
-报告类型：{report_type}
-生成时间：{now.strftime('%Y-%m-%d %H:%M:%S')}
-
-请使用支持HTML的邮件客户端查看完整报告内容。
-        """
-        text_part = MIMEText(text_content, "plain", "utf-8")
-        msg.attach(text_part)
-
-        html_part = MIMEText(html_content, "html", "utf-8")
-        msg.attach(html_part)
 
         print(f"正在发送邮件到 {to_email}...")
         print(f"SMTP 服务器: {smtp_server}:{smtp_port}")
         print(f"发件人: {from_email}")
 
         try:
-            if use_tls:
-                # TLS 模式
-                server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)  # 设为1可以查看详细调试信息
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
-            else:
-                # SSL 模式
-                server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)
-                server.ehlo()
-
-            # 登录
-            server.login(from_email, password)
-
-            # 发送邮件
-            server.send_message(msg)
-            server.quit()
+            report.send(
+                recipients, password, smtp_server, smtp_port, use_tls,
+                get_smtp_pool(max_connections),
+            )
 
             print(f"邮件发送成功 [{report_type}] -> {to_email}")
             return True
@@ -720,9 +613,7 @@ def send_to_ntfy(
         base_url = f"https://{base_url}"
     url = f"{base_url}/{topic}"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_session(proxy_url)
 
     # 获取分批内容，预留批次头部空间
     header_reserve = get_max_batch_header_size("ntfy")
@@ -765,11 +656,10 @@ def send_to_ntfy(
             current_headers["Title"] = f"{report_type_en} ({actual_batch_num}/{total_batches})"
 
         try:
-            response = requests.post(
+            response = session.post(
                 url,
                 headers=current_headers,
                 data=batch_content.encode("utf-8"),
-                proxies=proxies,
                 timeout=30,
             )
 
@@ -786,11 +676,10 @@ def send_to_ntfy(
                 )
                 time.sleep(10)  # 等待10秒后重试
                 # 重试一次
-                retry_response = requests.post(
+                retry_response = session.post(
                     url,
                     headers=current_headers,
                     data=batch_content.encode("utf-8"),
-                    proxies=proxies,
                     timeout=30,
                 )
                 if retry_response.status_code == 200:
@@ -872,9 +761,7 @@ def send_to_bark(
     # 日志前缀
     log_prefix = f"Bark{account_label}" if account_label else "Bark"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_session(proxy_url)
 
     # 解析 Bark URL，提取 device_key 和 API 端点
     # Bark URL 格式: https://api.day.app/device_key 或 https://bark.day.app/device_key
@@ -936,10 +823,9 @@ def send_to_bark(
         }
 
         try:
-            response = requests.post(
+            response = session.post(
                 api_endpoint,
                 json=payload,
-                proxies=proxies,
                 timeout=30,
             )
 
@@ -1021,9 +907,7 @@ def send_to_slack(
         bool: 发送是否成功
     """
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_session(proxy_url)
 
     # 日志前缀
     log_prefix = f"Slack{account_label}" if account_label else "Slack"
@@ -1055,8 +939,8 @@ def send_to_slack(
         payload = {"text": mrkdwn_content}
 
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = session.post(
+                webhook_url, headers=headers, json=payload, timeout=30
             )
 
             # Slack Incoming Webhooks 成功时返回 "ok" 文本
@@ -6,9 +6,9 @@
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 
-from trendradar.report.formatter import format_title_for_platform
+from trendradar.report.formatter import render_title
 from trendradar.utils.time import format_iso_time_friendly
 
 
@@ -20,6 +20,250 @@ DEFAULT_BATCH_SIZES = {
     "default": 4000,
 }
 
+# 格式类型 -> render_title 使用的平台（bark 与企业微信格式相同）
+_TITLE_PLATFORMS = {
+    "wework": "wework",
+    "bark": "wework",
+    "telegram": "telegram",
+    "ntfy": "ntfy",
+    "feishu": "feishu",
+    "dingtalk": "dingtalk",
+    "slack": "slack",
+}
+
+def _utf8_len(text: str) -> int:
+    """获取文本的 UTF-8 字节数"""
+    return len(text.encode("utf-8"))
+
+
+class _BatchBuilder:
+    """
+    按字节预算累积批次内容
+
+    维护当前批次的片段列表和 UTF-8 字节数，追加时只计算新片段的字节数，
+    批次完成时才拼接为字符串（判断条件与"整批编码 + 尾部 < max_bytes"一致）。
+    """
+
+    def __init__(self, base_header: str, base_footer: str, max_bytes: int):
+        self.base_header = base_header
+        self.base_footer = base_footer
+        self.budget = max_bytes - _utf8_len(base_footer)
+        self.batches: List[str] = []
+        self.parts = [base_header]
+        self.size = _utf8_len(base_header)
+        self.has_content = False
+
+    def add(self, text: str, *restart_prefix: str) -> None:
+        """
+        追加内容，当前批次容纳不下时开启新批次
+
+        Args:
+            text: 要追加的内容
+            restart_prefix: 开启新批次时放在基础头部之后、text 之前的内容（如区块标题）
+        """
+        text_bytes = _utf8_len(text)
+        if self.size + text_bytes < self.budget:
+            self.parts.append(text)
+            self.size += text_bytes
+        else:
+            self._flush()
+            self.parts = [self.base_header, *restart_prefix, text]
+            self.size = sum(_utf8_len(part) for part in self.parts)
+        self.has_content = True
+
+    def add_if_fits(self, text: str) -> None:
+        """仅在当前批次容纳得下时追加（用于分隔符）"""
+        text_bytes = _utf8_len(text)
+        if self.size + text_bytes < self.budget:
+            self.parts.append(text)
+            self.size += text_bytes
+
+    def append(self, text: str) -> None:
+        """不检查大小直接追加"""
+        self.parts.append(text)
+        self.size += _utf8_len(text)
+
+    def _flush(self) -> None:
+        """完成当前批次"""
+        if self.has_content:
+            self.batches.append("".join(self.parts) + self.base_footer)
+
+    def finish(self) -> List[str]:
+        """完成最后批次并返回所有批次"""
+        self._flush()
+        self.parts = [self.base_header]
+        self.size = _utf8_len(self.base_header)
+        self.has_content = False
+        return self.batches
+
+
+def _render_title(
+    format_type: Optional[str],
+    title_data: Dict,
+    show_source: bool,
+    show_keyword: bool = False,
+    hide_new: bool = False,
+) -> str:
+    """
+    渲染单条标题（渲染结果缓存在标题片段中，多个渠道、多个账号分批时复用）
+
+    Args:
+        format_type: 格式类型（不支持的格式或 None 时只输出标题文本）
+        title_data: 标题数据
+        show_source: 是否显示来源
+        show_keyword: 是否显示关键词
+        hide_new: 是否不显示新增标记（新增区块中使用）
+
+    Returns:
+        格式化后的标题
+    """
+    platform = _TITLE_PLATFORMS.get(format_type)
+    if platform is None:
+        return f"{title_data['title']}"
+    return render_title(
+        platform, title_data, show_source=show_source, show_keyword=show_keyword, hide_new=hide_new
+    )
+
+
+def _format_word_header(format_type: str, sequence_display: str, word: str, count: int) -> str:
+    """构建关键词组标题（热榜统计与 RSS 统计共用）"""
+    if format_type in ("wework", "bark", "ntfy", "dingtalk"):
+        if count >= 10:
+            return f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
+        if count >= 5:
+            return f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
+        return f"📌 {sequence_display} **{word}** : {count} 条\n\n"
+    if format_type == "telegram":
+        if count >= 10:
+            return f"🔥 {sequence_display} {word} : {count} 条\n\n"
+        if count >= 5:
+            return f"📈 {sequence_display} {word} : {count} 条\n\n"
+        return f"📌 {sequence_display} {word} : {count} 条\n\n"
+    if format_type == "feishu":
+        if count >= 10:
+            return f"🔥 <font color='grey'>{sequence_display}</font> **{word}** : <font color='red'>{count}</font> 条\n\n"
+        if count >= 5:
+            return f"📈 <font color='grey'>{sequence_display}</font> **{word}** : <font color='orange'>{count}</font> 条\n\n"
+        return f"📌 <font color='grey'>{sequence_display}</font> **{word}** : {count} 条\n\n"
+    if format_type == "slack":
+        if count >= 10:
+            return f"🔥 {sequence_display} *{word}* : *{count}* 条\n\n"
+        if count >= 5:
+            return f"📈 {sequence_display} *{word}* : *{count}* 条\n\n"
+        return f"📌 {sequence_display} *{word}* : {count} 条\n\n"
+    return ""
+
+
+def _format_source_header(format_type: str, source_name: str, count: int) -> str:
+    """构建新增区块的来源标题（热榜新增与 RSS 新增共用）"""
+    if format_type in ("wework", "bark", "ntfy", "feishu", "dingtalk"):
+        return f"**{source_name}** ({count} 条):\n\n"
+    if format_type == "telegram":
+        return f"{source_name} ({count} 条):\n\n"
+    if format_type == "slack":
+        return f"*{source_name}* ({count} 条):\n\n"
+    return ""
+
+
+def _group_separator(format_type: str, feishu_separator: str) -> str:
+    """关键词组之间的分隔符"""
+    if format_type in ("wework", "bark"):
+        return "\n\n\n\n"
+    if format_type in ("telegram", "ntfy", "slack"):
+        return "\n\n"
+    if format_type == "feishu":
+        return f"\n{feishu_separator}\n\n"
+    if format_type == "dingtalk":
+        return "\n---\n\n"
+    return ""
+
+
+def _add_keyword_groups(
+    builder: _BatchBuilder,
+    stats: list,
+    section_header: str,
+    format_type: str,
+    feishu_separator: str,
+    show_source: bool,
+    show_keyword: bool = False,
+) -> None:
+    """
+    按关键词分组写入统计区块（热榜统计与 RSS 统计共用，区块标题由调用方写入）
+
+    词组标题与第一条新闻作为整体写入，保证不会单独出现在批次末尾。
+    """
+    total_count = len(stats)
+
+    for i, stat in enumerate(stats):
+        titles = stat["titles"]
+        word_header = _format_word_header(
+            format_type, f"[{i + 1}/{total_count}]", stat["word"], stat["count"]
+        )
+
+        # 构建第一条新闻
+        first_news_line = ""
+        if titles:
+            formatted_title = _render_title(
+                format_type, titles[0], show_source, show_keyword
+            )
+            first_news_line = f"  1. {formatted_title}\n"
+            if len(titles) > 1:
+                first_news_line += "\n"
+
+        # 原子性检查：词组标题+第一条新闻必须一起处理
+        builder.add(word_header + first_news_line, section_header)
+
+        # 处理剩余新闻条目
+        for j in range(1, len(titles)):
+            formatted_title = _render_title(
+                format_type, titles[j], show_source, show_keyword
+            )
+            news_line = f"  {j + 1}. {formatted_title}\n"
+            if j < len(titles) - 1:
+                news_line += "\n"
+            builder.add(news_line, section_header, word_header)
+
+        # 词组间分隔符
+        if i < total_count - 1:
+            builder.add_if_fits(_group_separator(format_type, feishu_separator))
+
+
+def _add_source_groups(
+    builder: _BatchBuilder,
+    sources: List[Tuple[str, list]],
+    section_header: str,
+    title_format: Optional[str],
+    format_type: str,
+) -> None:
+    """
+    按来源分组写入新增区块（热榜新增与 RSS 新增共用，区块标题由调用方写入）
+
+    来源标题与第一条新闻作为整体写入；新增区块中不显示来源和新增标记。
+    """
+    for source_name, titles in sources:
+        source_header = _format_source_header(format_type, source_name, len(titles))
+
+        # 构建第一条新增新闻
+        first_news_line = ""
+        if titles:
+            formatted_title = _render_title(
+                title_format, titles[0], show_source=False, hide_new=True
+            )
+            first_news_line = f"  1. {formatted_title}\n"
+
+        # 原子性检查：来源标题+第一条新闻
+        builder.add(source_header + first_news_line, section_header)
+
+        # 处理剩余新增新闻
+        for j in range(1, len(titles)):
+            formatted_title = _render_title(
+                title_format, titles[j], show_source=False, hide_new=True
+            )
+            builder.add(f"  {j + 1}. {formatted_title}\n", section_header, source_header)
+
+        # 来源间添加空行
+        builder.append("\n")
+
 
 def split_content_into_batches(
     report_data: Dict,
@@ -72,8 +316,6 @@ def split_content_into_batches(
         else:
             max_bytes = sizes.get("default", 4000)
 
-    batches = []
-
     total_titles = sum(
         len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
     )
@@ -139,9 +381,6 @@ def split_content_into_batches(
         elif format_type == "slack":
             stats_header = f"📊 *{stats_title}*\n\n"
 
-    current_batch = base_header
-    current_batch_has_content = False
-
     if (
         not report_data["stats"]
         and not report_data["new_titles"]
@@ -154,233 +393,32 @@ def split_content_into_batches(
         else:
             mode_text = "暂无匹配的热点词汇"
         simple_content = f"📭 {mode_text}\n\n"
-        final_content = base_header + simple_content + base_footer
-        batches.append(final_content)
-        return batches
+        return [base_header + simple_content + base_footer]
+
+    builder = _BatchBuilder(base_header, base_footer, max_bytes)
 
     # 定义处理热点词汇统计的函数
-    def process_stats_section(current_batch, current_batch_has_content, batches):
+    def process_stats_section():
         """处理热点词汇统计"""
         if not report_data["stats"]:
-            return current_batch, current_batch_has_content, batches
-
-        total_count = len(report_data["stats"])
+            return
 
         # 添加统计标题
-        test_content = current_batch + stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
-            current_batch_has_content = True
-        else:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + stats_header
-            current_batch_has_content = True
+        builder.add(stats_header)
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
-        for i, stat in enumerate(report_data["stats"]):
-            word = stat["word"]
-            count = stat["count"]
-            sequence_display = f"[{i + 1}/{total_count}]"
-
-            # 构建词组标题
-            word_header = ""
-            if format_type in ("wework", "bark"):
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} **{word}** : {count} 条\n\n"
-            elif format_type == "telegram":
-                if count >= 10:
-                    word_header = f"🔥 {sequence_display} {word} : {count} 条\n\n"
-                elif count >= 5:
-                    word_header = f"📈 {sequence_display} {word} : {count} 条\n\n"
-                else:
-                    word_header = f"📌 {sequence_display} {word} : {count} 条\n\n"
-            elif format_type == "ntfy":
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} **{word}** : {count} 条\n\n"
-            elif format_type == "feishu":
-                if count >= 10:
-                    word_header = f"🔥 <font color='grey'>{sequence_display}</font> **{word}** : <font color='red'>{count}</font> 条\n\n"
-                elif count >= 5:
-                    word_header = f"📈 <font color='grey'>{sequence_display}</font> **{word}** : <font color='orange'>{count}</font> 条\n\n"
-                else:
-                    word_header = f"📌 <font color='grey'>{sequence_display}</font> **{word}** : {count} 条\n\n"
-            elif format_type == "dingtalk":
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} **{word}** : {count} 条\n\n"
-            elif format_type == "slack":
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} *{word}* : *{count}* 条\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} *{word}* : *{count}* 条\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} *{word}* : {count} 条\n\n"
-
-            # 构建第一条新闻
-            # display_mode: keyword=显示来源, platform=显示关键词
-            show_source = display_mode == "keyword"
-            show_keyword = display_mode == "platform"
-            first_news_line = ""
-            if stat["titles"]:
-                first_title_data = stat["titles"][0]
-                if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", first_title_data, show_source=show_source, show_keyword=show_keyword
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", first_title_data, show_source=show_source, show_keyword=show_keyword
-                    )
-                elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
-                        "ntfy", first_title_data, show_source=show_source, show_keyword=show_keyword
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", first_title_data, show_source=show_source, show_keyword=show_keyword
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", first_title_data, show_source=show_source, show_keyword=show_keyword
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", first_title_data, show_source=show_source, show_keyword=show_keyword
-                    )
-                else:
-                    formatted_title = f"{first_title_data['title']}"
-
-                first_news_line = f"  1. {formatted_title}\n"
-                if len(stat["titles"]) > 1:
-                    first_news_line += "\n"
-
-            # 原子性检查：词组标题+第一条新闻必须一起处理
-            word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                # 当前批次容纳不下，开启新批次
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
-
-            # 处理剩余新闻条目
-            for j in range(start_index, len(stat["titles"])):
-                title_data = stat["titles"][j]
-                if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data, show_source=show_source, show_keyword=show_keyword
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data, show_source=show_source, show_keyword=show_keyword
-                    )
-                elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
-                        "ntfy", title_data, show_source=show_source, show_keyword=show_keyword
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data, show_source=show_source, show_keyword=show_keyword
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data, show_source=show_source, show_keyword=show_keyword
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data, show_source=show_source, show_keyword=show_keyword
-                    )
-                else:
-                    formatted_title = f"{title_data['title']}"
-
-                news_line = f"  {j + 1}. {formatted_title}\n"
-                if j < len(stat["titles"]) - 1:
-                    news_line += "\n"
-
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
-
-            # 词组间分隔符
-            if i < len(report_data["stats"]) - 1:
-                separator = ""
-                if format_type in ("wework", "bark"):
-                    separator = f"\n\n\n\n"
-                elif format_type == "telegram":
-                    separator = f"\n\n"
-                elif format_type == "ntfy":
-                    separator = f"\n\n"
-                elif format_type == "feishu":
-                    separator = f"\n{feishu_separator}\n\n"
-                elif format_type == "dingtalk":
-                    separator = f"\n---\n\n"
-                elif format_type == "slack":
-                    separator = f"\n\n"
-
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
-
-        return current_batch, current_batch_has_content, batches
+        # display_mode: keyword=显示来源, platform=显示关键词
+        _add_keyword_groups(
+            builder, report_data["stats"], stats_header, format_type, feishu_separator,
+            show_source=display_mode == "keyword",
+            show_keyword=display_mode == "platform",
+        )
 
     # 定义处理新增新闻的函数
-    def process_new_titles_section(current_batch, current_batch_has_content, batches):
+    def process_new_titles_section():
         """处理新增新闻"""
         if not report_data["new_titles"]:
-            return current_batch, current_batch_has_content, batches
+            return
 
         new_header = ""
         if format_type in ("wework", "bark"):
@@ -398,177 +436,49 @@ def split_content_into_batches(
         elif format_type == "slack":
             new_header = f"\n\n🆕 *本次新增热点新闻* (共 {report_data['total_new_count']} 条)\n\n"
 
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
-
-        # 逐个处理新增新闻来源
-        for source_data in report_data["new_titles"]:
-            source_header = ""
-            if format_type in ("wework", "bark"):
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
-            elif format_type == "telegram":
-                source_header = f"{source_data['source_name']} ({len(source_data['titles'])} 条):\n\n"
-            elif format_type == "ntfy":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
-            elif format_type == "feishu":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
-            elif format_type == "dingtalk":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
-            elif format_type == "slack":
-                source_header = f"*{source_data['source_name']}* ({len(source_data['titles'])} 条):\n\n"
-
-            # 构建第一条新增新闻
-            first_news_line = ""
-            if source_data["titles"]:
-                first_title_data = source_data["titles"][0]
-                title_data_copy = first_title_data.copy()
-                title_data_copy["is_new"] = False
-
-                if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
-
-                first_news_line = f"  1. {formatted_title}\n"
-
-            # 原子性检查：来源标题+第一条新闻
-            source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
-
-            # 处理剩余新增新闻
-            for j in range(start_index, len(source_data["titles"])):
-                title_data = source_data["titles"][j]
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
-
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
-
-                news_line = f"  {j + 1}. {formatted_title}\n"
-
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
-
-            current_batch += "\n"
-
-        return current_batch, current_batch_has_content, batches
+        builder.add(new_header)
+
+        # 逐个处理新增新闻来源（ntfy 的热榜新增只显示标题文本）
+        _add_source_groups(
+            builder,
+            [(source["source_name"], source["titles"]) for source in report_data["new_titles"]],
+            new_header,
+            None if format_type == "ntfy" else format_type,
+            format_type,
+        )
 
     # 根据配置决定处理顺序
     if reverse_content_order:
         # 新增热点在前，热点词汇统计在后
         # 1. 处理热榜新增
-        current_batch, current_batch_has_content, batches = process_new_titles_section(
-            current_batch, current_batch_has_content, batches
-        )
+        process_new_titles_section()
         # 2. 处理 RSS 新增（如果有）
         if rss_new_items:
-            current_batch, current_batch_has_content, batches = _process_rss_new_titles_section(
-                rss_new_items, format_type, feishu_separator, base_header, base_footer,
-                max_bytes, current_batch, current_batch_has_content, batches, timezone
+            _process_rss_new_titles_section(
+                rss_new_items, format_type, feishu_separator, builder, timezone
             )
         # 3. 处理热榜统计
-        current_batch, current_batch_has_content, batches = process_stats_section(
-            current_batch, current_batch_has_content, batches
-        )
+        process_stats_section()
         # 4. 处理 RSS 统计（如果有）
         if rss_items:
-            current_batch, current_batch_has_content, batches = _process_rss_stats_section(
-                rss_items, format_type, feishu_separator, base_header, base_footer,
-                max_bytes, current_batch, current_batch_has_content, batches, timezone
+            _process_rss_stats_section(
+                rss_items, format_type, feishu_separator, builder, timezone
             )
     else:
         # 默认：热点词汇统计在前，新增热点在后
         # 1. 处理热榜统计
-        current_batch, current_batch_has_content, batches = process_stats_section(
-            current_batch, current_batch_has_content, batches
-        )
+        process_stats_section()
         # 2. 处理 RSS 统计（如果有）
         if rss_items:
-            current_batch, current_batch_has_content, batches = _process_rss_stats_section(
-                rss_items, format_type, feishu_separator, base_header, base_footer,
-                max_bytes, current_batch, current_batch_has_content, batches, timezone
+            _process_rss_stats_section(
+                rss_items, format_type, feishu_separator, builder, timezone
             )
         # 3. 处理热榜新增
-        current_batch, current_batch_has_content, batches = process_new_titles_section(
-            current_batch, current_batch_has_content, batches
-        )
+        process_new_titles_section()
         # 4. 处理 RSS 新增（如果有）
         if rss_new_items:
-            current_batch, current_batch_has_content, batches = _process_rss_new_titles_section(
-                rss_new_items, format_type, feishu_separator, base_header, base_footer,
-                max_bytes, current_batch, current_batch_has_content, batches, timezone
+            _process_rss_new_titles_section(
+                rss_new_items, format_type, feishu_separator, builder, timezone
             )
 
     if report_data["failed_ids"]:
@@ -584,20 +494,9 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             failed_header = f"\n---\n\n⚠️ **数据获取失败的平台：**\n\n"
 
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        builder.add(failed_header)
 
-        for i, id_value in enumerate(report_data["failed_ids"], 1):
+        for id_value in report_data["failed_ids"]:
             if format_type == "feishu":
                 failed_line = f"  • <font color='red'>{id_value}</font>\n"
             elif format_type == "dingtalk":
@@ -605,38 +504,19 @@ def split_content_into_batches(
             else:
                 failed_line = f"  • {id_value}\n"
 
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            builder.add(failed_line, failed_header)
 
     # 完成最后批次
-    if current_batch_has_content:
-        batches.append(current_batch + base_footer)
-
-    return batches
+    return builder.finish()
 
 
 def _process_rss_stats_section(
     rss_stats: list,
     format_type: str,
     feishu_separator: str,
-    base_header: str,
-    base_footer: str,
-    max_bytes: int,
-    current_batch: str,
-    current_batch_has_content: bool,
-    batches: List[str],
+    builder: _BatchBuilder,
     timezone: str = "Asia/Shanghai",
-) -> tuple:
+) -> None:
     """处理 RSS 统计区块（按关键词分组，与热榜统计格式一致）
 
     Args:
@@ -644,23 +524,14 @@ def _process_rss_stats_section(
             [{"word": "AI", "count": 5, "titles": [...]}]
         format_type: 格式类型
         feishu_separator: 飞书分隔符
-        base_header: 基础头部
-        base_footer: 基础尾部
-        max_bytes: 最大字节数
-        current_batch: 当前批次内容
-        current_batch_has_content: 当前批次是否有内容
-        batches: 已完成的批次列表
+        builder: 批次累积器
         timezone: 时区名称
-
-    Returns:
-        (current_batch, current_batch_has_content, batches) 元组
     """
     if not rss_stats:
-        return current_batch, current_batch_has_content, batches
+        return
 
     # 计算总条目数
     total_items = sum(stat["count"] for stat in rss_stats)
-    total_keywords = len(rss_stats)
 
     # RSS 统计区块标题
     rss_header = ""
@@ -676,172 +547,22 @@ def _process_rss_stats_section(
         rss_header = f"\n\n📰 **RSS 订阅统计** (共 {total_items} 条)\n\n"
 
     # 添加 RSS 标题
-    test_content = current_batch + rss_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-        current_batch = test_content
-        current_batch_has_content = True
-    else:
-        if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + rss_header
-        current_batch_has_content = True
+    builder.add(rss_header)
 
     # 逐个处理关键词组（与热榜一致）
-    for i, stat in enumerate(rss_stats):
-        word = stat["word"]
-        count = stat["count"]
-        sequence_display = f"[{i + 1}/{total_keywords}]"
-
-        # 构建关键词标题（与热榜格式一致）
-        word_header = ""
-        if format_type in ("wework", "bark"):
-            if count >= 10:
-                word_header = f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
-            elif count >= 5:
-                word_header = f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
-            else:
-                word_header = f"📌 {sequence_display} **{word}** : {count} 条\n\n"
-        elif format_type == "telegram":
-            if count >= 10:
-                word_header = f"🔥 {sequence_display} {word} : {count} 条\n\n"
-            elif count >= 5:
-                word_header = f"📈 {sequence_display} {word} : {count} 条\n\n"
-            else:
-                word_header = f"📌 {sequence_display} {word} : {count} 条\n\n"
-        elif format_type == "ntfy":
-            if count >= 10:
-                word_header = f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
-            elif count >= 5:
-                word_header = f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
-            else:
-                word_header = f"📌 {sequence_display} **{word}** : {count} 条\n\n"
-        elif format_type == "feishu":
-            if count >= 10:
-                word_header = f"🔥 <font color='grey'>{sequence_display}</font> **{word}** : <font color='red'>{count}</font> 条\n\n"
-            elif count >= 5:
-                word_header = f"📈 <font color='grey'>{sequence_display}</font> **{word}** : <font color='orange'>{count}</font> 条\n\n"
-            else:
-                word_header = f"📌 <font color='grey'>{sequence_display}</font> **{word}** : {count} 条\n\n"
-        elif format_type == "dingtalk":
-            if count >= 10:
-                word_header = f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
-            elif count >= 5:
-                word_header = f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
-            else:
-                word_header = f"📌 {sequence_display} **{word}** : {count} 条\n\n"
-        elif format_type == "slack":
-            if count >= 10:
-                word_header = f"🔥 {sequence_display} *{word}* : *{count}* 条\n\n"
-            elif count >= 5:
-                word_header = f"📈 {sequence_display} *{word}* : *{count}* 条\n\n"
-            else:
-                word_header = f"📌 {sequence_display} *{word}* : {count} 条\n\n"
-
-        # 构建第一条新闻（使用 format_title_for_platform）
-        first_news_line = ""
-        if stat["titles"]:
-            first_title_data = stat["titles"][0]
-            if format_type in ("wework", "bark"):
-                formatted_title = format_title_for_platform("wework", first_title_data, show_source=True)
-            elif format_type == "telegram":
-                formatted_title = format_title_for_platform("telegram", first_title_data, show_source=True)
-            elif format_type == "ntfy":
-                formatted_title = format_title_for_platform("ntfy", first_title_data, show_source=True)
-            elif format_type == "feishu":
-                formatted_title = format_title_for_platform("feishu", first_title_data, show_source=True)
-            elif format_type == "dingtalk":
-                formatted_title = format_title_for_platform("dingtalk", first_title_data, show_source=True)
-            elif format_type == "slack":
-                formatted_title = format_title_for_platform("slack", first_title_data, show_source=True)
-            else:
-                formatted_title = f"{first_title_data['title']}"
-
-            first_news_line = f"  1. {formatted_title}\n"
-            if len(stat["titles"]) > 1:
-                first_news_line += "\n"
-
-        # 原子性检查：关键词标题 + 第一条新闻必须一起处理
-        word_with_first_news = word_header + first_news_line
-        test_content = current_batch + word_with_first_news
-
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + rss_header + word_with_first_news
-            current_batch_has_content = True
-            start_index = 1
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
-            start_index = 1
-
-        # 处理剩余新闻条目
-        for j in range(start_index, len(stat["titles"])):
-            title_data = stat["titles"][j]
-            if format_type in ("wework", "bark"):
-                formatted_title = format_title_for_platform("wework", title_data, show_source=True)
-            elif format_type == "telegram":
-                formatted_title = format_title_for_platform("telegram", title_data, show_source=True)
-            elif format_type == "ntfy":
-                formatted_title = format_title_for_platform("ntfy", title_data, show_source=True)
-            elif format_type == "feishu":
-                formatted_title = format_title_for_platform("feishu", title_data, show_source=True)
-            elif format_type == "dingtalk":
-                formatted_title = format_title_for_platform("dingtalk", title_data, show_source=True)
-            elif format_type == "slack":
-                formatted_title = format_title_for_platform("slack", title_data, show_source=True)
-            else:
-                formatted_title = f"{title_data['title']}"
-
-            news_line = f"  {j + 1}. {formatted_title}\n"
-            if j < len(stat["titles"]) - 1:
-                news_line += "\n"
-
-            test_content = current_batch + news_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + rss_header + word_header + news_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-
-        # 关键词间分隔符
-        if i < len(rss_stats) - 1:
-            separator = ""
-            if format_type in ("wework", "bark"):
-                separator = "\n\n\n\n"
-            elif format_type == "telegram":
-                separator = "\n\n"
-            elif format_type == "ntfy":
-                separator = "\n\n"
-            elif format_type == "feishu":
-                separator = f"\n{feishu_separator}\n\n"
-            elif format_type == "dingtalk":
-                separator = "\n---\n\n"
-            elif format_type == "slack":
-                separator = "\n\n"
-
-            test_content = current_batch + separator
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-                current_batch = test_content
-
-    return current_batch, current_batch_has_content, batches
+    _add_keyword_groups(
+        builder, rss_stats, rss_header, format_type, feishu_separator,
+        show_source=True,
+    )
 
 
 def _process_rss_new_titles_section(
     rss_new_stats: list,
     format_type: str,
     feishu_separator: str,
-    base_header: str,
-    base_footer: str,
-    max_bytes: int,
-    current_batch: str,
-    current_batch_has_content: bool,
-    batches: List[str],
+    builder: _BatchBuilder,
     timezone: str = "Asia/Shanghai",
-) -> tuple:
+) -> None:
     """处理 RSS 新增区块（按来源分组，与热榜新增格式一致）
 
     Args:
@@ -849,19 +570,11 @@ def _process_rss_new_titles_section(
             [{"word": "AI", "count": 5, "titles": [...]}]
         format_type: 格式类型
         feishu_separator: 飞书分隔符
-        base_header: 基础头部
-        base_footer: 基础尾部
-        max_bytes: 最大字节数
-        current_batch: 当前批次内容
-        current_batch_has_content: 当前批次是否有内容
-        batches: 已完成的批次列表
+        builder: 批次累积器
         timezone: 时区名称
-
-    Returns:
-        (current_batch, current_batch_has_content, batches) 元组
     """
     if not rss_new_stats:
-        return current_batch, current_batch_has_content, batches
+        return
 
     # 从关键词分组中提取所有条目，重新按来源分组
     source_map = {}
@@ -873,7 +586,7 @@ def _process_rss_new_titles_section(
             source_map[source_name].append(title_data)
 
     if not source_map:
-        return current_batch, current_batch_has_content, batches
+        return
 
     # 计算总条目数
     total_items = sum(len(titles) for titles in source_map.values())
@@ -894,108 +607,12 @@ def _process_rss_new_titles_section(
         new_header = f"\n\n🆕 *RSS 本次新增* (共 {total_items} 条)\n\n"
 
     # 添加 RSS 新增标题
-    test_content = current_batch + new_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-        if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + new_header
-        current_batch_has_content = True
-    else:
-        current_batch = test_content
-        current_batch_has_content = True
+    builder.add(new_header)
 
     # 按来源分组显示（与热榜新增格式一致）
-    source_list = list(source_map.items())
-    for i, (source_name, titles) in enumerate(source_list):
-        count = len(titles)
-
-        # 构建来源标题（与热榜新增格式一致）
-        source_header = ""
-        if format_type in ("wework", "bark"):
-            source_header = f"**{source_name}** ({count} 条):\n\n"
-        elif format_type == "telegram":
-            source_header = f"{source_name} ({count} 条):\n\n"
-        elif format_type == "ntfy":
-            source_header = f"**{source_name}** ({count} 条):\n\n"
-        elif format_type == "feishu":
-            source_header = f"**{source_name}** ({count} 条):\n\n"
-        elif format_type == "dingtalk":
-            source_header = f"**{source_name}** ({count} 条):\n\n"
-        elif format_type == "slack":
-            source_header = f"*{source_name}* ({count} 条):\n\n"
-
-        # 构建第一条新闻（不显示来源，禁用 new emoji）
-        first_news_line = ""
-        if titles:
-            first_title_data = titles[0].copy()
-            first_title_data["is_new"] = False
-            if format_type in ("wework", "bark"):
-                formatted_title = format_title_for_platform("wework", first_title_data, show_source=False)
-            elif format_type == "telegram":
-                formatted_title = format_title_for_platform("telegram", first_title_data, show_source=False)
-            elif format_type == "ntfy":
-                formatted_title = format_title_for_platform("ntfy", first_title_data, show_source=False)
-            elif format_type == "feishu":
-                formatted_title = format_title_for_platform("feishu", first_title_data, show_source=False)
-            elif format_type == "dingtalk":
-                formatted_title = format_title_for_platform("dingtalk", first_title_data, show_source=False)
-            elif format_type == "slack":
-                formatted_title = format_title_for_platform("slack", first_title_data, show_source=False)
-            else:
-                formatted_title = f"{first_title_data['title']}"
-
-            first_news_line = f"  1. {formatted_title}\n"
-
-        # 原子性检查：来源标题 + 第一条新闻必须一起处理
-        source_with_first_news = source_header + first_news_line
-        test_content = current_batch + source_with_first_news
-
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header + source_with_first_news
-            current_batch_has_content = True
-            start_index = 1
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
-            start_index = 1
-
-        # 处理剩余新闻条目（禁用 new emoji）
-        for j in range(start_index, len(titles)):
-            title_data = titles[j].copy()
-            title_data["is_new"] = False
-            if format_type in ("wework", "bark"):
-                formatted_title = format_title_for_platform("wework", title_data, show_source=False)
-            elif format_type == "telegram":
-                formatted_title = format_title_for_platform("telegram", title_data, show_source=False)
-            elif format_type == "ntfy":
-                formatted_title = format_title_for_platform("ntfy", title_data, show_source=False)
-            elif format_type == "feishu":
-                formatted_title = format_title_for_platform("feishu", title_data, show_source=False)
-            elif format_type == "dingtalk":
-                formatted_title = format_title_for_platform("dingtalk", title_data, show_source=False)
-            elif format_type == "slack":
-                formatted_title = format_title_for_platform("slack", title_data, show_source=False)
-            else:
-                formatted_title = f"{title_data['title']}"
-
-            news_line = f"  {j + 1}. {formatted_title}\n"
-
-            test_content = current_batch + news_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_header + news_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-
-        # 来源间添加空行（与热榜新增格式一致）
-        current_batch += "\n"
-
-    return current_batch, current_batch_has_content, batches
+    _add_source_groups(
+        builder, list(source_map.items()), new_header, format_type, format_type
+    )
 
 
 def _format_rss_item_line(
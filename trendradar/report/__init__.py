@@ -8,6 +8,7 @@
 
 模块结构：
 - helpers: 报告辅助函数（清理、转义、格式化）
+- fragments: 标题渲染片段（各格式共享的中间结果）
 - formatter: 平台标题格式化
 - html: HTML 报告渲染
 - generator: 报告生成器
@@ -18,7 +19,12 @@ from trendradar.report.helpers import (
     html_escape,
     format_rank_display,
 )
-from trendradar.report.formatter import format_title_for_platform
+from trendradar.report.fragments import (
+    TitleFragment,
+    get_title_fragment,
+    clear_fragments,
+)
+from trendradar.report.formatter import format_title_for_platform, render_title
 from trendradar.report.html import render_html_content
 from trendradar.report.generator import (
     prepare_report_data,
@@ -30,8 +36,13 @@ __all__ = [
     "clean_title",
     "html_escape",
     "format_rank_display",
+    # 渲染片段
+    "TitleFragment",
+    "get_title_fragment",
+    "clear_fragments",
     # 格式化函数
     "format_title_for_platform",
+    "render_title",
     # HTML 渲染
     "render_html_content",
     # 报告生成器
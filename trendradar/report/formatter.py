@@ -2,12 +2,14 @@
 """
 平台标题格式化模块
 
-提供多平台标题格式化功能
+提供多平台标题格式化功能。每条标题的中间结果和各格式的渲染结果缓存在
+TitleFragment 中，同一标题按同一格式只渲染一次。
 """
 
 from typing import Dict
 
-from trendradar.report.helpers import clean_title, html_escape, format_rank_display
+from trendradar.report.fragments import TitleFragment, get_title_fragment
+from trendradar.report.helpers import html_escape
 
 
 def format_title_for_platform(
@@ -44,15 +46,50 @@ def format_title_for_platform(
     Returns:
         格式化后的标题字符串
     """
-    rank_display = format_rank_display(
-        title_data["ranks"], title_data["rank_threshold"], platform
-    )
+    return render_title(platform, title_data, show_source, show_keyword)
 
-    link_url = title_data["mobile_url"] or title_data["url"]
-    cleaned_title = clean_title(title_data["title"])
+
+def render_title(
+    platform: str,
+    title_data: Dict,
+    show_source: bool = True,
+    show_keyword: bool = False,
+    hide_new: bool = False,
+) -> str:
+    """渲染标题（带缓存）
+
+    与 format_title_for_platform 相同，额外支持 hide_new（新增区块中不显示新增标记，
+    无需复制标题字典）。
+
+    Args:
+        platform: 目标平台
+        title_data: 标题数据字典
+        show_source: 是否显示来源名称
+        show_keyword: 是否显示关键词标签
+        hide_new: 是否不显示新增标记
+
+    Returns:
+        格式化后的标题字符串
+    """
+    fragment = get_title_fragment(title_data, hide_new)
+    key = (platform, show_source, show_keyword)
+    result = fragment.lines.get(key)
+    if result is None:
+        result = _format_fragment(platform, fragment, show_source, show_keyword)
+        fragment.lines[key] = result
+    return result
+
+
+def _format_fragment(
+    platform: str, fragment: TitleFragment, show_source: bool, show_keyword: bool
+) -> str:
+    """按平台格式拼接标题片段"""
+    rank_display = fragment.rank_display(platform)
+    link_url = fragment.link_url
+    cleaned_title = fragment.cleaned_title
 
     # 获取关键词标签（platform 模式使用）
-    keyword = title_data.get("matched_keyword", "") if show_keyword else ""
+    keyword = fragment.matched_keyword if show_keyword else ""
 
     if platform == "feishu":
         if link_url:
@@ -60,10 +97,10 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if fragment.is_new else ""
 
         if show_source:
-            result = f"<font color='grey'>[{title_data['source_name']}]</font> {title_prefix}{formatted_title}"
+            result = f"<font color='grey'>[{fragment.source_name}]</font> {title_prefix}{formatted_title}"
         elif show_keyword and keyword:
             result = f"<font color='blue'>[{keyword}]</font> {title_prefix}{formatted_title}"
         else:
@@ -71,10 +108,10 @@ def format_title_for_platform(
 
         if rank_display:
             result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" <font color='grey'>- {title_data['time_display']}</font>"
-        if title_data["count"] > 1:
-            result += f" <font color='green'>({title_data['count']}次)</font>"
+        if fragment.time_display:
+            result += f" <font color='grey'>- {fragment.time_display}</font>"
+        if fragment.count > 1:
+            result += f" <font color='green'>({fragment.count}次)</font>"
 
         return result
 
@@ -84,10 +121,10 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if fragment.is_new else ""
 
         if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
+            result = f"[{fragment.source_name}] {title_prefix}{formatted_title}"
         elif show_keyword and keyword:
             result = f"[{keyword}] {title_prefix}{formatted_title}"
         else:
@@ -95,10 +132,10 @@ def format_title_for_platform(
 
         if rank_display:
             result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" - {title_data['time_display']}"
-        if title_data["count"] > 1:
-            result += f" ({title_data['count']}次)"
+        if fragment.time_display:
+            result += f" - {fragment.time_display}"
+        if fragment.count > 1:
+            result += f" ({fragment.count}次)"
 
         return result
 
@@ -109,10 +146,10 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if fragment.is_new else ""
 
         if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
+            result = f"[{fragment.source_name}] {title_prefix}{formatted_title}"
         elif show_keyword and keyword:
             result = f"[{keyword}] {title_prefix}{formatted_title}"
         else:
@@ -120,23 +157,23 @@ def format_title_for_platform(
 
         if rank_display:
             result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" - {title_data['time_display']}"
-        if title_data["count"] > 1:
-            result += f" ({title_data['count']}次)"
+        if fragment.time_display:
+            result += f" - {fragment.time_display}"
+        if fragment.count > 1:
+            result += f" ({fragment.count}次)"
 
         return result
 
     elif platform == "telegram":
         if link_url:
-            formatted_title = f'<a href="{link_url}">{html_escape(cleaned_title)}</a>'
+            formatted_title = f'<a href="{link_url}">{fragment.escaped("cleaned_title")}</a>'
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if fragment.is_new else ""
 
         if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
+            result = f"[{fragment.source_name}] {title_prefix}{formatted_title}"
         elif show_keyword and keyword:
             result = f"<b>[{html_escape(keyword)}]</b> {title_prefix}{formatted_title}"
         else:
@@ -144,10 +181,10 @@ def format_title_for_platform(
 
         if rank_display:
             result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" <code>- {title_data['time_display']}</code>"
-        if title_data["count"] > 1:
-            result += f" <code>({title_data['count']}次)</code>"
+        if fragment.time_display:
+            result += f" <code>- {fragment.time_display}</code>"
+        if fragment.count > 1:
+            result += f" <code>({fragment.count}次)</code>"
 
         return result
 
@@ -157,10 +194,10 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if fragment.is_new else ""
 
         if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
+            result = f"[{fragment.source_name}] {title_prefix}{formatted_title}"
         elif show_keyword and keyword:
             result = f"[{keyword}] {title_prefix}{formatted_title}"
         else:
@@ -168,10 +205,10 @@ def format_title_for_platform(
 
         if rank_display:
             result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" `- {title_data['time_display']}`"
-        if title_data["count"] > 1:
-            result += f" `({title_data['count']}次)`"
+        if fragment.time_display:
+            result += f" `- {fragment.time_display}`"
+        if fragment.count > 1:
+            result += f" `({fragment.count}次)`"
 
         return result
 
@@ -183,37 +220,28 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if fragment.is_new else ""
 
         if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
+            result = f"[{fragment.source_name}] {title_prefix}{formatted_title}"
         elif show_keyword and keyword:
             result = f"*[{keyword}]* {title_prefix}{formatted_title}"
         else:
             result = f"{title_prefix}{formatted_title}"
 
         # 排名（使用 * 加粗）
-        rank_display = format_rank_display(
-            title_data["ranks"], title_data["rank_threshold"], "slack"
-        )
         if rank_display:
             result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" `- {title_data['time_display']}`"
-        if title_data["count"] > 1:
-            result += f" `({title_data['count']}次)`"
+        if fragment.time_display:
+            result += f" `- {fragment.time_display}`"
+        if fragment.count > 1:
+            result += f" `({fragment.count}次)`"
 
         return result
 
     elif platform == "html":
-        rank_display = format_rank_display(
-            title_data["ranks"], title_data["rank_threshold"], "html"
-        )
-
-        link_url = title_data["mobile_url"] or title_data["url"]
-
-        escaped_title = html_escape(cleaned_title)
-        escaped_source_name = html_escape(title_data["source_name"])
+        escaped_title = fragment.escaped("cleaned_title")
+        escaped_source_name = fragment.escaped("source_name")
 
         # 构建前缀（来源或关键词）
         if show_source:
@@ -225,20 +253,20 @@ def format_title_for_platform(
             prefix = ""
 
         if link_url:
-            escaped_url = html_escape(link_url)
+            escaped_url = fragment.escaped("link_url")
             formatted_title = f'{prefix}<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
         else:
             formatted_title = f'{prefix}<span class="no-link">{escaped_title}</span>'
 
         if rank_display:
             formatted_title += f" {rank_display}"
-        if title_data["time_display"]:
-            escaped_time = html_escape(title_data["time_display"])
+        if fragment.time_display:
+            escaped_time = fragment.escaped("time_display")
             formatted_title += f" <font color='grey'>- {escaped_time}</font>"
-        if title_data["count"] > 1:
-            formatted_title += f" <font color='green'>({title_data['count']}次)</font>"
+        if fragment.count > 1:
+            formatted_title += f" <font color='green'>({fragment.count}次)</font>"
 
-        if title_data.get("is_new"):
+        if fragment.is_new:
             formatted_title = f"<div class='new-title'>🆕 {formatted_title}</div>"
 
         return formatted_title
@@ -0,0 +1,137 @@
+# coding=utf-8
+"""
+标题渲染片段模块
+
+同一条标题在一次运行中会被多次渲染：HTML 报告、每个推送渠道、每个账号的分批。
+TitleFragment 保存标题中与格式无关的中间结果（清理后的标题、链接、转义文本、
+各格式的排名字符串）以及各格式的最终渲染结果，各格式只负责拼接。
+
+片段按标题内容（而非字典对象）登记，HTML 报告与推送各自调用 prepare_report_data
+生成的不同报告对象也能共享同一批片段。
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+from trendradar.report.helpers import clean_title, html_escape, format_rank_display
+
+
+# 片段登记表上限（超过后整体清空，长期运行时避免无限增长）
+MAX_FRAGMENTS = 20000
+
+_fragments: Dict[Tuple, "TitleFragment"] = {}
+_fragments_lock = threading.Lock()
+
+
+class TitleFragment:
+    """
+    单条标题的渲染片段
+
+    字段均按需计算并缓存，片段创建后内容不再变化，可在线程间共享。
+    """
+
+    __slots__ = (
+        "title",
+        "source_name",
+        "link_url",
+        "time_display",
+        "count",
+        "ranks",
+        "rank_threshold",
+        "is_new",
+        "matched_keyword",
+        "_cleaned_title",
+        "_escaped",
+        "_rank_displays",
+        "lines",
+    )
+
+    def __init__(self, title_data: Dict, is_new: bool):
+        self.title = title_data["title"]
+        self.source_name = title_data.get("source_name", "")
+        self.link_url = title_data.get("mobile_url") or title_data.get("url", "")
+        self.time_display = title_data.get("time_display", "")
+        self.count = title_data.get("count", 1)
+        self.ranks = title_data.get("ranks", [])
+        self.rank_threshold = title_data.get("rank_threshold", 10)
+        self.is_new = is_new
+        self.matched_keyword = title_data.get("matched_keyword", "")
+        self._cleaned_title: Optional[str] = None
+        self._escaped: Dict[str, str] = {}
+        self._rank_displays: Dict[str, str] = {}
+        # (platform, show_source, show_keyword) -> 渲染结果
+        self.lines: Dict[Tuple[str, bool, bool], str] = {}
+
+    @property
+    def cleaned_title(self) -> str:
+        """清理后的标题"""
+        if self._cleaned_title is None:
+            self._cleaned_title = clean_title(self.title)
+        return self._cleaned_title
+
+    def escaped(self, field: str) -> str:
+        """
+        获取字段的 HTML 转义结果
+
+        Args:
+            field: 字段名（title、cleaned_title、link_url、source_name、time_display）
+
+        Returns:
+            转义后的文本
+        """
+        value = self._escaped.get(field)
+        if value is None:
+            value = html_escape(getattr(self, field))
+            self._escaped[field] = value
+        return value
+
+    def rank_display(self, format_type: str) -> str:
+        """获取指定格式的排名字符串"""
+        value = self._rank_displays.get(format_type)
+        if value is None:
+            value = format_rank_display(self.ranks, self.rank_threshold, format_type)
+            self._rank_displays[format_type] = value
+        return value
+
+
+def get_title_fragment(title_data: Dict, hide_new: bool = False) -> TitleFragment:
+    """
+    获取标题对应的渲染片段（内容相同的标题共享同一片段）
+
+    Args:
+        title_data: 标题数据（prepare_report_data 输出中的标题字典）
+        hide_new: 是否按非新增标题处理（新增区块中不显示新增标记）
+
+    Returns:
+        TitleFragment 对象
+    """
+    is_new = False if hide_new else bool(title_data.get("is_new"))
+    key = (
+        title_data["title"],
+        title_data.get("source_name", ""),
+        title_data.get("url", ""),
+        title_data.get("mobile_url", ""),
+        tuple(title_data.get("ranks", ())),
+        title_data.get("rank_threshold", 10),
+        title_data.get("time_display", ""),
+        title_data.get("count", 1),
+        is_new,
+        title_data.get("matched_keyword", ""),
+    )
+
+    fragment = _fragments.get(key)
+    if fragment is None:
+        with _fragments_lock:
+            fragment = _fragments.get(key)
+            if fragment is None:
+                if len(_fragments) >= MAX_FRAGMENTS:
+                    _fragments.clear()
+                fragment = TitleFragment(title_data, is_new)
+                _fragments[key] = fragment
+    return fragment
+
+
+def clear_fragments() -> None:
+    """清空片段登记表"""
+    with _fragments_lock:
+        _fragments.clear()
@@ -8,6 +8,7 @@ HTML 报告渲染模块
 from datetime import datetime
 from typing import Dict, List, Optional, Callable
 
+from trendradar.report.fragments import get_title_fragment
 from trendradar.report.helpers import html_escape
 
 
@@ -699,6 +700,7 @@ def render_html_content(
 
             # 处理每个词组下的新闻标题，给每条新闻标上序号
             for j, title_data in enumerate(stat["titles"], 1):
+                fragment = get_title_fragment(title_data)
                 is_new = title_data.get("is_new", False)
                 new_class = "new" if is_new else ""
 
@@ -711,7 +713,7 @@ def render_html_content(
                 # 根据 display_mode 决定显示来源还是关键词
                 if display_mode == "keyword":
                     # keyword 模式：显示来源
-                    stats_html += f'<span class="source-name">{html_escape(title_data["source_name"])}</span>'
+                    stats_html += f'<span class="source-name">{fragment.escaped("source_name")}</span>'
                 else:
                     # platform 模式：显示关键词
                     matched_keyword = title_data.get("matched_keyword", "")
@@ -763,11 +765,10 @@ def render_html_content(
                             <div class="news-title">"""
 
                 # 处理标题和链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
+                escaped_title = fragment.escaped("title")
 
-                if link_url:
-                    escaped_url = html_escape(link_url)
+                if fragment.link_url:
+                    escaped_url = fragment.escaped("link_url")
                     stats_html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
                 else:
                     stats_html += escaped_title
@@ -797,6 +798,7 @@ def render_html_content(
 
             # 为新增新闻也添加序号
             for idx, title_data in enumerate(source_data["titles"], 1):
+                fragment = get_title_fragment(title_data)
                 ranks = title_data.get("ranks", [])
 
                 # 处理新增新闻的排名显示
@@ -823,11 +825,10 @@ def render_html_content(
                                 <div class="new-item-title">"""
 
                 # 处理新增新闻的链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
+                escaped_title = fragment.escaped("title")
 
-                if link_url:
-                    escaped_url = html_escape(link_url)
+                if fragment.link_url:
+                    escaped_url = fragment.escaped("link_url")
                     new_titles_html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
                 else:
                     new_titles_html += escaped_title
@@ -5,6 +5,7 @@
 支持的存储后端:
 - local: 本地 SQLite + TXT/HTML 文件
 - remote: 远程云存储（S3 兼容协议：R2/OSS/COS/S3 等）
+- postgres: PostgreSQL 数据库（多进程共享，按月分区）
 - auto: 根据环境自动选择（GitHub Actions 用 remote，其他用 local）
 """
 
@@ -17,6 +18,7 @@ from trendradar.storage.base import (
 )
 from trendradar.storage.local import LocalStorageBackend
 from trendradar.storage.manager import StorageManager, get_storage_manager
+from trendradar.storage.archive import ArchiveStore
 
 # 远程后端可选导入（需要 boto3）
 try:
@@ -26,6 +28,9 @@ except ImportError:
     RemoteStorageBackend = None
     HAS_REMOTE = False
 
+# PostgreSQL 后端可选（需要 sqlalchemy 和 psycopg2）
+from trendradar.storage.postgres import PostgresStorageBackend, HAS_SQLALCHEMY as HAS_POSTGRES
+
 __all__ = [
     # 基础类
     "StorageBackend",
@@ -38,7 +43,11 @@ __all__ = [
     "LocalStorageBackend",
     "RemoteStorageBackend",
     "HAS_REMOTE",
+    "PostgresStorageBackend",
+    "HAS_POSTGRES",
     # 管理器
     "StorageManager",
     "get_storage_manager",
+    # 多日汇总归档
+    "ArchiveStore",
 ]
@@ -0,0 +1,433 @@
+# coding=utf-8
+"""
+多日汇总归档库
+
+将 output/news/{date}.db 与 output/rss/{date}.db 合并到单个带 date 列的
+索引库（output/archive.db），供 MCP 跨日期范围查询一次 SQL 完成。
+
+增量维护：
+- 每个日期文件记录签名（主文件与 -wal 文件的 mtime/size）
+- 同步时只重新导入签名变化的日期，源文件已删除的日期同时从归档中移除
+"""
+
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from trendradar.storage.cold import COLD_CACHE_DIR, COLD_SUFFIXES, find_cold_file, open_cold_db
+from trendradar.storage.sqlite_helpers import (
+    apply_sqlite_profile,
+    get_db_signature,
+    parse_ranks,
+    rank_history_column,
+)
+
+
+ARCHIVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS archive_sources (
+    db_type TEXT NOT NULL,
+    date TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (db_type, date)
+);
+
+CREATE TABLE IF NOT EXISTS news_archive (
+    date TEXT NOT NULL,
+    item_id INTEGER NOT NULL,
+    platform_id TEXT NOT NULL,
+    platform_name TEXT,
+    title TEXT NOT NULL,
+    rank INTEGER,
+    ranks TEXT,
+    url TEXT,
+    mobile_url TEXT,
+    first_crawl_time TEXT,
+    last_crawl_time TEXT,
+    crawl_count INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS rss_archive (
+    date TEXT NOT NULL,
+    item_id INTEGER NOT NULL,
+    feed_id TEXT NOT NULL,
+    feed_name TEXT,
+    title TEXT NOT NULL,
+    url TEXT,
+    published_at TEXT,
+    summary TEXT,
+    author TEXT,
+    first_crawl_time TEXT,
+    last_crawl_time TEXT,
+    crawl_count INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS archive_crawl_times (
+    db_type TEXT NOT NULL,
+    date TEXT NOT NULL,
+    crawl_time TEXT NOT NULL,
+    created_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_news_archive_date ON news_archive(date, platform_id);
+CREATE INDEX IF NOT EXISTS idx_rss_archive_date ON rss_archive(date, feed_id);
+CREATE INDEX IF NOT EXISTS idx_archive_crawl_times ON archive_crawl_times(db_type, date);
+"""
+
+# 各类型数据从单日库导入归档库的语句（源库挂载为 day）
+_IMPORT_SQL = {
+    "news": [f"""
+        INSERT INTO news_archive
+        (date, item_id, platform_id, platform_name, title, rank, ranks, url, mobile_url,
+         first_crawl_time, last_crawl_time, crawl_count)
+        SELECT :date, n.id, n.platform_id, p.name, n.title, n.rank,
+               {rank_history_column(schema="day.")},
+               n.url, n.mobile_url, n.first_crawl_time, n.last_crawl_time, n.crawl_count
+        FROM day.news_items n
+        LEFT JOIN day.platforms p ON n.platform_id = p.id
+    """, """
+        INSERT INTO archive_crawl_times (db_type, date, crawl_time, created_at)
+        SELECT 'news', :date, crawl_time, created_at FROM day.crawl_records
+    """],
+    "rss": ["""
+        INSERT INTO rss_archive
+        (date, item_id, feed_id, feed_name, title, url, published_at, summary, author,
+         first_crawl_time, last_crawl_time, crawl_count)
+        SELECT :date, i.id, i.feed_id, f.name, i.title, i.url, i.published_at,
+               i.summary, i.author, i.first_crawl_time, i.last_crawl_time, i.crawl_count
+        FROM day.rss_items i
+        LEFT JOIN day.rss_feeds f ON i.feed_id = f.id
+    """, """
+        INSERT INTO archive_crawl_times (db_type, date, crawl_time, created_at)
+        SELECT 'rss', :date, crawl_time, created_at FROM day.rss_crawl_records
+    """],
+}
+
+_ITEM_TABLES = {
+    "news": "news_archive",
+    "rss": "rss_archive",
+}
+
+_DATE_FILE_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2})\.db$")
+
+
+class ArchiveStore:
+    """
+    多日汇总归档库
+
+    每次操作使用独立连接，可在多线程（MCP 工具）与爬虫进程间共享同一文件。
+    """
+
+    def __init__(self, data_dir: str = "output", sqlite_profile: Optional[Dict[str, Any]] = None):
+        """
+        初始化归档库
+
+        Args:
+            data_dir: 数据目录（包含 news/、rss/ 子目录）
+            sqlite_profile: SQLite 连接参数（None 表示使用默认值）
+        """
+        self.data_dir = Path(data_dir)
+        self.archive_path = self.data_dir / "archive.db"
+        self.sqlite_profile = sqlite_profile
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """打开归档库连接（自动提交模式，事务显式控制）"""
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.archive_path), isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        apply_sqlite_profile(conn, self.sqlite_profile)
+        if not self._schema_ready:
+            conn.executescript(ARCHIVE_SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    def _source_path(self, db_type: str, date: str) -> Path:
+        """获取单日数据库路径"""
+        return self.data_dir / db_type / f"{date}.db"
+
+    @staticmethod
+    def _signature(db_path: Path) -> str:
+        """计算单日数据库签名（含 -wal 文件状态）"""
+        return get_db_signature(db_path) or "-|-"
+
+    def _list_source_dates(self, db_type: str) -> List[str]:
+        """列出磁盘上存在的单日数据库日期（含冷存储文件）"""
+        db_dir = self.data_dir / db_type
+        if not db_dir.exists():
+            return []
+        dates = set()
+        for db_file in db_dir.iterdir():
+            name = db_file.name
+            for suffix in COLD_SUFFIXES:
+                if name.endswith(suffix):
+                    name = name[:-len(suffix)] + ".db"
+                    break
+            match = _DATE_FILE_PATTERN.match(name)
+            if match:
+                dates.add(match.group(1))
+        return sorted(dates)
+
+    def _import_date(
+        self,
+        conn: sqlite3.Connection,
+        db_type: str,
+        date: str,
+        signature: str,
+        source_path: Optional[Path] = None,
+    ) -> bool:
+        """
+        重新导入单个日期的数据（先删除该日期的旧数据）
+
+        Args:
+            source_path: 单日数据库路径（None 表示 output/{type}/{date}.db）
+
+        Returns:
+            是否导入成功
+        """
+        item_table = _ITEM_TABLES[db_type]
+        if source_path is None:
+            source_path = self._source_path(db_type, date)
+        conn.execute("ATTACH DATABASE ? AS day", (str(source_path),))
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(f"DELETE FROM {item_table} WHERE date = ?", (date,))
+                conn.execute(
+                    "DELETE FROM archive_crawl_times WHERE db_type = ? AND date = ?",
+                    (db_type, date),
+                )
+                for statement in _IMPORT_SQL[db_type]:
+                    conn.execute(statement, {"date": date})
+                conn.execute(
+                    "INSERT OR REPLACE INTO archive_sources (db_type, date, signature) VALUES (?, ?, ?)",
+                    (db_type, date, signature),
+                )
+                conn.execute("COMMIT")
+                return True
+            except sqlite3.Error as e:
+                conn.execute("ROLLBACK")
+                print(f"[归档] 导入 {db_type}/{date}.db 失败: {e}")
+                return False
+        finally:
+            conn.execute("DETACH DATABASE day")
+
+    def _remove_date(self, conn: sqlite3.Connection, db_type: str, date: str) -> None:
+        """从归档中移除单个日期（源文件已被清理）"""
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(f"DELETE FROM {_ITEM_TABLES[db_type]} WHERE date = ?", (date,))
+        conn.execute(
+            "DELETE FROM archive_crawl_times WHERE db_type = ? AND date = ?",
+            (db_type, date),
+        )
+        conn.execute(
+            "DELETE FROM archive_sources WHERE db_type = ? AND date = ?",
+            (db_type, date),
+        )
+        conn.execute("COMMIT")
+
+    def sync(
+        self,
+        db_type: str = "news",
+        dates: Optional[Iterable[str]] = None,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> int:
+        """
+        增量同步单日数据库到归档库
+
+        Args:
+            db_type: 数据库类型 ("news" 或 "rss")
+            dates: 只同步这些日期（None 表示同步全部）
+            conn: 复用已有连接（None 时自动打开并关闭）
+
+        Returns:
+            重新导入的日期数量
+        """
+        own_conn = conn is None
+        if own_conn:
+            conn = self._connect()
+
+        try:
+            synced = {
+                row["date"]: row["signature"]
+                for row in conn.execute(
+                    "SELECT date, signature FROM archive_sources WHERE db_type = ?",
+                    (db_type,),
+                )
+            }
+
+            if dates is None:
+                # 全量同步时同时检查归档中已有、但源文件已删除（如保留天数清理）的日期
+                dates = sorted(set(self._list_source_dates(db_type)) | set(synced))
+
+            imported = 0
+            for date in dates:
+                source_path = self._source_path(db_type, date)
+                if not source_path.exists():
+                    cold_path = find_cold_file(source_path)
+                    if cold_path is not None:
+                        # 冷存储文件不再变化，已导入的日期保持不变，未导入的从解压缓存导入
+                        if date not in synced and self._import_date(
+                            conn, db_type, date, self._signature(cold_path),
+                            open_cold_db(cold_path, self.data_dir / COLD_CACHE_DIR / db_type),
+                        ):
+                            imported += 1
+                    elif date in synced:
+                        self._remove_date(conn, db_type, date)
+                    continue
+
+                signature = self._signature(source_path)
+                if synced.get(date) == signature:
+                    continue
+                if self._import_date(conn, db_type, date, signature):
+                    imported += 1
+            return imported
+        finally:
+            if own_conn:
+                conn.close()
+
+    def query_news_range(
+        self,
+        start_date: str,
+        end_date: str,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Tuple[Dict, Dict, Dict]]:
+        """
+        一次查询日期范围内的热榜数据
+
+        Args:
+            start_date: 开始日期（YYYY-MM-DD，含）
+            end_date: 结束日期（YYYY-MM-DD，含）
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Returns:
+            {date: (all_titles, id_to_name, all_timestamps)}，
+            结构与 ParserService.read_all_titles_for_date 一致，无数据的日期不包含在内
+        """
+        dates = self._dates_in_range(start_date, end_date)
+        conn = self._connect()
+        try:
+            self.sync("news", dates, conn=conn)
+
+            query = """
+                SELECT date, platform_id, platform_name, title, rank, ranks,
+                       url, mobile_url, first_crawl_time, last_crawl_time, crawl_count
+                FROM news_archive
+                WHERE date BETWEEN ? AND ?
+            """
+            params: List[Any] = [start_date, end_date]
+            if platform_ids:
+                query += f" AND platform_id IN ({','.join('?' * len(platform_ids))})"
+                params.extend(platform_ids)
+            query += " ORDER BY date, item_id"
+
+            result: Dict[str, Tuple[Dict, Dict, Dict]] = {}
+            for row in conn.execute(query, params):
+                all_titles, id_to_name, _ = result.setdefault(row["date"], ({}, {}, {}))
+                platform_id = row["platform_id"]
+                id_to_name.setdefault(platform_id, row["platform_name"] or platform_id)
+
+                ranks = parse_ranks(row["ranks"], row["rank"])
+                all_titles.setdefault(platform_id, {})[row["title"]] = {
+                    "ranks": ranks,
+                    "url": row["url"] or "",
+                    "mobileUrl": row["mobile_url"] or "",
+                    "first_time": row["first_crawl_time"] or "",
+                    "last_time": row["last_crawl_time"] or "",
+                    "count": row["crawl_count"] or 1,
+                }
+
+            self._fill_timestamps(conn, "news", start_date, end_date, result)
+            return result
+        finally:
+            conn.close()
+
+    def query_rss_range(
+        self,
+        start_date: str,
+        end_date: str,
+        feed_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Tuple[Dict, Dict, Dict]]:
+        """
+        一次查询日期范围内的 RSS 数据
+
+        Args:
+            start_date: 开始日期（YYYY-MM-DD，含）
+            end_date: 结束日期（YYYY-MM-DD，含）
+            feed_ids: Feed ID列表，None表示所有
+
+        Returns:
+            {date: (all_items, id_to_name, all_timestamps)}，无数据的日期不包含在内
+        """
+        dates = self._dates_in_range(start_date, end_date)
+        conn = self._connect()
+        try:
+            self.sync("rss", dates, conn=conn)
+
+            query = """
+                SELECT date, feed_id, feed_name, title, url, published_at, summary, author,
+                       first_crawl_time, last_crawl_time, crawl_count
+                FROM rss_archive
+                WHERE date BETWEEN ? AND ?
+            """
+            params: List[Any] = [start_date, end_date]
+            if feed_ids:
+                query += f" AND feed_id IN ({','.join('?' * len(feed_ids))})"
+                params.extend(feed_ids)
+            query += " ORDER BY date, published_at DESC"
+
+            result: Dict[str, Tuple[Dict, Dict, Dict]] = {}
+            for row in conn.execute(query, params):
+                all_items, id_to_name, _ = result.setdefault(row["date"], ({}, {}, {}))
+                feed_id = row["feed_id"]
+                id_to_name.setdefault(feed_id, row["feed_name"] or feed_id)
+
+                all_items.setdefault(feed_id, {})[row["title"]] = {
+                    "url": row["url"] or "",
+                    "published_at": row["published_at"] or "",
+                    "summary": row["summary"] or "",
+                    "author": row["author"] or "",
+                    "first_time": row["first_crawl_time"] or "",
+                    "last_time": row["last_crawl_time"] or "",
+                    "count": row["crawl_count"] or 1,
+                }
+
+            self._fill_timestamps(conn, "rss", start_date, end_date, result)
+            return result
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _dates_in_range(start_date: str, end_date: str) -> List[str]:
+        """生成日期范围内的所有日期字符串"""
+        start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        return [
+            datetime.fromordinal(ordinal).strftime("%Y-%m-%d")
+            for ordinal in range(start.toordinal(), end.toordinal() + 1)
+        ]
+
+    @staticmethod
+    def _fill_timestamps(
+        conn: sqlite3.Connection,
+        db_type: str,
+        start_date: str,
+        end_date: str,
+        result: Dict[str, Tuple[Dict, Dict, Dict]],
+    ) -> None:
+        """填充各日期的抓取时间戳（与单日读取一致：{crawl_time}.db -> timestamp）"""
+        rows = conn.execute("""
+            SELECT date, crawl_time, created_at FROM archive_crawl_times
+            WHERE db_type = ? AND date BETWEEN ? AND ?
+            ORDER BY date, crawl_time
+        """, (db_type, start_date, end_date))
+        for row in rows:
+            if row["date"] not in result:
+                continue
+            try:
+                ts = datetime.strptime(row["created_at"], "%Y-%m-%d %H:%M:%S").timestamp()
+            except (ValueError, TypeError):
+                ts = datetime.now().timestamp()
+            result[row["date"]][2][f"{row['crawl_time']}.db"] = ts
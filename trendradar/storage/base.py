@@ -5,12 +5,41 @@
 定义统一的存储接口，所有存储后端都需要实现这些方法
 """
 
+import sys
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Sequence
 
 
-@dataclass
+def _intern(value: Any) -> Any:
+    """驻留重复出现的短字符串（平台 ID、名称、抓取时间等），相同取值共享一个对象"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def pack_ranks(ranks: Optional[Sequence[int]]) -> Sequence[int]:
+    """
+    将排名列表压缩为 array('H')（每个排名 2 字节）
+
+    超出范围或非整数的排名保持原列表，不影响使用。
+
+    Args:
+        ranks: 排名序列
+
+    Returns:
+        array('H') 或原列表
+    """
+    if isinstance(ranks, array):
+        return ranks
+    if not ranks:
+        return array("H")
+    try:
+        return array("H", ranks)
+    except (OverflowError, TypeError):
+        return list(ranks)
+
+
+@dataclass(slots=True)
 class NewsItem:
     """新闻条目数据模型（热榜数据）"""
 
@@ -23,11 +52,19 @@ class NewsItem:
     crawl_time: str = ""                # 抓取时间（HH:MM 格式）
 
     # 统计信息（用于分析）
-    ranks: List[int] = field(default_factory=list)  # 历史排名列表
+    ranks: Sequence[int] = field(default_factory=list)  # 历史排名列表（存储为 array('H')）
     first_time: str = ""                # 首次出现时间
     last_time: str = ""                 # 最后出现时间
     count: int = 1                      # 出现次数
 
+    def __post_init__(self):
+        self.source_id = _intern(self.source_id)
+        self.source_name = _intern(self.source_name)
+        self.crawl_time = _intern(self.crawl_time)
+        self.first_time = _intern(self.first_time)
+        self.last_time = _intern(self.last_time)
+        self.ranks = pack_ranks(self.ranks)
+
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
         return {
@@ -38,7 +75,7 @@ class NewsItem:
             "url": self.url,
             "mobile_url": self.mobile_url,
             "crawl_time": self.crawl_time,
-            "ranks": self.ranks,
+            "ranks": list(self.ranks),
             "first_time": self.first_time,
             "last_time": self.last_time,
             "count": self.count,
@@ -62,7 +99,7 @@ class NewsItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSItem:
     """RSS 条目数据模型"""
 
@@ -80,6 +117,13 @@ class RSSItem:
     last_time: str = ""                 # 最后抓取时间
     count: int = 1                      # 抓取次数
 
+    def __post_init__(self):
+        self.feed_id = _intern(self.feed_id)
+        self.feed_name = _intern(self.feed_name)
+        self.crawl_time = _intern(self.crawl_time)
+        self.first_time = _intern(self.first_time)
+        self.last_time = _intern(self.last_time)
+
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
         return {
@@ -114,7 +158,7 @@ class RSSItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSData:
     """
     RSS 数据集合
@@ -168,7 +212,7 @@ class RSSData:
         return sum(len(rss_list) for rss_list in self.items.values())
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsData:
     """
     新闻数据集合
@@ -250,7 +294,7 @@ class NewsData:
                     existing_ranks = set(existing.ranks) if existing.ranks else set()
                     new_ranks = set(item.ranks) if item.ranks else set()
                     merged_ranks = sorted(existing_ranks | new_ranks)
-                    existing.ranks = merged_ranks
+                    existing.ranks = pack_ranks(merged_ranks)
 
                     # 更新时间
                     if item.first_time and (not existing.first_time or item.first_time < existing.first_time):
@@ -299,6 +343,9 @@ class StorageBackend(ABC):
     - 读取当天所有数据
     - 检测新增新闻
     - 生成报告文件（TXT/HTML）
+
+    iter_news_items / iter_rss_items 提供流式读取，默认基于完整数据在内存中过滤，
+    基于 SQLite 的后端会覆盖为 SQL 过滤 + 逐行读取。
     """
 
     @abstractmethod
@@ -414,6 +461,21 @@ class StorageBackend(ABC):
         """
         pass
 
+    def freeze_old_data(self, after_days: int, codec: str = "zstd") -> int:
+        """
+        将超过指定天数的每日数据库转为压缩的冷存储文件
+
+        默认不做任何处理，支持冷存储的后端覆盖此方法。
+
+        Args:
+            after_days: 超过该天数的日期转为冷存储（0 表示不转换）
+            codec: 压缩算法（zstd / xz / gzip）
+
+        Returns:
+            转换的数据库数量
+        """
+        return 0
+
     @property
     @abstractmethod
     def backend_name(self) -> str:
@@ -459,6 +521,90 @@ class StorageBackend(ABC):
         """
         pass
 
+    def iter_news_items(
+        self,
+        date: Optional[str] = None,
+        platform_ids: Optional[Sequence[str]] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        keyword: Optional[str] = None,
+    ) -> Iterator[NewsItem]:
+        """
+        流式读取指定日期的新闻
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+            platform_ids: 平台 ID 列表，None 表示所有平台
+            start_time: 开始抓取时间（HH-MM，含），条目在时间段内出现过即返回
+            end_time: 结束抓取时间（HH-MM，含）
+            keyword: 标题关键词（子串匹配，不区分大小写）
+
+        Yields:
+            符合条件的 NewsItem
+        """
+        data = self.get_today_all_data(date)
+        if data is None:
+            return
+        keyword_lower = keyword.lower() if keyword else None
+        for source_id, news_list in data.items.items():
+            if platform_ids and source_id not in platform_ids:
+                continue
+            for item in news_list:
+                if _item_matches(item.title, item.first_time, item.last_time,
+                                 start_time, end_time, keyword_lower):
+                    yield item
+
+    def iter_rss_items(
+        self,
+        date: Optional[str] = None,
+        feed_ids: Optional[Sequence[str]] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        keyword: Optional[str] = None,
+    ) -> Iterator[RSSItem]:
+        """
+        流式读取指定日期的 RSS 条目
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+            feed_ids: Feed ID 列表，None 表示所有源
+            start_time: 开始抓取时间（HH-MM，含）
+            end_time: 结束抓取时间（HH-MM，含）
+            keyword: 关键词（匹配标题或摘要，不区分大小写）
+
+        Yields:
+            符合条件的 RSSItem
+        """
+        get_rss_data = getattr(self, "get_rss_data", None)
+        data = get_rss_data(date) if get_rss_data else None
+        if data is None:
+            return
+        keyword_lower = keyword.lower() if keyword else None
+        for feed_id, rss_list in data.items.items():
+            if feed_ids and feed_id not in feed_ids:
+                continue
+            for item in rss_list:
+                text = f"{item.title}\n{item.summary}"
+                if _item_matches(text, item.first_time, item.last_time,
+                                 start_time, end_time, keyword_lower):
+                    yield item
+
+
+def _item_matches(
+    text: str,
+    first_time: str,
+    last_time: str,
+    start_time: Optional[str],
+    end_time: Optional[str],
+    keyword_lower: Optional[str],
+) -> bool:
+    """判断条目是否满足时间段和关键词条件（与 SQL 下推的语义一致）"""
+    if start_time and last_time < start_time:
+        return False
+    if end_time and first_time > end_time:
+        return False
+    return not keyword_lower or keyword_lower in text.lower()
+
 
 def convert_crawl_results_to_news_data(
     results: Dict[str, Dict],
@@ -533,7 +679,7 @@ def convert_news_data_to_results(data: NewsData) -> tuple:
         data: NewsData 对象
 
     Returns:
-        (results, id_to_name, title_info) 元组
+        (results, id_to_name, title_info) 元组，两者中同一标题的条目为同一个字典
     """
     results = {}
     title_info = {}
@@ -543,13 +689,8 @@ def convert_news_data_to_results(data: NewsData) -> tuple:
         title_info[source_id] = {}
 
         for item in news_list:
-            results[source_id][item.title] = {
-                "ranks": item.ranks,
-                "url": item.url,
-                "mobileUrl": item.mobile_url,
-            }
-
-            title_info[source_id][item.title] = {
+            # results 与 title_info 共享同一个字典，每个标题只创建一份
+            info = {
                 "first_time": item.first_time,
                 "last_time": item.last_time,
                 "count": item.count,
@@ -557,5 +698,7 @@ def convert_news_data_to_results(data: NewsData) -> tuple:
                 "url": item.url,
                 "mobileUrl": item.mobile_url,
             }
+            results[source_id][item.title] = info
+            title_info[source_id][item.title] = info
 
     return results, data.id_to_name, title_info
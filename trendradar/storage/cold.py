@@ -0,0 +1,259 @@
+# coding=utf-8
+"""
+冷存储
+
+已结束日期的每日数据库不再写入，可转为压缩的冷存储文件：
+- 先 VACUUM INTO 得到紧凑的单文件副本（合并 WAL、去掉空闲页，日志模式改为 DELETE）
+- 再整体压缩为 {date}.db.zst（需安装 zstandard），未安装时回退为标准库的 {date}.db.xz
+
+读取时解压到缓存目录（output/.cold_cache/{db_type}/{date}.db），之后按普通 SQLite 文件
+读取（mmap_size 生效）；冷存储文件未变化时直接复用缓存，不重复解压。
+"""
+
+import gzip
+import lzma
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+# zstandard 为可选依赖
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 压缩算法 -> 文件后缀（追加在 .db 之后）
+COLD_CODECS = {
+    "zstd": ".zst",
+    "xz": ".xz",
+    "gzip": ".gz",
+}
+
+# 冷存储文件后缀（读取时按此顺序查找）
+COLD_SUFFIXES = tuple(f".db{suffix}" for suffix in COLD_CODECS.values())
+
+# 解压缓存目录名（位于数据目录下）
+COLD_CACHE_DIR = ".cold_cache"
+
+# 每种数据库类型最多保留的解压缓存文件数
+DEFAULT_CACHE_FILES = 32
+
+# zstd 压缩级别（长期保存，偏向压缩率）
+_ZSTD_LEVEL = 19
+
+# 流式读写块大小
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# 解压缓存写入锁（MCP 工具在多线程中读取同一缓存目录）
+_thaw_lock = threading.Lock()
+
+# 是否已提示过 zstandard 未安装
+_zstd_fallback_warned = False
+
+
+def resolve_codec(codec: str) -> str:
+    """
+    检查压缩算法是否可用
+
+    Args:
+        codec: 压缩算法（zstd / xz / gzip）
+
+    Returns:
+        实际使用的压缩算法（未安装 zstandard 时 zstd 回退为 xz）
+
+    Raises:
+        ValueError: 不支持的压缩算法
+    """
+    codec = (codec or "zstd").lower()
+    if codec not in COLD_CODECS:
+        raise ValueError(f"不支持的冷存储压缩算法: {codec}（可选: {', '.join(COLD_CODECS)}）")
+    if codec == "zstd" and zstandard is None:
+        global _zstd_fallback_warned
+        if not _zstd_fallback_warned:
+            print("[冷存储] 未安装 zstandard，改用 xz 压缩")
+            _zstd_fallback_warned = True
+        return "xz"
+    return codec
+
+
+def is_cold_file(name: str) -> bool:
+    """判断文件名/对象键是否为冷存储文件"""
+    return name.endswith(COLD_SUFFIXES)
+
+
+def find_cold_file(db_path: Union[str, Path]) -> Optional[Path]:
+    """
+    查找每日数据库对应的冷存储文件
+
+    Args:
+        db_path: 每日数据库路径（如 output/news/2025-12-28.db）
+
+    Returns:
+        冷存储文件路径，不存在时返回 None
+    """
+    for suffix in COLD_CODECS.values():
+        cold_path = Path(f"{db_path}{suffix}")
+        if cold_path.exists():
+            return cold_path
+    return None
+
+
+def _codec_of(cold_path: Path) -> str:
+    """根据后缀判断冷存储文件的压缩算法"""
+    for codec, suffix in COLD_CODECS.items():
+        if cold_path.name.endswith(suffix):
+            return codec
+    raise ValueError(f"无法识别的冷存储文件: {cold_path}")
+
+
+def _open_compressed(path: Path, codec: str, mode: str) -> BinaryIO:
+    """以流的方式打开压缩文件（mode 为 "rb" 或 "wb"）"""
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError(f"读取 {path.name} 需要安装 zstandard")
+        raw = open(path, mode)
+        if mode == "wb":
+            cctx = zstandard.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1)
+            return cctx.stream_writer(raw, closefd=True)
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    if codec == "xz":
+        return lzma.open(path, mode, preset=6 if mode == "wb" else None)
+    return gzip.open(path, mode, compresslevel=9)
+
+
+def freeze_db(db_path: Union[str, Path], codec: str = "zstd") -> Path:
+    """
+    将每日数据库转为冷存储文件，成功后删除原数据库
+
+    调用方需保证该数据库已不再写入，且没有仍在使用的连接。
+
+    Args:
+        db_path: 每日数据库路径
+        codec: 压缩算法（zstd / xz / gzip）
+
+    Returns:
+        冷存储文件路径
+    """
+    db_path = Path(db_path)
+    codec = resolve_codec(codec)
+    cold_path = Path(f"{db_path}{COLD_CODECS[codec]}")
+    vacuum_path = db_path.with_name(f"{db_path.name}.vacuum")
+    part_path = Path(f"{cold_path}.part")
+
+    vacuum_path.unlink(missing_ok=True)
+    try:
+        conn = sqlite3.connect(str(db_path))
+        try:
+            conn.execute("VACUUM INTO ?", (str(vacuum_path),))
+        finally:
+            conn.close()
+
+        # 冷存储文件只读，DELETE 模式下只读连接无需创建 -shm 文件
+        conn = sqlite3.connect(str(vacuum_path))
+        try:
+            conn.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            conn.close()
+
+        with open(vacuum_path, "rb") as src, _open_compressed(part_path, codec, "wb") as dst:
+            shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+
+        # 删除原库前完整解压校验一次
+        expected = vacuum_path.stat().st_size
+        actual = 0
+        with _open_compressed(part_path, codec, "rb") as f:
+            while chunk := f.read(_COPY_CHUNK_SIZE):
+                actual += len(chunk)
+        if actual != expected:
+            raise RuntimeError(f"冷存储文件校验失败: {cold_path.name} ({actual}/{expected} 字节)")
+
+        part_path.replace(cold_path)
+    finally:
+        vacuum_path.unlink(missing_ok=True)
+        part_path.unlink(missing_ok=True)
+
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    return cold_path
+
+
+def thaw_db(cold_path: Union[str, Path], target_path: Union[str, Path]) -> Path:
+    """
+    将冷存储文件解压为普通 SQLite 数据库
+
+    解压结果的 mtime 与冷存储文件一致，用于判断缓存是否仍然有效。
+
+    Args:
+        cold_path: 冷存储文件路径
+        target_path: 解压后的数据库路径
+
+    Returns:
+        解压后的数据库路径
+    """
+    cold_path = Path(cold_path)
+    target_path = Path(target_path)
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = target_path.with_name(f"{target_path.name}.{os.getpid()}_{threading.get_ident()}.part")
+
+    try:
+        with _open_compressed(cold_path, _codec_of(cold_path), "rb") as src, open(part_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+        os.utime(part_path, ns=(time.time_ns(), cold_path.stat().st_mtime_ns))
+        part_path.replace(target_path)
+    finally:
+        part_path.unlink(missing_ok=True)
+    return target_path
+
+
+def open_cold_db(
+    cold_path: Union[str, Path],
+    cache_dir: Union[str, Path],
+    max_cached: int = DEFAULT_CACHE_FILES,
+) -> Path:
+    """
+    获取冷存储文件的可读数据库路径（必要时解压到缓存目录）
+
+    Args:
+        cold_path: 冷存储文件路径
+        cache_dir: 解压缓存目录
+        max_cached: 缓存目录中最多保留的数据库数量（按最近访问淘汰）
+
+    Returns:
+        可直接用 SQLite 打开的数据库路径
+    """
+    cold_path = Path(cold_path)
+    cache_dir = Path(cache_dir)
+    cache_path = cache_dir / cold_path.name[:cold_path.name.rindex(".db") + 3]
+
+    with _thaw_lock:
+        cold_mtime = cold_path.stat().st_mtime_ns
+        try:
+            cached = cache_path.stat()
+        except FileNotFoundError:
+            cached = None
+
+        if cached is not None and cached.st_mtime_ns == cold_mtime:
+            # 只更新访问时间（mtime 用于校验缓存，保持不变）
+            os.utime(cache_path, ns=(time.time_ns(), cold_mtime))
+        else:
+            thaw_db(cold_path, cache_path)
+            _prune_cache(cache_dir, max_cached)
+
+    return cache_path
+
+
+def _prune_cache(cache_dir: Path, max_cached: int) -> None:
+    """按最近访问时间淘汰多余的解压缓存"""
+    if max_cached <= 0:
+        return
+    cached = sorted(cache_dir.glob("*.db"), key=lambda p: p.stat().st_atime_ns, reverse=True)
+    for path in cached[max_cached:]:
+        try:
+            path.unlink()
+        except OSError:
+            # Windows 下仍被打开的文件无法删除，下次再清理
+            pass
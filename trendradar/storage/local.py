@@ -11,15 +11,34 @@ import pytz
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+from trendradar.storage.cold import (
+    COLD_CACHE_DIR,
+    COLD_SUFFIXES,
+    find_cold_file,
+    freeze_db,
+    open_cold_db,
+    thaw_db,
+)
+from trendradar.storage.sqlite_helpers import (
+    connect_sqlite,
+    detect_new_titles_in_db,
+    ensure_schema,
+    iter_news_items_in_db,
+    iter_rss_items_in_db,
+    parse_ranks,
+    rank_history_column,
+    write_news_data,
+    write_push_record,
+    write_rss_data,
+)
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
     format_time_filename,
 )
-from trendradar.utils.url import normalize_url
 
 
 class LocalStorageBackend(StorageBackend):
@@ -38,6 +57,7 @@ class LocalStorageBackend(StorageBackend):
         enable_txt: bool = True,
         enable_html: bool = True,
         timezone: str = "Asia/Shanghai",
+        sqlite_profile: Optional[Dict[str, Any]] = None,
     ):
         """
         初始化本地存储后端
@@ -47,11 +67,13 @@ class LocalStorageBackend(StorageBackend):
             enable_txt: 是否启用 TXT 快照
             enable_html: 是否启用 HTML 报告
             timezone: 时区配置（默认 Asia/Shanghai）
+            sqlite_profile: SQLite 连接参数（None 表示使用默认值）
         """
         self.data_dir = Path(data_dir)
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
+        self.sqlite_profile = sqlite_profile
         self._db_connections: Dict[str, sqlite3.Connection] = {}
 
     @property
@@ -96,7 +118,9 @@ class LocalStorageBackend(StorageBackend):
 
     def _get_connection(self, date: Optional[str] = None, db_type: str = "news") -> sqlite3.Connection:
         """
-        获取数据库连接（带缓存）
+        获取可写入的数据库连接（带缓存）
+
+        该日期已转为冷存储（.db.zst 等）时先恢复为普通数据库。
 
         Args:
             date: 日期字符串
@@ -105,48 +129,75 @@ class LocalStorageBackend(StorageBackend):
         Returns:
             数据库连接
         """
-        db_path = str(self._get_db_path(date, db_type))
+        db_path = self._get_db_path(date, db_type)
+        self._restore_cold_db(db_path)
+        return self._open_connection(str(db_path), db_type)
+
+    def _get_read_connection(
+        self,
+        date: Optional[str] = None,
+        db_type: str = "news",
+    ) -> Optional[sqlite3.Connection]:
+        """
+        获取只读取数据时使用的数据库连接（带缓存）
+
+        该日期已转为冷存储时读取解压缓存（output/.cold_cache/{db_type}/{date}.db），
+        冷存储文件保持不变；只有写入时才恢复为普通数据库。
 
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            数据库连接，该日期没有数据时返回 None
+        """
+        db_path = self._get_db_path(date, db_type)
+        if db_path.exists():
+            return self._open_connection(str(db_path), db_type)
+
+        cold_path = find_cold_file(db_path)
+        if cold_path is None:
+            return None
+        cache_path = open_cold_db(cold_path, self.data_dir / COLD_CACHE_DIR / db_type)
+        return self._open_connection(str(cache_path), db_type)
+
+    def _open_connection(self, db_path: str, db_type: str) -> sqlite3.Connection:
+        """打开数据库连接并缓存（已打开时直接复用）"""
         if db_path not in self._db_connections:
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
+            conn = connect_sqlite(db_path, self.sqlite_profile)
             self._init_tables(conn, db_type)
             self._db_connections[db_path] = conn
 
         return self._db_connections[db_path]
 
-    def _get_schema_path(self, db_type: str = "news") -> Path:
+    def _restore_cold_db(self, db_path: Path) -> None:
         """
-        获取 schema.sql 文件路径
-
-        Args:
-            db_type: 数据库类型 ("news" 或 "rss")
+        已转为冷存储的日期再次写入时恢复为普通数据库
 
-        Returns:
-            schema 文件路径
+        避免新建空库遮盖冷存储数据；恢复后的数据库由下次 freeze_old_data 重新转换。
         """
-        if db_type == "rss":
-            return Path(__file__).parent / "rss_schema.sql"
-        return Path(__file__).parent / "schema.sql"
+        if db_path.exists():
+            return
+        cold_path = find_cold_file(db_path)
+        if cold_path is not None:
+            # 之后的读取改用恢复后的数据库，关闭解压缓存上的连接
+            cache_path = self.data_dir / COLD_CACHE_DIR / db_path.parent.name / db_path.name
+            conn = self._db_connections.pop(str(cache_path), None)
+            if conn is not None:
+                conn.close()
+            thaw_db(cold_path, db_path)
+            cold_path.unlink()
+            print(f"[本地存储] 已从冷存储恢复: {db_path.parent.name}/{db_path.name}")
 
     def _init_tables(self, conn: sqlite3.Connection, db_type: str = "news") -> None:
         """
-        从 schema.sql 初始化数据库表结构
+        初始化数据库表结构（版本一致时跳过，否则建表或执行增量迁移）
 
         Args:
             conn: 数据库连接
             db_type: 数据库类型 ("news" 或 "rss")
         """
-        schema_path = self._get_schema_path(db_type)
-
-        if schema_path.exists():
-            with open(schema_path, "r", encoding="utf-8") as f:
-                schema_sql = f.read()
-            conn.executescript(schema_sql)
-        else:
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
-
-        conn.commit()
+        ensure_schema(conn, db_type)
 
     def save_news_data(self, data: NewsData) -> bool:
         """
@@ -165,152 +216,10 @@ class LocalStorageBackend(StorageBackend):
             # 获取配置时区的当前时间
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            # 首先同步平台信息到 platforms 表
-            for source_id, source_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO platforms (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (source_id, source_name, now_str))
-
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-            title_changed_count = 0
-            success_sources = []
-
-            for source_id, news_list in data.items.items():
-                success_sources.append(source_id)
-
-                for item in news_list:
-                    try:
-                        # 标准化 URL（去除动态参数，如微博的 band_rank）
-                        normalized_url = normalize_url(item.url, source_id) if item.url else ""
-
-                        # 检查是否已存在（通过标准化 URL + platform_id）
-                        if normalized_url:
-                            cursor.execute("""
-                                SELECT id, title FROM news_items
-                                WHERE url = ? AND platform_id = ?
-                            """, (normalized_url, source_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id, existing_title = existing
-
-                                # 检查标题是否变化
-                                if existing_title != item.title:
-                                    # 记录标题变更
-                                    cursor.execute("""
-                                        INSERT INTO title_changes
-                                        (news_item_id, old_title, new_title, changed_at)
-                                        VALUES (?, ?, ?, ?)
-                                    """, (existing_id, existing_title, item.title, now_str))
-                                    title_changed_count += 1
-
-                                # 记录排名历史
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (existing_id, item.rank, data.crawl_time, now_str))
-
-                                # 更新现有记录
-                                cursor.execute("""
-                                    UPDATE news_items SET
-                                        title = ?,
-                                        rank = ?,
-                                        mobile_url = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.rank, item.mobile_url,
-                                      data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录（存储标准化后的 URL）
-                                cursor.execute("""
-                                    INSERT INTO news_items
-                                    (title, platform_id, rank, url, mobile_url,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, source_id, item.rank, normalized_url,
-                                      item.mobile_url, data.crawl_time, data.crawl_time,
-                                      now_str, now_str))
-                                new_id = cursor.lastrowid
-                                # 记录初始排名
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (new_id, item.rank, data.crawl_time, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空的情况，直接插入（不做去重）
-                            cursor.execute("""
-                                INSERT INTO news_items
-                                (title, platform_id, rank, url, mobile_url,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, source_id, item.rank, "",
-                                  item.mobile_url, data.crawl_time, data.crawl_time,
-                                  now_str, now_str))
-                            new_id = cursor.lastrowid
-                            # 记录初始排名
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, ?, ?, ?)
-                            """, (new_id, item.rank, data.crawl_time, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"保存新闻条目失败 [{item.title[:30]}...]: {e}")
-
-            total_items = new_count + updated_count
-
-            # 记录抓取信息
-            cursor.execute("""
-                INSERT OR REPLACE INTO crawl_records
-                (crawl_time, total_items, created_at)
-                VALUES (?, ?, ?)
-            """, (data.crawl_time, total_items, now_str))
-
-            # 获取刚插入的 crawl_record 的 ID
-            cursor.execute("""
-                SELECT id FROM crawl_records WHERE crawl_time = ?
-            """, (data.crawl_time,))
-            record_row = cursor.fetchone()
-            if record_row:
-                crawl_record_id = record_row[0]
-
-                # 记录成功的来源
-                for source_id in success_sources:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, source_id))
-
-                # 记录失败的来源
-                for failed_id in data.failed_ids:
-                    # 确保失败的平台也在 platforms 表中
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO platforms (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
-
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
+            # 写入平台信息、新闻条目、抓取记录和来源状态
+            new_count, updated_count, title_changed_count = write_news_data(
+                cursor, data, now_str
+            )
 
             conn.commit()
 
@@ -339,18 +248,18 @@ class LocalStorageBackend(StorageBackend):
             合并后的新闻数据
         """
         try:
-            db_path = self._get_db_path(date)
-            if not db_path.exists():
+            conn = self._get_read_connection(date)
+            if conn is None:
                 return None
 
-            conn = self._get_connection(date)
             cursor = conn.cursor()
 
-            # 获取所有新闻数据（包含 id 用于查询排名历史）
-            cursor.execute("""
+            # 获取所有新闻数据（排名历史由子查询逐条聚合）
+            cursor.execute(f"""
                 SELECT n.id, n.title, n.platform_id, p.name as platform_name,
                        n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                       {rank_history_column()} AS ranks
                 FROM news_items n
                 LEFT JOIN platforms p ON n.platform_id = p.id
                 ORDER BY n.platform_id, n.last_crawl_time
@@ -360,32 +269,12 @@ class LocalStorageBackend(StorageBackend):
             if not rows:
                 return None
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
-
             # 按 platform_id 分组
             items: Dict[str, List[NewsItem]] = {}
             id_to_name: Dict[str, str] = {}
             crawl_date = self._format_date_folder(date)
 
             for row in rows:
-                news_id = row[0]
                 platform_id = row[2]
                 title = row[1]
                 platform_name = row[3] or platform_id
@@ -396,7 +285,7 @@ class LocalStorageBackend(StorageBackend):
                     items[platform_id] = []
 
                 # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
+                ranks = parse_ranks(row[10], row[4], unique=True)
 
                 items[platform_id].append(NewsItem(
                     title=title,
@@ -456,11 +345,10 @@ class LocalStorageBackend(StorageBackend):
             最新抓取的新闻数据
         """
         try:
-            db_path = self._get_db_path(date)
-            if not db_path.exists():
+            conn = self._get_read_connection(date)
+            if conn is None:
                 return None
 
-            conn = self._get_connection(date)
             cursor = conn.cursor()
 
             # 获取最新的抓取时间
@@ -476,11 +364,12 @@ class LocalStorageBackend(StorageBackend):
 
             latest_time = time_row[0]
 
-            # 获取该时间的新闻数据（包含 id 用于查询排名历史）
-            cursor.execute("""
+            # 获取该时间的新闻数据（排名历史由子查询逐条聚合）
+            cursor.execute(f"""
                 SELECT n.id, n.title, n.platform_id, p.name as platform_name,
                        n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                       {rank_history_column()} AS ranks
                 FROM news_items n
                 LEFT JOIN platforms p ON n.platform_id = p.id
                 WHERE n.last_crawl_time = ?
@@ -490,31 +379,11 @@ class LocalStorageBackend(StorageBackend):
             if not rows:
                 return None
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
-
             items: Dict[str, List[NewsItem]] = {}
             id_to_name: Dict[str, str] = {}
             crawl_date = self._format_date_folder(date)
 
             for row in rows:
-                news_id = row[0]
                 platform_id = row[2]
                 platform_name = row[3] or platform_id
                 id_to_name[platform_id] = platform_name
@@ -523,7 +392,7 @@ class LocalStorageBackend(StorageBackend):
                     items[platform_id] = []
 
                 # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
+                ranks = parse_ranks(row[10], row[4], unique=True)
 
                 items[platform_id].append(NewsItem(
                     title=row[1],
@@ -561,6 +430,35 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 获取最新数据失败: {e}")
             return None
 
+    def iter_news_items(
+        self,
+        date: Optional[str] = None,
+        platform_ids: Optional[Sequence[str]] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        keyword: Optional[str] = None,
+    ) -> Iterator[NewsItem]:
+        """
+        流式读取指定日期的新闻（平台、时间段、关键词过滤在 SQL 中完成）
+
+        Args:
+            date: 日期字符串，默认为今天
+            platform_ids: 平台 ID 列表，None 表示所有平台
+            start_time: 开始抓取时间（HH-MM，含）
+            end_time: 结束抓取时间（HH-MM，含）
+            keyword: 标题关键词
+
+        Yields:
+            符合条件的 NewsItem
+        """
+        try:
+            conn = self._get_read_connection(date)
+            if conn is None:
+                return
+            yield from iter_news_items_in_db(conn, platform_ids, start_time, end_time, keyword)
+        except sqlite3.Error as e:
+            print(f"[本地存储] 流式读取数据失败: {e}")
+
     def detect_new_titles(self, current_data: NewsData) -> Dict[str, Dict]:
         """
         检测新增的标题
@@ -575,46 +473,15 @@ class LocalStorageBackend(StorageBackend):
             新增的标题数据 {source_id: {title: NewsItem}}
         """
         try:
-            # 获取历史数据
-            historical_data = self.get_today_all_data(current_data.date)
-
-            if not historical_data:
+            conn = self._get_read_connection(current_data.date)
+            if conn is None:
                 # 没有历史数据，所有都是新的
-                new_titles = {}
-                for source_id, news_list in current_data.items.items():
-                    new_titles[source_id] = {item.title: item for item in news_list}
-                return new_titles
-
-            # 获取当前批次时间
-            current_time = current_data.crawl_time
-
-            # 收集历史标题（first_time < current_time 的标题）
-            # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
-            historical_titles: Dict[str, set] = {}
-            for source_id, news_list in historical_data.items.items():
-                historical_titles[source_id] = set()
-                for item in news_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        historical_titles[source_id].add(item.title)
+                return {
+                    source_id: {item.title: item for item in news_list}
+                    for source_id, news_list in current_data.items.items()
+                }
 
-            # 检查是否有历史数据
-            has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
-            if not has_historical_data:
-                # 第一次抓取，没有"新增"概念
-                return {}
-
-            # 检测新增
-            new_titles = {}
-            for source_id, news_list in current_data.items.items():
-                hist_set = historical_titles.get(source_id, set())
-                for item in news_list:
-                    if item.title not in hist_set:
-                        if source_id not in new_titles:
-                            new_titles[source_id] = {}
-                        new_titles[source_id][item.title] = item
-
-            return new_titles
+            return detect_new_titles_in_db(conn, current_data)
 
         except Exception as e:
             print(f"[本地存储] 检测新标题失败: {e}")
@@ -723,11 +590,10 @@ class LocalStorageBackend(StorageBackend):
             是否是第一次抓取
         """
         try:
-            db_path = self._get_db_path(date)
-            if not db_path.exists():
+            conn = self._get_read_connection(date)
+            if conn is None:
                 return True
 
-            conn = self._get_connection(date)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -755,11 +621,10 @@ class LocalStorageBackend(StorageBackend):
             抓取时间列表（按时间排序）
         """
         try:
-            db_path = self._get_db_path(date)
-            if not db_path.exists():
+            conn = self._get_read_connection(date)
+            if conn is None:
                 return []
 
-            conn = self._get_connection(date)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -790,8 +655,8 @@ class LocalStorageBackend(StorageBackend):
         清理过期数据
 
         新结构清理逻辑：
-        - output/news/{date}.db  -> 删除过期的 .db 文件
-        - output/rss/{date}.db   -> 删除过期的 .db 文件
+        - output/news/{date}.db  -> 删除过期的 .db 文件（含冷存储文件 .db.zst 等）
+        - output/rss/{date}.db   -> 删除过期的 .db 文件（含冷存储文件 .db.zst 等）
         - output/txt/{date}/     -> 删除过期的日期目录
         - output/html/{date}/    -> 删除过期的日期目录
 
@@ -844,7 +709,11 @@ class LocalStorageBackend(StorageBackend):
                 if not db_dir.exists():
                     continue
 
-                for db_file in db_dir.glob("*.db"):
+                db_files = list(db_dir.glob("*.db"))
+                for suffix in COLD_SUFFIXES:
+                    db_files.extend(db_dir.glob(f"*{suffix}"))
+
+                for db_file in db_files:
                     file_date = parse_date_from_name(db_file.name)
                     if file_date and file_date < cutoff_date:
                         # 先关闭数据库连接
@@ -859,6 +728,9 @@ class LocalStorageBackend(StorageBackend):
                         # 删除文件
                         try:
                             db_file.unlink()
+                            # WAL 模式的附属文件
+                            for suffix in ("-wal", "-shm"):
+                                Path(f"{db_file}{suffix}").unlink(missing_ok=True)
                             deleted_count += 1
                             print(f"[本地存储] 清理过期数据: {db_type}/{db_file.name}")
                         except Exception as e:
@@ -892,6 +764,57 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 清理过期数据失败: {e}")
             return deleted_count
 
+    def freeze_old_data(self, after_days: int, codec: str = "zstd") -> int:
+        """
+        将超过指定天数的每日数据库转为冷存储文件
+
+        output/{type}/{date}.db -> output/{type}/{date}.db.zst（或 .db.xz / .db.gz）
+
+        Args:
+            after_days: 超过该天数的日期转为冷存储（0 表示不转换，最少为 1 天，当天数据库不会被转换）
+            codec: 压缩算法（zstd / xz / gzip）
+
+        Returns:
+            转换的数据库数量
+        """
+        if after_days <= 0:
+            return 0
+
+        cutoff = (self._get_configured_time() - timedelta(days=after_days)).strftime("%Y-%m-%d")
+        frozen_count = 0
+
+        for db_type in ["news", "rss"]:
+            db_dir = self.data_dir / db_type
+            if not db_dir.exists():
+                continue
+
+            for db_file in sorted(db_dir.glob("*.db")):
+                date_match = re.match(r'^(\d{4}-\d{2}-\d{2})\.db$', db_file.name)
+                if not date_match or date_match.group(1) >= cutoff:
+                    continue
+
+                # 先关闭数据库连接（含该日期解压缓存上的只读连接）
+                for path in (db_file, self.data_dir / COLD_CACHE_DIR / db_type / db_file.name):
+                    conn = self._db_connections.pop(str(path), None)
+                    if conn is not None:
+                        conn.close()
+
+                try:
+                    original_size = db_file.stat().st_size
+                    cold_path = freeze_db(db_file, codec)
+                    frozen_count += 1
+                    print(
+                        f"[本地存储] 转为冷存储: {db_type}/{cold_path.name} "
+                        f"({original_size / 1024:.1f} KB -> {cold_path.stat().st_size / 1024:.1f} KB)"
+                    )
+                except Exception as e:
+                    print(f"[本地存储] 转为冷存储失败 {db_file}: {e}")
+
+        if frozen_count > 0:
+            print(f"[本地存储] 共转换 {frozen_count} 个数据库为冷存储")
+
+        return frozen_count
+
     def has_pushed_today(self, date: Optional[str] = None) -> bool:
         """
         检查指定日期是否已推送过
@@ -903,7 +826,10 @@ class LocalStorageBackend(StorageBackend):
             是否已推送
         """
         try:
-            conn = self._get_connection(date)
+            conn = self._get_read_connection(date)
+            if conn is None:
+                return False
+
             cursor = conn.cursor()
 
             target_date = self._format_date_folder(date)
@@ -939,14 +865,7 @@ class LocalStorageBackend(StorageBackend):
             target_date = self._format_date_folder(date)
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            cursor.execute("""
-                INSERT INTO push_records (date, pushed, push_time, report_type, created_at)
-                VALUES (?, 1, ?, ?, ?)
-                ON CONFLICT(date) DO UPDATE SET
-                    pushed = 1,
-                    push_time = excluded.push_time,
-                    report_type = excluded.report_type
-            """, (target_date, now_str, report_type, now_str))
+            write_push_record(cursor, target_date, report_type, now_str)
 
             conn.commit()
 
@@ -977,112 +896,10 @@ class LocalStorageBackend(StorageBackend):
 
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            # 同步 RSS 源信息到 rss_feeds 表
-            for feed_id, feed_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO rss_feeds (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (feed_id, feed_name, now_str))
-
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-
-            for feed_id, rss_list in data.items.items():
-                for item in rss_list:
-                    try:
-                        # 检查是否已存在（通过 URL + feed_id）
-                        if item.url:
-                            cursor.execute("""
-                                SELECT id, title FROM rss_items
-                                WHERE url = ? AND feed_id = ?
-                            """, (item.url, feed_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id = existing[0]
-                                cursor.execute("""
-                                    UPDATE rss_items SET
-                                        title = ?,
-                                        published_at = ?,
-                                        summary = ?,
-                                        author = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.published_at, item.summary,
-                                      item.author, data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录
-                                cursor.execute("""
-                                    INSERT INTO rss_items
-                                    (title, feed_id, url, published_at, summary, author,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, feed_id, item.url, item.published_at,
-                                      item.summary, item.author, data.crawl_time,
-                                      data.crawl_time, now_str, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空，直接插入
-                            cursor.execute("""
-                                INSERT INTO rss_items
-                                (title, feed_id, url, published_at, summary, author,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, feed_id, "", item.published_at,
-                                  item.summary, item.author, data.crawl_time,
-                                  data.crawl_time, now_str, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"[本地存储] 保存 RSS 条目失败 [{item.title[:30]}...]: {e}")
-
-            total_items = new_count + updated_count
-
-            # 记录抓取信息
-            cursor.execute("""
-                INSERT OR REPLACE INTO rss_crawl_records
-                (crawl_time, total_items, created_at)
-                VALUES (?, ?, ?)
-            """, (data.crawl_time, total_items, now_str))
-
-            # 记录抓取状态
-            cursor.execute("""
-                SELECT id FROM rss_crawl_records WHERE crawl_time = ?
-            """, (data.crawl_time,))
-            record_row = cursor.fetchone()
-            if record_row:
-                crawl_record_id = record_row[0]
-
-                # 记录成功的源
-                for feed_id in data.items.keys():
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, feed_id))
-
-                # 记录失败的源
-                for failed_id in data.failed_ids:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO rss_feeds (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
-
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
+            # 写入源信息、RSS 条目、抓取记录和源状态
+            new_count, updated_count = write_rss_data(
+                cursor, data, now_str, log_prefix="[本地存储]"
+            )
 
             conn.commit()
 
@@ -1109,7 +926,10 @@ class LocalStorageBackend(StorageBackend):
             RSSData 对象，如果没有数据返回 None
         """
         try:
-            conn = self._get_connection(date, db_type="rss")
+            conn = self._get_read_connection(date, db_type="rss")
+            if conn is None:
+                return None
+
             cursor = conn.cursor()
 
             # 获取所有 RSS 数据
@@ -1183,6 +1003,35 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 读取 RSS 数据失败: {e}")
             return None
 
+    def iter_rss_items(
+        self,
+        date: Optional[str] = None,
+        feed_ids: Optional[Sequence[str]] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        keyword: Optional[str] = None,
+    ) -> Iterator[RSSItem]:
+        """
+        流式读取指定日期的 RSS 条目（源、时间段、关键词过滤在 SQL 中完成）
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+            feed_ids: Feed ID 列表，None 表示所有源
+            start_time: 开始抓取时间（HH-MM，含）
+            end_time: 结束抓取时间（HH-MM，含）
+            keyword: 关键词（匹配标题或摘要）
+
+        Yields:
+            符合条件的 RSSItem
+        """
+        try:
+            conn = self._get_read_connection(date, db_type="rss")
+            if conn is None:
+                return
+            yield from iter_rss_items_in_db(conn, feed_ids, start_time, end_time, keyword)
+        except sqlite3.Error as e:
+            print(f"[本地存储] 流式读取 RSS 数据失败: {e}")
+
     def detect_new_rss_items(self, current_data: RSSData) -> Dict[str, List[RSSItem]]:
         """
         检测新增的 RSS 条目（增量模式）
@@ -1251,11 +1100,10 @@ class LocalStorageBackend(StorageBackend):
             最新抓取的 RSS 数据，如果没有数据返回 None
         """
         try:
-            db_path = self._get_db_path(date, db_type="rss")
-            if not db_path.exists():
+            conn = self._get_read_connection(date, db_type="rss")
+            if conn is None:
                 return None
 
-            conn = self._get_connection(date, db_type="rss")
             cursor = conn.cursor()
 
             # 获取最新的抓取时间
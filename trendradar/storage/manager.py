@@ -6,9 +6,9 @@
 """
 
 import os
-from typing import Optional
+from typing import Iterator, Optional
 
-from trendradar.storage.base import StorageBackend, NewsData, RSSData
+from trendradar.storage.base import StorageBackend, NewsData, NewsItem, RSSData, RSSItem
 
 
 # 存储管理器单例
@@ -21,7 +21,7 @@ class StorageManager:
 
     功能：
     - 自动检测运行环境（GitHub Actions / Docker / 本地）
-    - 根据配置选择存储后端（local / remote / auto）
+    - 根据配置选择存储后端（local / remote / postgres / auto）
     - 提供统一的存储接口
     - 支持从远程拉取数据到本地
     """
@@ -38,12 +38,17 @@ class StorageManager:
         pull_enabled: bool = False,
         pull_days: int = 0,
         timezone: str = "Asia/Shanghai",
+        sqlite_profile: Optional[dict] = None,
+        archive_enabled: bool = False,
+        cold_after_days: int = 0,
+        cold_codec: str = "zstd",
+        postgres_config: Optional[dict] = None,
     ):
         """
         初始化存储管理器
 
         Args:
-            backend_type: 存储后端类型 (local / remote / auto)
+            backend_type: 存储后端类型 (local / remote / postgres / auto)
             data_dir: 本地数据目录
             enable_txt: 是否启用 TXT 快照
             enable_html: 是否启用 HTML 报告
@@ -53,6 +58,11 @@ class StorageManager:
             pull_enabled: 是否启用启动时自动拉取
             pull_days: 拉取最近 N 天的数据
             timezone: 时区配置（默认 Asia/Shanghai）
+            sqlite_profile: SQLite 连接参数（journal_mode, synchronous, mmap_size 等）
+            archive_enabled: 是否在保存后增量更新多日汇总归档（仅本地后端）
+            cold_after_days: 超过 N 天的每日数据库转为压缩冷存储（0 = 不转换）
+            cold_codec: 冷存储压缩算法（zstd / xz / gzip）
+            postgres_config: PostgreSQL 配置（url, pool_size, max_overflow）
         """
         self.backend_type = backend_type
         self.data_dir = data_dir
@@ -64,6 +74,11 @@ class StorageManager:
         self.pull_enabled = pull_enabled
         self.pull_days = pull_days
         self.timezone = timezone
+        self.sqlite_profile = sqlite_profile
+        self.archive_enabled = archive_enabled
+        self.cold_after_days = cold_after_days
+        self.cold_codec = cold_codec
+        self.postgres_config = postgres_config or {}
 
         self._backend: Optional[StorageBackend] = None
         self._remote_backend: Optional[StorageBackend] = None
@@ -137,6 +152,8 @@ class StorageManager:
                 enable_txt=self.enable_txt,
                 enable_html=self.enable_html,
                 timezone=self.timezone,
+                sqlite_profile=self.sqlite_profile,
+                compact_segments=self.remote_config.get("compact_segments", 12),
             )
         except ImportError as e:
             print(f"[存储管理器] 远程后端导入失败: {e}")
@@ -146,11 +163,45 @@ class StorageManager:
             print(f"[存储管理器] 远程后端初始化失败: {e}")
             return None
 
+    def _create_postgres_backend(self) -> Optional[StorageBackend]:
+        """创建 PostgreSQL 存储后端"""
+        database_url = self.postgres_config.get("url") or os.environ.get("DATABASE_URL", "")
+        if not database_url:
+            print("[存储管理器] 未配置 PostgreSQL 连接地址（storage.postgres.url 或 DATABASE_URL）")
+            return None
+
+        try:
+            from trendradar.storage.postgres import PostgresStorageBackend
+
+            return PostgresStorageBackend(
+                database_url=database_url,
+                pool_size=self.postgres_config.get("pool_size", 5),
+                max_overflow=self.postgres_config.get("max_overflow", 10),
+                data_dir=self.data_dir,
+                enable_txt=self.enable_txt,
+                enable_html=self.enable_html,
+                timezone=self.timezone,
+            )
+        except ImportError as e:
+            print(f"[存储管理器] PostgreSQL 后端导入失败: {e}")
+            return None
+        except Exception as e:
+            print(f"[存储管理器] PostgreSQL 后端初始化失败: {e}")
+            return None
+
     def get_backend(self) -> StorageBackend:
         """获取存储后端实例"""
         if self._backend is None:
             resolved_type = self._resolve_backend_type()
 
+            if resolved_type == "postgres":
+                self._backend = self._create_postgres_backend()
+                if self._backend:
+                    print(f"[存储管理器] 使用 PostgreSQL 存储后端")
+                else:
+                    print("[存储管理器] 回退到本地存储")
+                    resolved_type = "local"
+
             if resolved_type == "remote":
                 self._backend = self._create_remote_backend()
                 if self._backend:
@@ -167,6 +218,7 @@ class StorageManager:
                     enable_txt=self.enable_txt,
                     enable_html=self.enable_html,
                     timezone=self.timezone,
+                    sqlite_profile=self.sqlite_profile,
                 )
                 print(f"[存储管理器] 使用本地存储后端 (数据目录: {self.data_dir})")
 
@@ -197,13 +249,31 @@ class StorageManager:
         # 调用拉取方法
         return self._remote_backend.pull_recent_days(self.pull_days, self.data_dir)
 
+    def _sync_archive(self, db_type: str, date: str) -> None:
+        """增量更新多日汇总归档（仅本地后端，失败不影响主流程）"""
+        if not self.archive_enabled or self.get_backend().backend_name != "local":
+            return
+
+        try:
+            from trendradar.storage.archive import ArchiveStore
+
+            ArchiveStore(self.data_dir, self.sqlite_profile).sync(db_type, [date])
+        except Exception as e:
+            print(f"[存储管理器] 更新汇总归档失败: {e}")
+
     def save_news_data(self, data: NewsData) -> bool:
         """保存新闻数据"""
-        return self.get_backend().save_news_data(data)
+        success = self.get_backend().save_news_data(data)
+        if success:
+            self._sync_archive("news", data.date)
+        return success
 
     def save_rss_data(self, data: RSSData) -> bool:
         """保存 RSS 数据"""
-        return self.get_backend().save_rss_data(data)
+        success = self.get_backend().save_rss_data(data)
+        if success:
+            self._sync_archive("rss", data.date)
+        return success
 
     def get_rss_data(self, date: Optional[str] = None) -> Optional[RSSData]:
         """获取指定日期的所有 RSS 数据（当日汇总模式）"""
@@ -225,6 +295,14 @@ class StorageManager:
         """获取最新抓取数据"""
         return self.get_backend().get_latest_crawl_data(date)
 
+    def iter_news_items(self, date: Optional[str] = None, **filters) -> Iterator[NewsItem]:
+        """流式读取新闻（filters: platform_ids、start_time、end_time、keyword）"""
+        return self.get_backend().iter_news_items(date, **filters)
+
+    def iter_rss_items(self, date: Optional[str] = None, **filters) -> Iterator[RSSItem]:
+        """流式读取 RSS 条目（filters: feed_ids、start_time、end_time、keyword）"""
+        return self.get_backend().iter_rss_items(date, **filters)
+
     def detect_new_titles(self, current_data: NewsData) -> dict:
         """检测新增标题"""
         return self.get_backend().detect_new_titles(current_data)
@@ -250,7 +328,7 @@ class StorageManager:
 
     def cleanup_old_data(self) -> int:
         """
-        清理过期数据
+        清理过期数据，并将未过期的往日数据库转为冷存储
 
         Returns:
             删除的日期目录数量
@@ -268,6 +346,13 @@ class StorageManager:
             if self._remote_backend:
                 total_deleted += self._remote_backend.cleanup_old_data(self.remote_retention_days)
 
+        # 转为冷存储（过期数据已先清理，不会被转换）
+        if self.cold_after_days > 0:
+            try:
+                self.get_backend().freeze_old_data(self.cold_after_days, self.cold_codec)
+            except Exception as e:
+                print(f"[存储管理器] 转为冷存储失败: {e}")
+
         return total_deleted
 
     @property
@@ -319,6 +404,11 @@ def get_storage_manager(
     pull_enabled: bool = False,
     pull_days: int = 0,
     timezone: str = "Asia/Shanghai",
+    sqlite_profile: Optional[dict] = None,
+    archive_enabled: bool = False,
+    cold_after_days: int = 0,
+    cold_codec: str = "zstd",
+    postgres_config: Optional[dict] = None,
     force_new: bool = False,
 ) -> StorageManager:
     """
@@ -335,6 +425,11 @@ def get_storage_manager(
         pull_enabled: 是否启用启动时自动拉取
         pull_days: 拉取最近 N 天的数据
         timezone: 时区配置（默认 Asia/Shanghai）
+        sqlite_profile: SQLite 连接参数
+        archive_enabled: 是否启用多日汇总归档
+        cold_after_days: 超过 N 天的每日数据库转为压缩冷存储（0 = 不转换）
+        cold_codec: 冷存储压缩算法
+        postgres_config: PostgreSQL 配置
         force_new: 是否强制创建新实例
 
     Returns:
@@ -354,6 +449,11 @@ def get_storage_manager(
             pull_enabled=pull_enabled,
             pull_days=pull_days,
             timezone=timezone,
+            sqlite_profile=sqlite_profile,
+            archive_enabled=archive_enabled,
+            cold_after_days=cold_after_days,
+            cold_codec=cold_codec,
+            postgres_config=postgres_config,
         )
 
     return _storage_manager
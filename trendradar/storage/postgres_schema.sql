@@ -0,0 +1,162 @@
+-- TrendRadar PostgreSQL 存储表结构
+-- 与 SQLite 每日数据库（schema.sql / rss_schema.sql）一一对应，所有按日数据增加 crawl_date 列
+-- 数据量大的表按 crawl_date 范围分区，每月一个分区（news_items_p202501 等），写入时按需创建
+
+-- ============================================
+-- 平台信息表（跨日期共享，名称取最新一次抓取）
+-- ============================================
+CREATE TABLE IF NOT EXISTS platforms (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    is_active BOOLEAN DEFAULT TRUE,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ============================================
+-- 新闻条目表（按月分区）
+-- 同一天内以 URL + platform_id 为唯一标识，写入时按日期加锁保证去重
+-- ============================================
+CREATE TABLE IF NOT EXISTS news_items (
+    id BIGSERIAL,
+    crawl_date DATE NOT NULL,
+    title TEXT NOT NULL,
+    platform_id TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    url TEXT DEFAULT '',
+    mobile_url TEXT DEFAULT '',
+    first_crawl_time TEXT NOT NULL,      -- 首次抓取时间（HH-MM）
+    last_crawl_time TEXT NOT NULL,       -- 最后抓取时间（HH-MM）
+    crawl_count INTEGER DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (crawl_date, id)
+) PARTITION BY RANGE (crawl_date);
+
+-- ============================================
+-- 标题变更历史表（按月分区）
+-- ============================================
+CREATE TABLE IF NOT EXISTS title_changes (
+    id BIGSERIAL,
+    crawl_date DATE NOT NULL,
+    news_item_id BIGINT NOT NULL,
+    old_title TEXT NOT NULL,
+    new_title TEXT NOT NULL,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (crawl_date, id)
+) PARTITION BY RANGE (crawl_date);
+
+-- ============================================
+-- 排名历史表（按月分区）
+-- ============================================
+CREATE TABLE IF NOT EXISTS rank_history (
+    id BIGSERIAL,
+    crawl_date DATE NOT NULL,
+    news_item_id BIGINT NOT NULL,
+    rank INTEGER NOT NULL,
+    crawl_time TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (crawl_date, id)
+) PARTITION BY RANGE (crawl_date);
+
+-- ============================================
+-- 抓取记录与来源状态表
+-- ============================================
+CREATE TABLE IF NOT EXISTS crawl_records (
+    crawl_date DATE NOT NULL,
+    crawl_time TEXT NOT NULL,
+    total_items INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (crawl_date, crawl_time)
+);
+
+CREATE TABLE IF NOT EXISTS crawl_source_status (
+    crawl_date DATE NOT NULL,
+    crawl_time TEXT NOT NULL,
+    platform_id TEXT NOT NULL,
+    status TEXT NOT NULL CHECK(status IN ('success', 'failed')),
+    PRIMARY KEY (crawl_date, crawl_time, platform_id)
+);
+
+-- ============================================
+-- 推送记录表
+-- ============================================
+CREATE TABLE IF NOT EXISTS push_records (
+    date DATE PRIMARY KEY,
+    pushed BOOLEAN DEFAULT FALSE,
+    push_time TEXT,
+    report_type TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ============================================
+-- RSS 源信息表（跨日期共享）
+-- ============================================
+CREATE TABLE IF NOT EXISTS rss_feeds (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    feed_url TEXT DEFAULT '',
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ============================================
+-- RSS 条目表（按月分区）
+-- ============================================
+CREATE TABLE IF NOT EXISTS rss_items (
+    id BIGSERIAL,
+    crawl_date DATE NOT NULL,
+    title TEXT NOT NULL,
+    feed_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    published_at TEXT,
+    summary TEXT,
+    author TEXT,
+    first_crawl_time TEXT NOT NULL,
+    last_crawl_time TEXT NOT NULL,
+    crawl_count INTEGER DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (crawl_date, id)
+) PARTITION BY RANGE (crawl_date);
+
+CREATE TABLE IF NOT EXISTS rss_crawl_records (
+    crawl_date DATE NOT NULL,
+    crawl_time TEXT NOT NULL,
+    total_items INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (crawl_date, crawl_time)
+);
+
+CREATE TABLE IF NOT EXISTS rss_crawl_status (
+    crawl_date DATE NOT NULL,
+    crawl_time TEXT NOT NULL,
+    feed_id TEXT NOT NULL,
+    status TEXT NOT NULL CHECK(status IN ('success', 'failed')),
+    error_message TEXT,
+    PRIMARY KEY (crawl_date, crawl_time, feed_id)
+);
+
+-- ============================================
+-- 索引定义（建在分区父表上，自动应用到每个分区）
+-- ============================================
+
+-- 同日 URL 去重查找
+CREATE INDEX IF NOT EXISTS idx_pg_news_url_platform ON news_items(crawl_date, platform_id, url);
+
+-- 最新一次抓取的数据
+CREATE INDEX IF NOT EXISTS idx_pg_news_last_crawl ON news_items(crawl_date, last_crawl_time);
+
+-- 新增标题检测（按首次抓取时间取历史标题）
+CREATE INDEX IF NOT EXISTS idx_pg_news_first_crawl ON news_items(crawl_date, first_crawl_time, platform_id, title);
+
+-- 单条新闻的排名历史
+CREATE INDEX IF NOT EXISTS idx_pg_rank_history_item_time ON rank_history(crawl_date, news_item_id, crawl_time, rank);
+
+CREATE INDEX IF NOT EXISTS idx_pg_title_changes_item ON title_changes(crawl_date, news_item_id);
+
+CREATE INDEX IF NOT EXISTS idx_pg_rss_url_feed ON rss_items(crawl_date, feed_id, url);
+
+CREATE INDEX IF NOT EXISTS idx_pg_rss_last_crawl ON rss_items(crawl_date, last_crawl_time);
+
+CREATE INDEX IF NOT EXISTS idx_pg_rss_published ON rss_items(crawl_date, published_at DESC);
@@ -4,7 +4,8 @@
 
 支持 Cloudflare R2、阿里云 OSS、腾讯云 COS、AWS S3、MinIO 等
 使用 S3 兼容 API (boto3) 访问对象存储
-数据流程：下载当天 SQLite → 合并新数据 → 上传回远程
+数据流程：下载当天基础库并重放增量分段 → 合并新数据 → 上传本次写入的增量分段
+（分段累积到阈值后压实为当天基础库，见 trendradar.storage.segments）
 """
 
 import pytz
@@ -13,9 +14,10 @@ import shutil
 import sys
 import tempfile
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 try:
     import boto3
@@ -29,12 +31,44 @@ except ImportError:
     ClientError = Exception
 
 from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+from trendradar.storage.cold import COLD_SUFFIXES, freeze_db, is_cold_file, thaw_db
+from trendradar.storage.segments import (
+    SEGMENT_NEWS,
+    SEGMENT_PUSH,
+    SEGMENT_RSS,
+    SEGMENT_SUFFIX,
+    apply_segment,
+    decode_segment,
+    encode_segment,
+    ensure_segment_table,
+    get_applied_segments,
+    get_sync_state,
+    mark_segments_applied,
+    new_segment_key,
+    segment_prefix,
+    set_sync_state,
+)
+from trendradar.storage.sqlite_helpers import (
+    checkpoint_sqlite,
+    connect_sqlite,
+    detect_new_titles_in_db,
+    ensure_schema,
+    iter_news_items_in_db,
+    iter_rss_items_in_db,
+    parse_ranks,
+    rank_history_column,
+    write_news_data,
+    write_push_record,
+    write_rss_data,
+)
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
     format_time_filename,
 )
-from trendradar.utils.url import normalize_url
+
+# 拉取大文件时每次范围请求的字节数（小于该值的对象整体读取）
+_RANGE_CHUNK_SIZE = 8 * 1024 * 1024
 
 
 class RemoteStorageBackend(StorageBackend):
@@ -45,6 +79,7 @@ class RemoteStorageBackend(StorageBackend):
     - 使用 S3 兼容 API 访问远程存储
     - 支持 Cloudflare R2、阿里云 OSS、腾讯云 COS、AWS S3、MinIO 等
     - 下载 SQLite 到临时目录进行操作
+    - 每次写入只上传一个增量分段，分段累积到阈值后压实为当天数据库
     - 支持数据合并和上传
     - 支持从远程拉取历史数据到本地
     - 运行结束后自动清理临时文件
@@ -61,6 +96,8 @@ class RemoteStorageBackend(StorageBackend):
         enable_html: bool = True,
         temp_dir: Optional[str] = None,
         timezone: str = "Asia/Shanghai",
+        sqlite_profile: Optional[Dict[str, Any]] = None,
+        compact_segments: int = 12,
     ):
         """
         初始化远程存储后端
@@ -75,6 +112,8 @@ class RemoteStorageBackend(StorageBackend):
             enable_html: 是否启用 HTML 报告
             temp_dir: 临时目录路径（默认使用系统临时目录）
             timezone: 时区配置（默认 Asia/Shanghai）
+            sqlite_profile: SQLite 连接参数（None 表示使用默认值）
+            compact_segments: 当天增量分段累积到该数量时压实为基础库（最小为 1）
         """
         if not HAS_BOTO3:
             raise ImportError("远程存储后端需要安装 boto3: pip install boto3")
@@ -85,6 +124,8 @@ class RemoteStorageBackend(StorageBackend):
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
+        self.sqlite_profile = sqlite_profile
+        self.compact_segments = max(1, int(compact_segments or 1))
 
         # 创建临时目录
         self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.mkdtemp(prefix="trendradar_"))
@@ -117,6 +158,11 @@ class RemoteStorageBackend(StorageBackend):
         # 跟踪下载的文件（用于清理）
         self._downloaded_files: List[Path] = []
         self._db_connections: Dict[str, sqlite3.Connection] = {}
+        # 各数据库在远程尚未压实的分段数量（db_path -> 数量）
+        self._pending_segments: Dict[str, int] = {}
+        # 打开各数据库时远程基础库的 ETag（db_path -> ETag，空字符串表示基础库不存在），
+        # 压实时以此作为上传条件，避免覆盖其他写入方已压实的基础库
+        self._base_etags: Dict[str, str] = {}
 
         print(f"[远程存储] 初始化完成，存储桶: {bucket_name}，签名版本: {signature_version}")
 
@@ -195,9 +241,127 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 检查对象存在性异常 ({r2_key}): {e}")
             return False
 
-    def _download_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> Optional[Path]:
+    @staticmethod
+    def _is_not_found(error: Exception) -> bool:
+        """判断 ClientError 是否为对象不存在（S3 兼容存储可能返回 404, NoSuchKey 或其他变体）"""
+        response = getattr(error, "response", None) or {}
+        return response.get("Error", {}).get("Code", "") in ("404", "NoSuchKey", "Not Found")
+
+    def _get_object_bytes(self, r2_key: str) -> bytes:
+        """
+        读取远程对象内容
+
+        使用 get_object + iter_chunks，以正确处理腾讯云 COS 的 chunked transfer encoding。
+
+        Args:
+            r2_key: 远程对象键
+
+        Returns:
+            对象内容
+        """
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=r2_key)
+        return b"".join(response['Body'].iter_chunks(chunk_size=1024*1024))
+
+    def _put_object_bytes(
+        self,
+        r2_key: str,
+        content: bytes,
+        content_type: str,
+        expected_etag: Optional[str] = None,
+    ) -> str:
+        """
+        上传对象内容
+
+        传入 bytes 并明确设置 ContentLength，避免 chunked transfer encoding
+        （腾讯云 COS 等 S3 兼容服务可能无法正确处理）。put_object 失败时直接抛出异常，
+        成功返回即表示对象已写入，无需再用 HEAD 验证。
+
+        Args:
+            r2_key: 远程对象键
+            content: 对象内容
+            content_type: 内容类型
+            expected_etag: 条件上传（可选）：远程对象当前的 ETag，空字符串表示对象必须不存在；
+                条件不满足时抛出 ClientError（PreconditionFailed）
+
+        Returns:
+            新对象的 ETag
+        """
+        kwargs = {}
+        if expected_etag is not None:
+            if expected_etag:
+                kwargs["IfMatch"] = expected_etag
+            else:
+                kwargs["IfNoneMatch"] = "*"
+        response = self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=r2_key,
+            Body=content,
+            ContentLength=len(content),
+            ContentType=content_type,
+            **kwargs,
+        )
+        return response.get('ETag', "")
+
+    @staticmethod
+    def _is_precondition_failed(error: Exception) -> bool:
+        """判断 ClientError 是否为条件上传失败（对象已被其他写入方修改）"""
+        response = getattr(error, "response", None) or {}
+        return response.get("Error", {}).get("Code", "") in (
+            "PreconditionFailed", "412", "ConditionalRequestConflict",
+        )
+
+    def _delete_objects(self, keys: List[str]) -> int:
+        """
+        批量删除远程对象（每次最多 1000 个）
+
+        Args:
+            keys: 对象键列表
+
+        Returns:
+            删除请求成功的对象数量
+        """
+        deleted = 0
+        batch_size = 1000
+        for i in range(0, len(keys), batch_size):
+            batch = keys[i:i + batch_size]
+            try:
+                self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in batch]}
+                )
+                deleted += len(batch)
+            except Exception as e:
+                print(f"[远程存储] 批量删除失败: {e}")
+        return deleted
+
+    def _list_segment_keys(self, date: Optional[str] = None, db_type: str = "news") -> List[str]:
         """
-        从远程存储下载当天的 SQLite 文件到本地临时目录
+        列出某日在远程尚未压实的增量分段（按写入顺序）
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            分段对象键列表
+        """
+        prefix = segment_prefix(db_type, self._format_date_folder(date))
+        keys = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                if obj['Key'].endswith(SEGMENT_SUFFIX):
+                    keys.append(obj['Key'])
+        return sorted(keys)
+
+    def _download_sqlite(
+        self,
+        date: Optional[str] = None,
+        db_type: str = "news",
+        local_path: Optional[Path] = None,
+    ) -> Optional[Path]:
+        """
+        从远程存储下载当天的 SQLite 基础库到本地
 
         使用 get_object + iter_chunks 替代 download_file，
         以正确处理腾讯云 COS 的 chunked transfer encoding。
@@ -205,18 +369,28 @@ class RemoteStorageBackend(StorageBackend):
         Args:
             date: 日期字符串
             db_type: 数据库类型 ("news" 或 "rss")
+            local_path: 本地保存路径，默认为临时目录中的当天数据库
 
         Returns:
             本地文件路径，如果不存在返回 None
         """
         r2_key = self._get_remote_db_key(date, db_type)
-        local_path = self._get_local_db_path(date, db_type)
+        if local_path is None:
+            local_path = self._get_local_db_path(date, db_type)
 
         # 确保目录存在
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
         # 先检查文件是否存在
         if not self._check_object_exists(r2_key):
+            # 基础库不存在（冷存储不占用基础库键），压实时要求基础库仍不存在
+            self._base_etags[str(local_path)] = ""
+            cold_key = self._find_cold_key(r2_key)
+            if cold_key:
+                self._download_cold_as_db(cold_key, local_path)
+                self._downloaded_files.append(local_path)
+                print(f"[远程存储] 已下载冷存储: {cold_key} -> {local_path}")
+                return local_path
             print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
             return None
 
@@ -227,25 +401,71 @@ class RemoteStorageBackend(StorageBackend):
             with open(local_path, 'wb') as f:
                 for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
                     f.write(chunk)
+            self._base_etags[str(local_path)] = response.get('ETag', "")
             self._downloaded_files.append(local_path)
             print(f"[远程存储] 已下载: {r2_key} -> {local_path}")
             return local_path
         except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            # S3 兼容存储可能返回不同的错误码
-            if error_code in ("404", "NoSuchKey", "Not Found"):
+            if self._is_not_found(e):
+                self._base_etags[str(local_path)] = ""
                 print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
                 return None
             else:
+                error_code = e.response.get("Error", {}).get("Code", "")
                 print(f"[远程存储] 下载失败 (错误码: {error_code}): {e}")
                 raise
         except Exception as e:
             print(f"[远程存储] 下载异常: {e}")
             raise
 
+    def _find_cold_key(self, r2_key: str) -> Optional[str]:
+        """
+        查找基础库对应的冷存储对象（如 news/2025-12-28.db.zst）
+
+        Args:
+            r2_key: 基础库对象键
+
+        Returns:
+            冷存储对象键，不存在时返回 None
+        """
+        response = self.s3_client.list_objects_v2(Bucket=self.bucket_name, Prefix=f"{r2_key}.")
+        for obj in response.get('Contents', []):
+            if is_cold_file(obj['Key']):
+                return obj['Key']
+        return None
+
+    def _download_cold_as_db(
+        self,
+        cold_key: str,
+        local_path: Path,
+        size: Optional[int] = None,
+        etag: str = "",
+    ) -> None:
+        """
+        下载冷存储对象并解压为普通 SQLite 数据库
+
+        Args:
+            cold_key: 冷存储对象键
+            local_path: 解压后的数据库路径
+            size: 对象大小（可选，已知时按范围分块下载并支持断点续传）
+            etag: 对象 ETag
+        """
+        cold_path = Path(f"{local_path}{cold_key[cold_key.rindex('.db') + 3:]}")
+        try:
+            if size is None:
+                cold_path.write_bytes(self._get_object_bytes(cold_key))
+            else:
+                self._download_object(cold_key, cold_path, size, etag)
+            thaw_db(cold_path, local_path)
+        finally:
+            cold_path.unlink(missing_ok=True)
+
     def _upload_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> bool:
         """
-        上传本地 SQLite 文件到远程存储
+        上传本地 SQLite 文件到远程存储（压实增量分段时使用）
+
+        仅当远程基础库仍是打开本地数据库时的版本才会覆盖（按 ETag 条件上传），
+        其他写入方已压实过基础库时放弃上传，避免丢失其已删除分段中的数据。
 
         Args:
             date: 日期字符串
@@ -261,106 +481,221 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 本地文件不存在，无法上传: {local_path}")
             return False
 
-        try:
-            # 获取本地文件大小
-            local_size = local_path.stat().st_size
-            print(f"[远程存储] 准备上传: {local_path} ({local_size} bytes) -> {r2_key}")
+        expected_etag = self._base_etags.get(str(local_path))
+        if expected_etag is None:
+            print(f"[远程存储] 本地文件并非本次从远程打开，跳过上传: {local_path}")
+            return False
 
+        # WAL 模式下部分数据仍在 -wal 文件中，上传前合并回主文件
+        conn = self._db_connections.get(str(local_path))
+        if conn is not None:
+            checkpoint_sqlite(conn)
+
+        try:
             # 读取文件内容为 bytes 后上传
             # 避免传入文件对象时 requests 库使用 chunked transfer encoding
-            # 腾讯云 COS 等 S3 兼容服务可能无法正确处理 chunked encoding
             with open(local_path, 'rb') as f:
                 file_content = f.read()
 
-            # 使用 put_object 并明确设置 ContentLength，确保不使用 chunked encoding
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=r2_key,
-                Body=file_content,
-                ContentLength=local_size,
-                ContentType='application/x-sqlite3',
+            print(f"[远程存储] 准备上传: {local_path} ({len(file_content)} bytes) -> {r2_key}")
+            self._base_etags[str(local_path)] = self._put_object_bytes(
+                r2_key, file_content, 'application/x-sqlite3', expected_etag
             )
             print(f"[远程存储] 已上传: {local_path} -> {r2_key}")
+            return True
 
-            # 验证上传成功
-            if self._check_object_exists(r2_key):
-                print(f"[远程存储] 上传验证成功: {r2_key}")
-                return True
+        except ClientError as e:
+            if self._is_precondition_failed(e):
+                print(f"[远程存储] 基础库已被其他写入方更新，跳过本次压实: {r2_key}")
             else:
-                print(f"[远程存储] 上传验证失败: 文件未在远程存储中找到")
-                return False
-
+                print(f"[远程存储] 上传失败: {e}")
+            return False
         except Exception as e:
             print(f"[远程存储] 上传失败: {e}")
             return False
 
-    def _get_connection(self, date: Optional[str] = None, db_type: str = "news") -> sqlite3.Connection:
+    def _sync_segments(
+        self,
+        conn: sqlite3.Connection,
+        date: Optional[str],
+        db_type: str,
+        keys: Optional[List[str]] = None,
+    ) -> bool:
         """
-        获取数据库连接
+        下载并重放本地数据库中尚未应用的增量分段
 
         Args:
+            conn: 当日数据库连接
             date: 日期字符串
             db_type: 数据库类型 ("news" 或 "rss")
+            keys: 已列举的分段键（可选，缺省时重新列举）
 
         Returns:
-            数据库连接
+            是否已追平；分段在读取期间被压实删除时返回 False（需重新下载基础库）
         """
-        local_path = self._get_local_db_path(date, db_type)
-        db_path = str(local_path)
+        if keys is None:
+            keys = self._list_segment_keys(date, db_type)
+        applied = get_applied_segments(conn)
+        pending = [key for key in keys if key not in applied]
+        self._pending_segments[str(self._get_local_db_path(date, db_type))] = len(keys)
 
-        if db_path not in self._db_connections:
-            # 确保目录存在
-            local_path.parent.mkdir(parents=True, exist_ok=True)
+        for key in pending:
+            try:
+                content = self._get_object_bytes(key)
+            except ClientError as e:
+                if self._is_not_found(e):
+                    print(f"[远程存储] 分段已被压实: {key}")
+                    return False
+                raise
+            apply_segment(conn, key, decode_segment(content), log_prefix="[远程存储]")
+
+        if pending:
+            print(f"[远程存储] 已应用 {len(pending)} 个增量分段: {db_type}/{self._format_date_folder(date)}")
+        return True
+
+    def _open_day_db(self, date: Optional[str], db_type: str, local_path: Path) -> sqlite3.Connection:
+        """
+        打开当天数据库并追平远程增量分段
+
+        本地文件不存在时先下载基础库；分段在读取期间被其他写入方压实时，
+        删除本地文件重新下载基础库后再追平一次。
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+            local_path: 本地数据库路径
 
-            # 如果本地不存在，尝试从远程存储下载
+        Returns:
+            数据库连接
+        """
+        for attempt in range(2):
             if not local_path.exists():
-                self._download_sqlite(date, db_type)
+                self._download_sqlite(date, db_type, local_path)
 
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
+            conn = connect_sqlite(str(local_path), self.sqlite_profile)
             self._init_tables(conn, db_type)
-            self._db_connections[db_path] = conn
+            if self._sync_segments(conn, date, db_type) or attempt == 1:
+                return conn
 
-        return self._db_connections[db_path]
+            conn.close()
+            self._base_etags.pop(str(local_path), None)
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{local_path}{suffix}").unlink(missing_ok=True)
+        return conn
 
-    def _get_schema_path(self, db_type: str = "news") -> Path:
+    def _publish_segment(
+        self,
+        segment_key: str,
+        kind: str,
+        saved_at: str,
+        payload: Dict[str, Any],
+        date: Optional[str] = None,
+        db_type: str = "news",
+    ) -> bool:
         """
-        获取 schema.sql 文件路径
+        上传本次写入的增量分段，累积到阈值时压实为基础库
 
         Args:
+            segment_key: 分段对象键（已在本地数据库中记录为已应用）
+            kind: 分段类型
+            saved_at: 写入时间
+            payload: 写入内容
+            date: 日期字符串
             db_type: 数据库类型 ("news" 或 "rss")
 
         Returns:
-            schema 文件路径
+            分段是否上传成功（压实失败不影响结果，下次写入时重试）
         """
-        if db_type == "rss":
-            return Path(__file__).parent / "rss_schema.sql"
-        return Path(__file__).parent / "schema.sql"
+        content = encode_segment(kind, saved_at, payload)
+        try:
+            self._put_object_bytes(segment_key, content, 'application/gzip')
+        except Exception as e:
+            print(f"[远程存储] 上传增量分段失败: {e}")
+            return False
+        print(f"[远程存储] 已上传增量分段: {segment_key} ({len(content)} bytes)")
 
-    def _init_tables(self, conn: sqlite3.Connection, db_type: str = "news") -> None:
+        db_path = str(self._get_local_db_path(date, db_type))
+        pending = self._pending_segments.get(db_path, 0) + 1
+        self._pending_segments[db_path] = pending
+        if pending >= self.compact_segments:
+            self._compact_segments(date, db_type)
+        return True
+
+    def _compact_segments(self, date: Optional[str] = None, db_type: str = "news") -> bool:
         """
-        从 schema.sql 初始化数据库表结构
+        将本地数据库上传为当天基础库，并删除已包含在其中的增量分段
+
+        基础库自带 remote_segments 表，压实期间其他写入方新增的分段不会被删除，
+        读取时会在基础库之上继续重放。基础库按打开时的 ETag 条件上传，
+        其他写入方抢先压实时上传失败，本次不删除任何分段。
 
         Args:
-            conn: 数据库连接
+            date: 日期字符串
             db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            是否压实成功
         """
-        schema_path = self._get_schema_path(db_type)
+        local_path = self._get_local_db_path(date, db_type)
+        conn = self._db_connections.get(str(local_path))
+        if conn is None:
+            return False
 
-        if schema_path.exists():
-            with open(schema_path, "r", encoding="utf-8") as f:
-                schema_sql = f.read()
-            conn.executescript(schema_sql)
-        else:
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
+        try:
+            applied = get_applied_segments(conn)
+            if not self._upload_sqlite(date, db_type):
+                return False
+
+            compacted = [key for key in self._list_segment_keys(date, db_type) if key in applied]
+            self._delete_objects(compacted)
+            self._pending_segments[str(local_path)] = max(
+                0, self._pending_segments.get(str(local_path), 0) - len(compacted)
+            )
+            print(f"[远程存储] 已压实 {len(compacted)} 个增量分段: {self._get_remote_db_key(date, db_type)}")
+            return True
+        except Exception as e:
+            print(f"[远程存储] 压实增量分段失败: {e}")
+            return False
 
-        conn.commit()
+    def _get_connection(self, date: Optional[str] = None, db_type: str = "news") -> sqlite3.Connection:
+        """
+        获取数据库连接
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            数据库连接
+        """
+        local_path = self._get_local_db_path(date, db_type)
+        db_path = str(local_path)
+
+        if db_path not in self._db_connections:
+            # 确保目录存在
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # 本地不存在时从远程下载基础库，并重放尚未压实的增量分段
+            self._db_connections[db_path] = self._open_day_db(date, db_type, local_path)
+
+        return self._db_connections[db_path]
+
+    def _init_tables(self, conn: sqlite3.Connection, db_type: str = "news") -> None:
+        """
+        初始化数据库表结构（版本一致时跳过，否则建表或执行增量迁移）
+
+        Args:
+            conn: 数据库连接
+            db_type: 数据库类型 ("news" 或 "rss")
+        """
+        ensure_schema(conn, db_type)
+        ensure_segment_table(conn)
 
     def save_news_data(self, data: NewsData) -> bool:
         """
         保存新闻数据到远程存储（以 URL 为唯一标识，支持标题更新检测）
 
-        流程：下载现有数据库 → 插入/更新数据 → 上传回远程存储
+        流程：下载现有数据库并追平增量分段 → 插入/更新数据 → 上传本次的增量分段
 
         Args:
             data: 新闻数据
@@ -382,152 +717,12 @@ class RemoteStorageBackend(StorageBackend):
             # 获取配置时区的当前时间
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            # 首先同步平台信息到 platforms 表
-            for source_id, source_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO platforms (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (source_id, source_name, now_str))
-
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-            title_changed_count = 0
-            success_sources = []
-
-            for source_id, news_list in data.items.items():
-                success_sources.append(source_id)
-
-                for item in news_list:
-                    try:
-                        # 标准化 URL（去除动态参数，如微博的 band_rank）
-                        normalized_url = normalize_url(item.url, source_id) if item.url else ""
-
-                        # 检查是否已存在（通过标准化 URL + platform_id）
-                        if normalized_url:
-                            cursor.execute("""
-                                SELECT id, title FROM news_items
-                                WHERE url = ? AND platform_id = ?
-                            """, (normalized_url, source_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id, existing_title = existing
-
-                                # 检查标题是否变化
-                                if existing_title != item.title:
-                                    # 记录标题变更
-                                    cursor.execute("""
-                                        INSERT INTO title_changes
-                                        (news_item_id, old_title, new_title, changed_at)
-                                        VALUES (?, ?, ?, ?)
-                                    """, (existing_id, existing_title, item.title, now_str))
-                                    title_changed_count += 1
-
-                                # 记录排名历史
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (existing_id, item.rank, data.crawl_time, now_str))
-
-                                # 更新现有记录
-                                cursor.execute("""
-                                    UPDATE news_items SET
-                                        title = ?,
-                                        rank = ?,
-                                        mobile_url = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.rank, item.mobile_url,
-                                      data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录（存储标准化后的 URL）
-                                cursor.execute("""
-                                    INSERT INTO news_items
-                                    (title, platform_id, rank, url, mobile_url,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, source_id, item.rank, normalized_url,
-                                      item.mobile_url, data.crawl_time, data.crawl_time,
-                                      now_str, now_str))
-                                new_id = cursor.lastrowid
-                                # 记录初始排名
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (new_id, item.rank, data.crawl_time, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空的情况，直接插入（不做去重）
-                            cursor.execute("""
-                                INSERT INTO news_items
-                                (title, platform_id, rank, url, mobile_url,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, source_id, item.rank, "",
-                                  item.mobile_url, data.crawl_time, data.crawl_time,
-                                  now_str, now_str))
-                            new_id = cursor.lastrowid
-                            # 记录初始排名
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, ?, ?, ?)
-                            """, (new_id, item.rank, data.crawl_time, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"[远程存储] 保存新闻条目失败 [{item.title[:30]}...]: {e}")
-
-            total_items = new_count + updated_count
-
-            # 记录抓取信息
-            cursor.execute("""
-                INSERT OR REPLACE INTO crawl_records
-                (crawl_time, total_items, created_at)
-                VALUES (?, ?, ?)
-            """, (data.crawl_time, total_items, now_str))
-
-            # 获取刚插入的 crawl_record 的 ID
-            cursor.execute("""
-                SELECT id FROM crawl_records WHERE crawl_time = ?
-            """, (data.crawl_time,))
-            record_row = cursor.fetchone()
-            if record_row:
-                crawl_record_id = record_row[0]
-
-                # 记录成功的来源
-                for source_id in success_sources:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, source_id))
-
-                # 记录失败的来源
-                for failed_id in data.failed_ids:
-                    # 确保失败的平台也在 platforms 表中
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO platforms (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
-
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
+            # 写入平台信息、新闻条目、抓取记录和来源状态，并记录本次分段
+            segment_key = new_segment_key("news", self._format_date_folder(data.date), data.crawl_time)
+            new_count, updated_count, title_changed_count = write_news_data(
+                cursor, data, now_str
+            )
+            mark_segments_applied(cursor, [segment_key], now_str)
 
             conn.commit()
 
@@ -545,8 +740,8 @@ class RemoteStorageBackend(StorageBackend):
             log_parts.append(f"(去重后总计: {final_count} 条)")
             print("，".join(log_parts))
 
-            # 上传到远程存储
-            if self._upload_sqlite(data.date):
+            # 上传增量分段到远程存储
+            if self._publish_segment(segment_key, SEGMENT_NEWS, now_str, data.to_dict(), data.date):
                 print(f"[远程存储] 数据已同步到远程存储")
                 return True
             else:
@@ -563,11 +758,12 @@ class RemoteStorageBackend(StorageBackend):
             conn = self._get_connection(date)
             cursor = conn.cursor()
 
-            # 获取所有新闻数据（包含 id 用于查询排名历史）
-            cursor.execute("""
+            # 获取所有新闻数据（排名历史由子查询逐条聚合）
+            cursor.execute(f"""
                 SELECT n.id, n.title, n.platform_id, p.name as platform_name,
                        n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                       {rank_history_column()} AS ranks
                 FROM news_items n
                 LEFT JOIN platforms p ON n.platform_id = p.id
                 ORDER BY n.platform_id, n.last_crawl_time
@@ -577,32 +773,12 @@ class RemoteStorageBackend(StorageBackend):
             if not rows:
                 return None
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
-
             # 按 platform_id 分组
             items: Dict[str, List[NewsItem]] = {}
             id_to_name: Dict[str, str] = {}
             crawl_date = self._format_date_folder(date)
 
             for row in rows:
-                news_id = row[0]
                 platform_id = row[2]
                 title = row[1]
                 platform_name = row[3] or platform_id
@@ -613,7 +789,7 @@ class RemoteStorageBackend(StorageBackend):
                     items[platform_id] = []
 
                 # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
+                ranks = parse_ranks(row[10], row[4], unique=True)
 
                 items[platform_id].append(NewsItem(
                     title=title,
@@ -743,6 +919,33 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 获取最新数据失败: {e}")
             return None
 
+    def iter_news_items(
+        self,
+        date: Optional[str] = None,
+        platform_ids: Optional[Sequence[str]] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        keyword: Optional[str] = None,
+    ) -> Iterator[NewsItem]:
+        """
+        流式读取指定日期的新闻（平台、时间段、关键词过滤在 SQL 中完成）
+
+        Args:
+            date: 日期字符串，默认为今天
+            platform_ids: 平台 ID 列表，None 表示所有平台
+            start_time: 开始抓取时间（HH-MM，含）
+            end_time: 结束抓取时间（HH-MM，含）
+            keyword: 标题关键词
+
+        Yields:
+            符合条件的 NewsItem
+        """
+        try:
+            conn = self._get_connection(date)
+            yield from iter_news_items_in_db(conn, platform_ids, start_time, end_time, keyword)
+        except sqlite3.Error as e:
+            print(f"[远程存储] 流式读取数据失败: {e}")
+
     def detect_new_titles(self, current_data: NewsData) -> Dict[str, Dict]:
         """
         检测新增的标题
@@ -751,43 +954,8 @@ class RemoteStorageBackend(StorageBackend):
         关键逻辑：只有在历史批次中从未出现过的标题才算新增。
         """
         try:
-            historical_data = self.get_today_all_data(current_data.date)
-
-            if not historical_data:
-                new_titles = {}
-                for source_id, news_list in current_data.items.items():
-                    new_titles[source_id] = {item.title: item for item in news_list}
-                return new_titles
-
-            # 获取当前批次时间
-            current_time = current_data.crawl_time
-
-            # 收集历史标题（first_time < current_time 的标题）
-            # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
-            historical_titles: Dict[str, set] = {}
-            for source_id, news_list in historical_data.items.items():
-                historical_titles[source_id] = set()
-                for item in news_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        historical_titles[source_id].add(item.title)
-
-            # 检查是否有历史数据
-            has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
-            if not has_historical_data:
-                # 第一次抓取，没有"新增"概念
-                return {}
-
-            new_titles = {}
-            for source_id, news_list in current_data.items.items():
-                hist_set = historical_titles.get(source_id, set())
-                for item in news_list:
-                    if item.title not in hist_set:
-                        if source_id not in new_titles:
-                            new_titles[source_id] = {}
-                        new_titles[source_id][item.title] = item
-
-            return new_titles
+            conn = self._get_connection(current_data.date)
+            return detect_new_titles_in_db(conn, current_data)
 
         except Exception as e:
             print(f"[远程存储] 检测新标题失败: {e}")
@@ -914,6 +1082,10 @@ class RemoteStorageBackend(StorageBackend):
         if downloaded_files:
             downloaded_files.clear()
 
+        base_etags = getattr(self, "_base_etags", None)
+        if base_etags:
+            base_etags.clear()
+
     def cleanup_old_data(self, retention_days: int) -> int:
         """
         清理远程存储上的过期数据
@@ -946,11 +1118,11 @@ class RemoteStorageBackend(StorageBackend):
                 for obj in page['Contents']:
                     key = obj['Key']
 
-                    # 解析日期（格式: news/YYYY-MM-DD.db 或 news/YYYY年MM月DD日.db）
+                    # 解析日期（格式: news/YYYY-MM-DD.db、news/YYYY-MM-DD.db.zst、news/YYYY-MM-DD/*.seg 或 news/YYYY年MM月DD日.db）
                     folder_date = None
                     try:
-                        # ISO 格式: news/YYYY-MM-DD.db
-                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})\.db$', key)
+                        # ISO 格式: news/YYYY-MM-DD.db、冷存储文件及当天的增量分段
+                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})(?:\.db(?:\.zst|\.xz|\.gz)?|/[^/]+\.seg)$', key)
                         if date_match:
                             folder_date = datetime(
                                 int(date_match.group(1)),
@@ -974,22 +1146,13 @@ class RemoteStorageBackend(StorageBackend):
                         continue
 
                     if folder_date and folder_date < cutoff_date:
-                        objects_to_delete.append({'Key': key})
+                        objects_to_delete.append(key)
                         deleted_dates.add(date_str)
 
             # 批量删除对象（每次最多 1000 个）
             if objects_to_delete:
-                batch_size = 1000
-                for i in range(0, len(objects_to_delete), batch_size):
-                    batch = objects_to_delete[i:i + batch_size]
-                    try:
-                        self.s3_client.delete_objects(
-                            Bucket=self.bucket_name,
-                            Delete={'Objects': batch}
-                        )
-                        print(f"[远程存储] 删除 {len(batch)} 个对象")
-                    except Exception as e:
-                        print(f"[远程存储] 批量删除失败: {e}")
+                deleted_objects = self._delete_objects(objects_to_delete)
+                print(f"[远程存储] 删除 {deleted_objects} 个对象")
 
                 deleted_count = len(deleted_dates)
                 for date_str in sorted(deleted_dates):
@@ -1050,21 +1213,17 @@ class RemoteStorageBackend(StorageBackend):
             target_date = self._format_date_folder(date)
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            cursor.execute("""
-                INSERT INTO push_records (date, pushed, push_time, report_type, created_at)
-                VALUES (?, 1, ?, ?, ?)
-                ON CONFLICT(date) DO UPDATE SET
-                    pushed = 1,
-                    push_time = excluded.push_time,
-                    report_type = excluded.report_type
-            """, (target_date, now_str, report_type, now_str))
+            segment_key = new_segment_key("news", target_date, self._format_time_filename())
+            write_push_record(cursor, target_date, report_type, now_str)
+            mark_segments_applied(cursor, [segment_key], now_str)
 
             conn.commit()
 
             print(f"[远程存储] 推送记录已保存: {report_type} at {now_str}")
 
-            # 上传到远程存储 确保记录持久化
-            if self._upload_sqlite(date):
+            # 上传增量分段到远程存储 确保记录持久化
+            payload = {"date": target_date, "report_type": report_type}
+            if self._publish_segment(segment_key, SEGMENT_PUSH, now_str, payload, date):
                 print(f"[远程存储] 推送记录已同步到远程存储")
                 return True
             else:
@@ -1083,7 +1242,7 @@ class RemoteStorageBackend(StorageBackend):
         """
         保存 RSS 数据到远程存储（以 URL 为唯一标识）
 
-        流程：下载现有数据库 → 插入/更新数据 → 上传回远程存储
+        流程：下载现有数据库并追平增量分段 → 插入/更新数据 → 上传本次的增量分段
 
         Args:
             data: RSS 数据
@@ -1097,112 +1256,12 @@ class RemoteStorageBackend(StorageBackend):
 
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            # 同步 RSS 源信息到 rss_feeds 表
-            for feed_id, feed_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO rss_feeds (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (feed_id, feed_name, now_str))
-
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-
-            for feed_id, rss_list in data.items.items():
-                for item in rss_list:
-                    try:
-                        # 检查是否已存在（通过 URL + feed_id）
-                        if item.url:
-                            cursor.execute("""
-                                SELECT id, title FROM rss_items
-                                WHERE url = ? AND feed_id = ?
-                            """, (item.url, feed_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id = existing[0]
-                                cursor.execute("""
-                                    UPDATE rss_items SET
-                                        title = ?,
-                                        published_at = ?,
-                                        summary = ?,
-                                        author = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.published_at, item.summary,
-                                      item.author, data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录
-                                cursor.execute("""
-                                    INSERT INTO rss_items
-                                    (title, feed_id, url, published_at, summary, author,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, feed_id, item.url, item.published_at,
-                                      item.summary, item.author, data.crawl_time,
-                                      data.crawl_time, now_str, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空，直接插入
-                            cursor.execute("""
-                                INSERT INTO rss_items
-                                (title, feed_id, url, published_at, summary, author,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, feed_id, "", item.published_at,
-                                  item.summary, item.author, data.crawl_time,
-                                  data.crawl_time, now_str, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"[远程存储] 保存 RSS 条目失败 [{item.title[:30]}...]: {e}")
-
-            total_items = new_count + updated_count
-
-            # 记录抓取信息
-            cursor.execute("""
-                INSERT OR REPLACE INTO rss_crawl_records
-                (crawl_time, total_items, created_at)
-                VALUES (?, ?, ?)
-            """, (data.crawl_time, total_items, now_str))
-
-            # 记录抓取状态
-            cursor.execute("""
-                SELECT id FROM rss_crawl_records WHERE crawl_time = ?
-            """, (data.crawl_time,))
-            record_row = cursor.fetchone()
-            if record_row:
-                crawl_record_id = record_row[0]
-
-                # 记录成功的源
-                for feed_id in data.items.keys():
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, feed_id))
-
-                # 记录失败的源
-                for failed_id in data.failed_ids:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO rss_feeds (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
-
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
+            # 写入源信息、RSS 条目、抓取记录和源状态，并记录本次分段
+            segment_key = new_segment_key("rss", self._format_date_folder(data.date), data.crawl_time)
+            new_count, updated_count = write_rss_data(
+                cursor, data, now_str, log_prefix="[远程存储]"
+            )
+            mark_segments_applied(cursor, [segment_key], now_str)
 
             conn.commit()
 
@@ -1212,8 +1271,8 @@ class RemoteStorageBackend(StorageBackend):
                 log_parts.append(f"更新 {updated_count} 条")
             print("，".join(log_parts))
 
-            # 上传到远程存储
-            if self._upload_sqlite(data.date, db_type="rss"):
+            # 上传增量分段到远程存储
+            if self._publish_segment(segment_key, SEGMENT_RSS, now_str, data.to_dict(), data.date, "rss"):
                 print(f"[远程存储] RSS 数据已同步到远程存储")
                 return True
             else:
@@ -1309,6 +1368,33 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 读取 RSS 数据失败: {e}")
             return None
 
+    def iter_rss_items(
+        self,
+        date: Optional[str] = None,
+        feed_ids: Optional[Sequence[str]] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        keyword: Optional[str] = None,
+    ) -> Iterator[RSSItem]:
+        """
+        流式读取指定日期的 RSS 条目（源、时间段、关键词过滤在 SQL 中完成）
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+            feed_ids: Feed ID 列表，None 表示所有源
+            start_time: 开始抓取时间（HH-MM，含）
+            end_time: 结束抓取时间（HH-MM，含）
+            keyword: 关键词（匹配标题或摘要）
+
+        Yields:
+            符合条件的 RSSItem
+        """
+        try:
+            conn = self._get_connection(date, db_type="rss")
+            yield from iter_rss_items_in_db(conn, feed_ids, start_time, end_time, keyword)
+        except sqlite3.Error as e:
+            print(f"[远程存储] 流式读取 RSS 数据失败: {e}")
+
     def detect_new_rss_items(self, current_data: RSSData) -> Dict[str, List[RSSItem]]:
         """
         检测新增的 RSS 条目（增量模式）
@@ -1468,90 +1554,370 @@ class RemoteStorageBackend(StorageBackend):
             # Python 关闭时可能会出错，忽略即可
             pass
 
-    def pull_recent_days(self, days: int, local_data_dir: str = "output") -> int:
+    def scan_remote_days(self, db_type: str = "news", date: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         """
-        从远程拉取最近 N 天的数据到本地
+        一次列举远程对象，得到每个日期的基础库信息和增量分段
 
         Args:
-            days: 拉取天数
-            local_data_dir: 本地数据目录
+            db_type: 数据库类型 ("news" 或 "rss")
+            date: 只列举指定日期（YYYY-MM-DD），None 表示全部日期
 
         Returns:
-            成功拉取的数据库文件数量
+            {date: {"base": {"key", "etag", "size"} 或 None,
+                    "cold": 冷存储对象（格式同 base）或 None,
+                    "segments": [分段键...]}}
         """
-        if days <= 0:
-            return 0
+        prefix = f"{db_type}/{date}" if date else f"{db_type}/"
+        cold_suffixes = "|".join(re.escape(suffix) for suffix in COLD_SUFFIXES)
+        pattern = re.compile(
+            rf'{db_type}/(\d{{4}}-\d{{2}}-\d{{2}})(\.db|{cold_suffixes}|/[^/]+\{SEGMENT_SUFFIX})$'
+        )
 
-        local_dir = Path(local_data_dir)
-        local_dir.mkdir(parents=True, exist_ok=True)
+        days: Dict[str, Dict[str, Any]] = {}
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                match = pattern.match(obj['Key'])
+                if not match:
+                    continue
+                day = days.setdefault(match.group(1), {"base": None, "cold": None, "segments": []})
+                if match.group(2).endswith(SEGMENT_SUFFIX):
+                    day["segments"].append(obj['Key'])
+                else:
+                    day["base" if match.group(2) == ".db" else "cold"] = {
+                        "key": obj['Key'],
+                        "etag": obj.get('ETag', "").strip('"'),
+                        "size": obj.get('Size', 0),
+                    }
+
+        for day in days.values():
+            day["segments"].sort()
+        return days
+
+    def _download_object(self, r2_key: str, local_path: Path, size: int, etag: str) -> None:
+        """
+        下载单个对象，大文件按范围分块读取并支持断点续传
 
-        pulled_count = 0
-        now = self._get_configured_time()
+        未完成的下载保存在 {local_path}.part，同时记录对象 ETag；
+        再次下载时 ETag 未变则从已下载的位置继续，否则重新开始。
 
-        print(f"[远程存储] 开始拉取最近 {days} 天的数据...")
+        Args:
+            r2_key: 远程对象键
+            local_path: 本地保存路径
+            size: 对象大小（字节）
+            etag: 对象 ETag
+        """
+        part_path = Path(f"{local_path}.part")
+        etag_path = Path(f"{local_path}.part.etag")
+
+        offset = 0
+        if part_path.exists() and etag_path.exists() and etag_path.read_text().strip() == etag:
+            offset = min(part_path.stat().st_size, size)
+            if offset:
+                print(f"[远程存储] 断点续传: {r2_key} 从 {offset}/{size} 字节继续")
+        else:
+            part_path.unlink(missing_ok=True)
+            etag_path.write_text(etag)
+
+        with open(part_path, "ab") as f:
+            f.truncate(offset)
+            if size <= _RANGE_CHUNK_SIZE and offset == 0:
+                # 小文件直接整体读取
+                f.write(self._get_object_bytes(r2_key))
+                offset = size
+            while offset < size:
+                end = min(offset + _RANGE_CHUNK_SIZE, size) - 1
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket_name, Key=r2_key, Range=f"bytes={offset}-{end}"
+                )
+                if etag and response.get('ETag', "").strip('"') not in ("", etag):
+                    # 下载期间对象已被覆盖（压实），丢弃已下载部分
+                    part_path.unlink(missing_ok=True)
+                    etag_path.unlink(missing_ok=True)
+                    raise RuntimeError(f"远程对象已变化: {r2_key}")
+                for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
+                    f.write(chunk)
+                    offset += len(chunk)
 
-        for i in range(days):
-            date = now - timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
+        part_path.replace(local_path)
+        etag_path.unlink(missing_ok=True)
 
-            # 本地目标路径
-            local_date_dir = local_dir / date_str
-            local_db_path = local_date_dir / "news.db"
+    def download_day_db(
+        self,
+        date: str,
+        db_type: str,
+        local_path: Path,
+        remote_day: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """
+        将远程某日数据（基础库 + 增量分段）同步为本地的完整 SQLite 文件
 
-            # 如果本地已存在，跳过
-            if local_db_path.exists():
-                print(f"[远程存储] 跳过（本地已存在）: {date_str}")
-                continue
+        - 本地文件由拉取生成且基础库 ETag 未变：只应用新增的分段，没有新分段时不做任何传输
+        - 基础库有变化或本地不存在：重新下载基础库（支持断点续传）后应用分段
+        - 本地文件由本地抓取生成（没有拉取记录）：不覆盖
+        - 远程只有冷存储文件：原样下载为本地冷存储文件（{date}.db.zst 等），不解压
 
-            # 远程对象键
-            remote_key = f"news/{date_str}.db"
+        Args:
+            date: 日期字符串（YYYY-MM-DD）
+            db_type: 数据库类型 ("news" 或 "rss")
+            local_path: 本地保存路径
+            remote_day: scan_remote_days 返回的该日信息（可选，缺省时单独列举）
 
-            # 检查远程是否存在
-            if not self._check_object_exists(remote_key):
-                print(f"[远程存储] 跳过（远程不存在）: {date_str}")
+        Returns:
+            "downloaded" / "updated" / "unchanged" / "local"（本地数据，未覆盖），远程不存在时返回 None
+        """
+        local_path = Path(local_path)
+        for attempt in range(2):
+            if remote_day is None:
+                remote_day = self.scan_remote_days(db_type, date).get(date)
+            if not remote_day or not (remote_day["base"] or remote_day.get("cold") or remote_day["segments"]):
+                return None
+
+            if not remote_day["base"] and not remote_day["segments"]:
+                return self._download_cold_day(remote_day["cold"], local_path)
+
+            # 冷存储的日期之后又有写入时，以冷存储文件作为基础库
+            base = remote_day["base"] or remote_day.get("cold")
+            base_etag = base["etag"] if base else ""
+            segment_keys = remote_day["segments"]
+
+            if local_path.exists():
+                conn = connect_sqlite(str(local_path), self.sqlite_profile)
+                try:
+                    pulled_etag = get_sync_state(conn, "base_etag")
+                    if pulled_etag is None:
+                        return "local"
+                    if pulled_etag == base_etag:
+                        applied = get_applied_segments(conn)
+                        if all(key in applied for key in segment_keys):
+                            return "unchanged"
+                        ensure_schema(conn, db_type)
+                        if self._sync_segments(conn, date, db_type, segment_keys):
+                            checkpoint_sqlite(conn)
+                            return "updated"
+                        remote_day = None
+                        continue
+                finally:
+                    conn.close()
+
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = local_path.with_name(f"{local_path.name}.tmp")
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{tmp_path}{suffix}").unlink(missing_ok=True)
+
+            if base and is_cold_file(base["key"]):
+                self._download_cold_as_db(base["key"], tmp_path, base["size"], base_etag)
+            elif base:
+                self._download_object(base["key"], tmp_path, base["size"], base_etag)
+
+            conn = connect_sqlite(str(tmp_path), self.sqlite_profile)
+            try:
+                self._init_tables(conn, db_type)
+                synced = self._sync_segments(conn, date, db_type, segment_keys)
+                if synced:
+                    set_sync_state(conn, "base_etag", base_etag)
+                    checkpoint_sqlite(conn)
+            finally:
+                conn.close()
+
+            if not synced:
+                # 分段在下载期间被压实，重新列举后再试一次
+                remote_day = None
                 continue
 
-            # 下载（使用 get_object + iter_chunks 处理 chunked encoding）
+            tmp_path.replace(local_path)
+            for suffix in ("-wal", "-shm"):
+                Path(f"{local_path}{suffix}").unlink(missing_ok=True)
+            return "downloaded"
+
+        raise RuntimeError(f"远程数据在同步期间持续变化: {db_type}/{date}")
+
+    def _download_cold_day(self, cold: Dict[str, Any], local_path: Path) -> str:
+        """
+        将远程冷存储文件原样下载到本地（{local_path}.zst 等）
+
+        Args:
+            cold: scan_remote_days 返回的冷存储对象信息
+            local_path: 本地数据库路径（冷存储文件保存在其旁边）
+
+        Returns:
+            "downloaded" / "unchanged" / "local"（本地已有普通数据库，未覆盖）
+        """
+        if local_path.exists():
+            conn = connect_sqlite(str(local_path), self.sqlite_profile)
             try:
-                local_date_dir.mkdir(parents=True, exist_ok=True)
-                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=remote_key)
-                with open(local_db_path, 'wb') as f:
-                    for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
-                        f.write(chunk)
-                print(f"[远程存储] 已拉取: {remote_key} -> {local_db_path}")
+                pulled = get_sync_state(conn, "base_etag") is not None
+            finally:
+                conn.close()
+            return "unchanged" if pulled else "local"
+
+        cold_path = Path(f"{local_path}{cold['key'][cold['key'].rindex('.db') + 3:]}")
+        if cold_path.exists() and cold_path.stat().st_size == cold["size"]:
+            return "unchanged"
+
+        cold_path.parent.mkdir(parents=True, exist_ok=True)
+        self._download_object(cold["key"], cold_path, cold["size"], cold["etag"])
+        return "downloaded"
+
+    def pull_dates(
+        self,
+        dates: List[str],
+        local_data_dir: str = "output",
+        db_type: str = "news",
+        remote_days: Optional[Dict[str, Dict[str, Any]]] = None,
+        max_workers: int = 4,
+    ) -> Dict[str, Any]:
+        """
+        并发拉取多个日期的数据到本地（output/{db_type}/{date}.db）
+
+        Args:
+            dates: 日期列表（YYYY-MM-DD）
+            local_data_dir: 本地数据目录
+            db_type: 数据库类型 ("news" 或 "rss")
+            remote_days: scan_remote_days 的结果（可选，缺省时列举一次）
+            max_workers: 并发下载数
+
+        Returns:
+            {date: download_day_db 的返回值，或失败时的异常对象}
+        """
+        if remote_days is None:
+            remote_days = self.scan_remote_days(db_type)
+
+        db_dir = Path(local_data_dir) / db_type
+        db_dir.mkdir(parents=True, exist_ok=True)
+
+        def pull(date_str: str) -> Optional[str]:
+            return self.download_day_db(
+                date_str, db_type, db_dir / f"{date_str}.db", remote_days.get(date_str)
+            )
+
+        results: Dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {executor.submit(pull, date_str): date_str for date_str in dates}
+            for future in as_completed(futures):
+                date_str = futures[future]
+                try:
+                    results[date_str] = future.result()
+                except Exception as e:
+                    results[date_str] = e
+        return results
+
+    def pull_recent_days(self, days: int, local_data_dir: str = "output", max_workers: int = 4) -> int:
+        """
+        从远程拉取最近 N 天的数据到本地
+
+        远程对象只列举一次，各日期并发下载；本地已是最新的日期不产生下载。
+
+        Args:
+            days: 拉取天数
+            local_data_dir: 本地数据目录
+            max_workers: 并发下载数
+
+        Returns:
+            成功拉取（新下载或更新）的数据库文件数量
+        """
+        if days <= 0:
+            return 0
+
+        print(f"[远程存储] 开始拉取最近 {days} 天的数据...")
+
+        try:
+            remote_days = self.scan_remote_days("news")
+        except Exception as e:
+            print(f"[远程存储] 列出远程数据失败: {e}")
+            return 0
+
+        now = self._get_configured_time()
+        dates = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
+        target_dates = [d for d in dates if d in remote_days]
+        for date_str in dates:
+            if date_str not in remote_days:
+                print(f"[远程存储] 跳过（远程不存在）: {date_str}")
+
+        results = self.pull_dates(target_dates, local_data_dir, "news", remote_days, max_workers)
+
+        pulled_count = 0
+        for date_str in sorted(results, reverse=True):
+            status = results[date_str]
+            if isinstance(status, Exception):
+                print(f"[远程存储] 拉取失败 ({date_str}): {status}")
+            elif status in ("downloaded", "updated"):
+                print(f"[远程存储] 已拉取: news/{date_str} ({status})")
                 pulled_count += 1
-            except Exception as e:
-                print(f"[远程存储] 拉取失败 ({date_str}): {e}")
+            elif status == "local":
+                print(f"[远程存储] 跳过（本地已存在）: {date_str}")
+            else:
+                print(f"[远程存储] 跳过（本地已是最新）: {date_str}")
 
         print(f"[远程存储] 拉取完成，共下载 {pulled_count} 个数据库文件")
         return pulled_count
 
-    def list_remote_dates(self) -> List[str]:
+    def freeze_old_data(self, after_days: int, codec: str = "zstd") -> int:
         """
-        列出远程存储中所有可用的日期
+        将远程存储中超过指定天数的日期（基础库 + 增量分段）转为单个冷存储对象
+
+        {db_type}/{date}.db 与 {db_type}/{date}/*.seg -> {db_type}/{date}.db.zst（或 .db.xz / .db.gz）
+
+        Args:
+            after_days: 超过该天数的日期转为冷存储（0 表示不转换）
+            codec: 压缩算法（zstd / xz / gzip）
 
         Returns:
-            日期字符串列表（YYYY-MM-DD 格式）
+            转换的日期数量
         """
-        dates = []
+        if after_days <= 0:
+            return 0
 
-        try:
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=self.bucket_name, Prefix="news/")
+        cutoff = (self._get_configured_time() - timedelta(days=after_days)).strftime("%Y-%m-%d")
+        frozen_count = 0
 
-            for page in pages:
-                if 'Contents' not in page:
+        for db_type in ["news", "rss"]:
+            try:
+                remote_days = self.scan_remote_days(db_type)
+            except Exception as e:
+                print(f"[远程存储] 列出远程数据失败: {e}")
+                continue
+
+            for date_str, remote_day in sorted(remote_days.items()):
+                if date_str >= cutoff or not (remote_day["base"] or remote_day["segments"]):
                     continue
 
-                for obj in page['Contents']:
-                    key = obj['Key']
-                    # 解析日期
-                    date_match = re.match(r'news/(\d{4}-\d{2}-\d{2})\.db$', key)
-                    if date_match:
-                        dates.append(date_match.group(1))
+                tmp_path = self.temp_dir / "cold" / db_type / f"{date_str}.db"
+                tmp_path.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    if self.download_day_db(date_str, db_type, tmp_path, remote_day) is None:
+                        continue
+                    cold_path = freeze_db(tmp_path, codec)
+                    cold_key = f"{db_type}/{cold_path.name}"
+                    self._put_object_bytes(cold_key, cold_path.read_bytes(), "application/octet-stream")
+
+                    stale_keys = [
+                        obj["key"] for obj in (remote_day["base"], remote_day["cold"])
+                        if obj and obj["key"] != cold_key
+                    ]
+                    self._delete_objects(stale_keys + remote_day["segments"])
+                    frozen_count += 1
+                    print(f"[远程存储] 转为冷存储: {cold_key} ({cold_path.stat().st_size / 1024:.1f} KB)")
+                except Exception as e:
+                    print(f"[远程存储] 转为冷存储失败 ({db_type}/{date_str}): {e}")
+                finally:
+                    for leftover in tmp_path.parent.glob(f"{date_str}.db*"):
+                        leftover.unlink(missing_ok=True)
+
+        if frozen_count > 0:
+            print(f"[远程存储] 共转换 {frozen_count} 个日期为冷存储")
+
+        return frozen_count
 
-            return sorted(dates, reverse=True)
+    def list_remote_dates(self) -> List[str]:
+        """
+        列出远程存储中所有可用的日期（只有增量分段、尚未压实的日期同样可用）
 
+        Returns:
+            日期字符串列表（YYYY-MM-DD 格式）
+        """
+        try:
+            return sorted(self.scan_remote_days("news"), reverse=True)
         except Exception as e:
             print(f"[远程存储] 列出远程日期失败: {e}")
             return []
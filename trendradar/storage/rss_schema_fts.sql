@@ -0,0 +1,35 @@
+-- TrendRadar RSS 全文索引（schema 版本 2）
+-- 依赖 SQLite FTS5 与 trigram 分词器（SQLite 3.34+），不可用时自动跳过，搜索回退为逐条匹配
+
+-- ============================================
+-- 标题与摘要全文索引
+-- trigram 分词：按字符三元组切分，适用于中文等无空格语言的子串搜索
+-- 外部内容表：只存索引，不重复存储标题和摘要
+-- ============================================
+CREATE VIRTUAL TABLE IF NOT EXISTS rss_items_fts USING fts5(
+    title,
+    summary,
+    content='rss_items',
+    content_rowid='id',
+    tokenize='trigram'
+);
+
+-- ============================================
+-- 同步触发器
+-- 每次抓取都会 UPDATE 已有条目，仅在标题或摘要变化时更新索引
+-- ============================================
+CREATE TRIGGER IF NOT EXISTS rss_items_fts_ai AFTER INSERT ON rss_items BEGIN
+    INSERT INTO rss_items_fts(rowid, title, summary) VALUES (new.id, new.title, new.summary);
+END;
+
+CREATE TRIGGER IF NOT EXISTS rss_items_fts_ad AFTER DELETE ON rss_items BEGIN
+    INSERT INTO rss_items_fts(rss_items_fts, rowid, title, summary)
+    VALUES ('delete', old.id, old.title, old.summary);
+END;
+
+CREATE TRIGGER IF NOT EXISTS rss_items_fts_au AFTER UPDATE OF title, summary ON rss_items
+WHEN old.title IS NOT new.title OR old.summary IS NOT new.summary BEGIN
+    INSERT INTO rss_items_fts(rss_items_fts, rowid, title, summary)
+    VALUES ('delete', old.id, old.title, old.summary);
+    INSERT INTO rss_items_fts(rowid, title, summary) VALUES (new.id, new.title, new.summary);
+END;
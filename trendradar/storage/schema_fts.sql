@@ -0,0 +1,32 @@
+-- TrendRadar 热榜全文索引（schema 版本 2）
+-- 依赖 SQLite FTS5 与 trigram 分词器（SQLite 3.34+），不可用时自动跳过，搜索回退为逐条匹配
+
+-- ============================================
+-- 标题全文索引
+-- trigram 分词：按字符三元组切分，适用于中文等无空格语言的子串搜索
+-- 外部内容表：只存索引，不重复存储标题
+-- ============================================
+CREATE VIRTUAL TABLE IF NOT EXISTS news_items_fts USING fts5(
+    title,
+    content='news_items',
+    content_rowid='id',
+    tokenize='trigram'
+);
+
+-- ============================================
+-- 同步触发器
+-- 每次抓取都会 UPDATE 已有条目，仅在标题变化时更新索引
+-- ============================================
+CREATE TRIGGER IF NOT EXISTS news_items_fts_ai AFTER INSERT ON news_items BEGIN
+    INSERT INTO news_items_fts(rowid, title) VALUES (new.id, new.title);
+END;
+
+CREATE TRIGGER IF NOT EXISTS news_items_fts_ad AFTER DELETE ON news_items BEGIN
+    INSERT INTO news_items_fts(news_items_fts, rowid, title) VALUES ('delete', old.id, old.title);
+END;
+
+CREATE TRIGGER IF NOT EXISTS news_items_fts_au AFTER UPDATE OF title ON news_items
+WHEN old.title IS NOT new.title BEGIN
+    INSERT INTO news_items_fts(news_items_fts, rowid, title) VALUES ('delete', old.id, old.title);
+    INSERT INTO news_items_fts(rowid, title) VALUES (new.id, new.title);
+END;
@@ -0,0 +1,216 @@
+# coding=utf-8
+"""
+远程增量分段
+
+远程存储中每日数据由"基础库 + 增量分段"组成：
+- {db_type}/{date}.db：定期压实的当日 SQLite 数据库
+- {db_type}/{date}/{序号}_{抓取时间}_{随机串}.seg：每次写入生成的不可变分段（gzip 压缩的 JSON）
+
+分段记录的是一次写入操作（热榜抓取、RSS 抓取或推送记录），
+按对象键顺序重放即可得到与逐次写入整库相同的结果。
+已应用的分段记录在 remote_segments 表中，压实后的基础库自带该表，
+读取时只需下载基础库中尚未包含的分段。
+拉取到本地的数据库在 remote_sync_state 表中记录基础库 ETag，用于判断是否需要重新下载。
+"""
+
+import gzip
+import json
+import sqlite3
+import time
+import uuid
+from typing import Any, Dict, Iterable, Optional, Set
+
+from trendradar.storage.base import NewsData, RSSData
+from trendradar.storage.sqlite_helpers import (
+    write_news_data,
+    write_push_record,
+    write_rss_data,
+)
+
+# 分段对象后缀
+SEGMENT_SUFFIX = ".seg"
+
+# 分段格式版本（格式不兼容变化时递增）
+SEGMENT_FORMAT_VERSION = 1
+
+# 分段类型
+SEGMENT_NEWS = "news"
+SEGMENT_RSS = "rss"
+SEGMENT_PUSH = "push"
+
+
+def segment_prefix(db_type: str, date_folder: str) -> str:
+    """
+    获取某日分段对象的键前缀
+
+    Args:
+        db_type: 数据库类型 ("news" 或 "rss")
+        date_folder: 日期字符串（YYYY-MM-DD）
+
+    Returns:
+        键前缀，如 "news/2025-12-28/"
+    """
+    return f"{db_type}/{date_folder}/"
+
+
+def new_segment_key(db_type: str, date_folder: str, crawl_time: str) -> str:
+    """
+    生成新分段的对象键
+
+    以纳秒时间戳开头，按键排序即为写入顺序；末尾的随机串避免并发写入冲突。
+
+    Args:
+        db_type: 数据库类型
+        date_folder: 日期字符串
+        crawl_time: 抓取时间（HH-MM），仅用于便于识别
+
+    Returns:
+        对象键
+    """
+    token = uuid.uuid4().hex[:8]
+    return f"{segment_prefix(db_type, date_folder)}{time.time_ns():020d}_{crawl_time}_{token}{SEGMENT_SUFFIX}"
+
+
+def encode_segment(kind: str, saved_at: str, payload: Dict[str, Any]) -> bytes:
+    """
+    编码分段内容
+
+    Args:
+        kind: 分段类型（news / rss / push）
+        saved_at: 写入时间字符串（重放时作为 now_str）
+        payload: 写入内容
+
+    Returns:
+        gzip 压缩后的字节
+    """
+    segment = {
+        "version": SEGMENT_FORMAT_VERSION,
+        "kind": kind,
+        "saved_at": saved_at,
+        "payload": payload,
+    }
+    raw = json.dumps(segment, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return gzip.compress(raw, compresslevel=6)
+
+
+def decode_segment(content: bytes) -> Dict[str, Any]:
+    """
+    解码分段内容
+
+    Args:
+        content: gzip 压缩的分段字节
+
+    Returns:
+        分段字典（version, kind, saved_at, payload）
+
+    Raises:
+        ValueError: 分段格式版本不受支持
+    """
+    segment = json.loads(gzip.decompress(content).decode("utf-8"))
+    if segment.get("version") != SEGMENT_FORMAT_VERSION:
+        raise ValueError(f"不支持的分段格式版本: {segment.get('version')}")
+    return segment
+
+
+def ensure_segment_table(conn: sqlite3.Connection) -> None:
+    """创建已应用分段记录表（不存在时）"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS remote_segments (
+            segment_key TEXT PRIMARY KEY,
+            applied_at TEXT NOT NULL
+        )
+    """)
+
+
+def get_applied_segments(conn: sqlite3.Connection) -> Set[str]:
+    """
+    获取数据库中已应用的分段键
+
+    Args:
+        conn: 数据库连接
+
+    Returns:
+        分段键集合
+    """
+    ensure_segment_table(conn)
+    return {row[0] for row in conn.execute("SELECT segment_key FROM remote_segments")}
+
+
+def get_sync_state(conn: sqlite3.Connection, name: str) -> Optional[str]:
+    """
+    读取同步状态（如拉取时基础库的 ETag）
+
+    Args:
+        conn: 数据库连接
+        name: 状态名
+
+    Returns:
+        状态值，不存在时返回 None
+    """
+    if not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'remote_sync_state'"
+    ).fetchone():
+        return None
+    row = conn.execute("SELECT value FROM remote_sync_state WHERE name = ?", (name,)).fetchone()
+    return row[0] if row else None
+
+
+def set_sync_state(conn: sqlite3.Connection, name: str, value: str) -> None:
+    """写入同步状态并提交"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS remote_sync_state (
+            name TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+    """)
+    conn.execute(
+        "INSERT OR REPLACE INTO remote_sync_state (name, value) VALUES (?, ?)",
+        (name, value),
+    )
+    conn.commit()
+
+
+def mark_segments_applied(cursor: sqlite3.Cursor, keys: Iterable[str], applied_at: str) -> None:
+    """记录分段已应用（不提交事务）"""
+    cursor.executemany(
+        "INSERT OR IGNORE INTO remote_segments (segment_key, applied_at) VALUES (?, ?)",
+        [(key, applied_at) for key in keys],
+    )
+
+
+def apply_segment(
+    conn: sqlite3.Connection,
+    key: str,
+    segment: Dict[str, Any],
+    log_prefix: str = "[存储]",
+) -> None:
+    """
+    将一个分段重放到本地数据库，并在同一事务中记录为已应用
+
+    Args:
+        conn: 当日数据库连接（已初始化表结构）
+        key: 分段对象键
+        segment: decode_segment 返回的分段字典
+        log_prefix: 日志前缀
+    """
+    kind = segment["kind"]
+    saved_at = segment["saved_at"]
+    payload = segment["payload"]
+
+    ensure_segment_table(conn)
+    cursor = conn.cursor()
+    try:
+        if kind == SEGMENT_NEWS:
+            write_news_data(cursor, NewsData.from_dict(payload), saved_at)
+        elif kind == SEGMENT_RSS:
+            write_rss_data(cursor, RSSData.from_dict(payload), saved_at, log_prefix=log_prefix)
+        elif kind == SEGMENT_PUSH:
+            write_push_record(cursor, payload["date"], payload["report_type"], saved_at)
+        else:
+            raise ValueError(f"未知的分段类型: {kind}")
+
+        mark_segments_applied(cursor, [key], saved_at)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
@@ -0,0 +1,938 @@
+# coding=utf-8
+"""
+SQLite 存储公共工具
+
+本地与远程后端（以及 MCP 读取端）共享的 SQLite 逻辑：
+- 连接参数配置（WAL、synchronous、mmap、cache_size 等 PRAGMA）
+- 只读 URI 连接
+- 基于 PRAGMA user_version 的表结构版本管理与增量迁移
+- 通过临时表一次性查出本批次已存在的记录
+- 使用 executemany 批量插入/更新新闻、排名历史和标题变更
+- 单次抓取/推送的完整写入（本地写入与远程增量分段重放共用）
+- 平台、时间段、关键词过滤下推到 SQL 的流式读取
+"""
+
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from trendradar.storage.base import NewsData, NewsItem, RSSData, RSSItem
+from trendradar.utils.url import normalize_url
+
+
+# 默认连接参数
+# - WAL：爬虫写入与 MCP 读取互不阻塞
+# - synchronous=NORMAL：WAL 模式下只在检查点时 fsync
+# - mmap_size / cache_size：加速读取（cache_size 为负数时单位为 KiB）
+# - temp_store=MEMORY：排序、临时表放在内存中
+DEFAULT_SQLITE_PROFILE: Dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 268435456,
+    "cache_size": -65536,
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+}
+
+# 只读连接无法修改的持久化参数
+_WRITE_ONLY_PRAGMAS = ("journal_mode", "synchronous")
+
+_PRAGMA_VALUES = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA", "0", "1", "2", "3"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY", "0", "1", "2"},
+}
+
+
+def resolve_sqlite_profile(profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    合并用户配置与默认连接参数
+
+    Args:
+        profile: 用户配置（键为 PRAGMA 名称，值为 None 或空字符串时使用默认值）
+
+    Returns:
+        完整的连接参数字典
+    """
+    resolved = dict(DEFAULT_SQLITE_PROFILE)
+    for key, value in (profile or {}).items():
+        key = key.lower()
+        if key in resolved and value is not None and value != "":
+            resolved[key] = value
+    return resolved
+
+
+def apply_sqlite_profile(
+    conn: sqlite3.Connection,
+    profile: Optional[Dict[str, Any]] = None,
+    read_only: bool = False,
+) -> None:
+    """
+    对连接应用 PRAGMA 参数
+
+    非法取值会被忽略并打印警告，不影响连接使用。
+
+    Args:
+        conn: 数据库连接
+        profile: 连接参数（None 表示使用默认值）
+        read_only: 是否为只读连接（跳过 journal_mode 等写入相关参数）
+    """
+    for key, value in resolve_sqlite_profile(profile).items():
+        if read_only and key in _WRITE_ONLY_PRAGMAS:
+            continue
+
+        if key in _PRAGMA_VALUES:
+            value = str(value).upper()
+            if value not in _PRAGMA_VALUES[key]:
+                print(f"[存储] 忽略无效的 SQLite 参数 {key}={value}")
+                continue
+        else:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                print(f"[存储] 忽略无效的 SQLite 参数 {key}={value}")
+                continue
+
+        try:
+            conn.execute(f"PRAGMA {key} = {value}")
+        except sqlite3.Error as e:
+            print(f"[存储] 设置 SQLite 参数失败 {key}={value}: {e}")
+
+
+def connect_sqlite(
+    db_path: Union[str, Path],
+    profile: Optional[Dict[str, Any]] = None,
+    read_only: bool = False,
+) -> sqlite3.Connection:
+    """
+    按连接参数打开 SQLite 数据库
+
+    Args:
+        db_path: 数据库文件路径
+        profile: 连接参数（None 表示使用默认值）
+        read_only: 是否以只读 URI（mode=ro）打开
+
+    Returns:
+        数据库连接（row_factory 为 sqlite3.Row）
+    """
+    if read_only:
+        uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+    else:
+        conn = sqlite3.connect(str(db_path))
+
+    conn.row_factory = sqlite3.Row
+    apply_sqlite_profile(conn, profile, read_only=read_only)
+    return conn
+
+
+def checkpoint_sqlite(conn: sqlite3.Connection) -> None:
+    """将 WAL 内容合并回主数据库文件（上传或复制数据库文件前调用）"""
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except sqlite3.Error as e:
+        print(f"[存储] WAL 检查点失败: {e}")
+
+
+def rank_history_column(news_alias: str = "n", schema: str = "") -> str:
+    """
+    生成按抓取时间聚合单条新闻排名历史的列表达式（逗号分隔的排名）
+
+    每条新闻通过 idx_rank_history_item_time 索引读取自己的排名，
+    避免按 news_item_id 拼接超长的 IN (...) 参数列表。
+
+    Args:
+        news_alias: news_items 表别名
+        schema: 数据库前缀（如归档导入时挂载的 "day."）
+
+    Returns:
+        可直接放入 SELECT 的子查询表达式
+    """
+    return (
+        f"(SELECT group_concat(rank) FROM ("
+        f"SELECT rank FROM {schema}rank_history "
+        f"WHERE news_item_id = {news_alias}.id ORDER BY crawl_time))"
+    )
+
+
+def parse_ranks(ranks_text: Optional[str], fallback_rank: int, unique: bool = False) -> List[int]:
+    """
+    解析 rank_history_column 聚合出的排名文本
+
+    Args:
+        ranks_text: 逗号分隔的排名，无排名历史时为 None
+        fallback_rank: 无排名历史时使用的当前排名
+        unique: 是否去重（保留首次出现的顺序）
+
+    Returns:
+        排名列表
+    """
+    if not ranks_text:
+        return [fallback_rank]
+    ranks = [int(r) for r in ranks_text.split(",")]
+    if unique:
+        ranks = list(dict.fromkeys(ranks))
+    return ranks
+
+
+def like_pattern(keyword: str) -> str:
+    """
+    将关键词转换为子串匹配的 LIKE 模式（转义 %、_ 和 \\，配合 ESCAPE '\\' 使用）
+
+    Args:
+        keyword: 关键词
+
+    Returns:
+        LIKE 模式字符串
+    """
+    escaped = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def build_item_filter(
+    alias: str,
+    source_column: str,
+    source_ids: Optional[Sequence[str]] = None,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    keyword: Optional[str] = None,
+    keyword_columns: Sequence[str] = ("title",),
+) -> Tuple[str, List[Any]]:
+    """
+    构建条目查询的 WHERE 子句，将过滤条件下推到 SQL
+
+    时间段按抓取时间（HH-MM）判断：条目在 [start_time, end_time] 内出现过即命中。
+    关键词为子串匹配，ASCII 字母不区分大小写。
+
+    Args:
+        alias: 条目表别名
+        source_column: 来源列名（platform_id 或 feed_id）
+        source_ids: 来源 ID 列表，None 或空表示不过滤
+        start_time: 开始抓取时间（含）
+        end_time: 结束抓取时间（含）
+        keyword: 关键词
+        keyword_columns: 关键词匹配的列（任一列包含即命中）
+
+    Returns:
+        (where 子句（无条件时为空字符串）, 参数列表)
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+
+    if source_ids:
+        placeholders = ",".join("?" * len(source_ids))
+        clauses.append(f"{alias}.{source_column} IN ({placeholders})")
+        params.extend(source_ids)
+    if start_time:
+        clauses.append(f"{alias}.last_crawl_time >= ?")
+        params.append(start_time)
+    if end_time:
+        clauses.append(f"{alias}.first_crawl_time <= ?")
+        params.append(end_time)
+    if keyword:
+        pattern = like_pattern(keyword)
+        matches = [f"{alias}.{column} LIKE ? ESCAPE '\\'" for column in keyword_columns]
+        clauses.append(f"({' OR '.join(matches)})")
+        params.extend([pattern] * len(keyword_columns))
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def iter_news_items_in_db(
+    conn: sqlite3.Connection,
+    platform_ids: Optional[Sequence[str]] = None,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    keyword: Optional[str] = None,
+) -> Iterator[NewsItem]:
+    """
+    逐条读取单日数据库中的新闻（过滤条件在 SQL 中完成，不一次性加载全部结果）
+
+    Args:
+        conn: 当日新闻数据库连接
+        platform_ids: 平台 ID 列表，None 表示所有平台
+        start_time: 开始抓取时间（HH-MM，含）
+        end_time: 结束抓取时间（HH-MM，含）
+        keyword: 标题关键词
+
+    Yields:
+        NewsItem（按平台和最后抓取时间排序，排名历史已去重）
+    """
+    where, params = build_item_filter(
+        "n", "platform_id", platform_ids, start_time, end_time, keyword
+    )
+    cursor = conn.execute(f"""
+        SELECT n.title, n.platform_id, p.name as platform_name,
+               n.rank, n.url, n.mobile_url,
+               n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+               {rank_history_column()} AS ranks
+        FROM news_items n
+        LEFT JOIN platforms p ON n.platform_id = p.id
+        {where}
+        ORDER BY n.platform_id, n.last_crawl_time
+    """, params)
+
+    try:
+        for row in cursor:
+            platform_id = row[1]
+            yield NewsItem(
+                title=row[0],
+                source_id=platform_id,
+                source_name=row[2] or platform_id,
+                rank=row[3],
+                url=row[4] or "",
+                mobile_url=row[5] or "",
+                crawl_time=row[7],
+                ranks=parse_ranks(row[9], row[3], unique=True),
+                first_time=row[6],
+                last_time=row[7],
+                count=row[8],
+            )
+    finally:
+        cursor.close()
+
+
+def iter_rss_items_in_db(
+    conn: sqlite3.Connection,
+    feed_ids: Optional[Sequence[str]] = None,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    keyword: Optional[str] = None,
+) -> Iterator[RSSItem]:
+    """
+    逐条读取单日数据库中的 RSS 条目（过滤条件在 SQL 中完成）
+
+    Args:
+        conn: 当日 RSS 数据库连接
+        feed_ids: Feed ID 列表，None 表示所有源
+        start_time: 开始抓取时间（HH-MM，含）
+        end_time: 结束抓取时间（HH-MM，含）
+        keyword: 关键词（匹配标题或摘要）
+
+    Yields:
+        RSSItem（按发布时间倒序）
+    """
+    where, params = build_item_filter(
+        "i", "feed_id", feed_ids, start_time, end_time, keyword,
+        keyword_columns=("title", "summary"),
+    )
+    cursor = conn.execute(f"""
+        SELECT i.title, i.feed_id, f.name as feed_name,
+               i.url, i.published_at, i.summary, i.author,
+               i.first_crawl_time, i.last_crawl_time, i.crawl_count
+        FROM rss_items i
+        LEFT JOIN rss_feeds f ON i.feed_id = f.id
+        {where}
+        ORDER BY i.published_at DESC
+    """, params)
+
+    try:
+        for row in cursor:
+            feed_id = row[1]
+            yield RSSItem(
+                title=row[0],
+                feed_id=feed_id,
+                feed_name=row[2] or feed_id,
+                url=row[3] or "",
+                published_at=row[4] or "",
+                summary=row[5] or "",
+                author=row[6] or "",
+                crawl_time=row[8],
+                first_time=row[7],
+                last_time=row[8],
+                count=row[9],
+            )
+    finally:
+        cursor.close()
+
+
+def get_db_signature(db_path: Union[str, Path]) -> Optional[str]:
+    """
+    计算数据库文件的数据版本签名（主文件与 -wal 文件的 mtime 和大小）
+
+    WAL 模式下新写入可能只落在 -wal 文件中，因此同时纳入 -wal 文件的状态。
+    只需两次 stat，适合在每次读缓存前调用。
+
+    Args:
+        db_path: 数据库文件路径
+
+    Returns:
+        签名字符串，数据库文件不存在时返回 None
+    """
+    parts = []
+    for path in (Path(db_path), Path(f"{db_path}-wal")):
+        try:
+            stat = path.stat()
+            parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        except FileNotFoundError:
+            if not parts:
+                return None
+            parts.append("-")
+    return "|".join(parts)
+
+
+def _create_fts_index(conn: sqlite3.Connection, db_type: str) -> None:
+    """
+    创建全文索引及同步触发器，并为已有数据建立索引
+
+    FTS5 / trigram 不可用时只打印警告，搜索将回退为逐条匹配。
+    """
+    try:
+        conn.executescript(load_schema_sql(f"{db_type}_fts"))
+        table = "news_items_fts" if db_type == "news" else "rss_items_fts"
+        conn.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+    except sqlite3.OperationalError as e:
+        print(f"[存储] 当前 SQLite 不支持 FTS5 trigram 全文索引，搜索将使用逐条匹配: {e}")
+
+
+# 当前表结构版本（写入 PRAGMA user_version）
+# schema.sql / rss_schema.sql 为版本 1 的基线结构，之后的结构变更均登记在 SCHEMA_MIGRATIONS 中
+SCHEMA_VERSIONS: Dict[str, int] = {
+    "news": 4,
+    "rss": 2,
+}
+
+# 增量迁移：{db_type: {目标版本: [SQL 语句或 callable(conn), ...]}}
+# 数据库从版本 N 升级到 N+1 时执行对应步骤（新文件从基线版本 1 开始逐步升级）
+SCHEMA_MIGRATIONS: Dict[str, Dict[int, List[Union[str, Callable[[sqlite3.Connection], None]]]]] = {
+    "news": {
+        2: [lambda conn: _create_fts_index(conn, "news")],
+        # 新增标题检测的覆盖索引：按首次抓取时间取历史标题无需回表
+        3: [
+            "CREATE INDEX IF NOT EXISTS idx_news_first_crawl "
+            "ON news_items(first_crawl_time, platform_id, title)",
+        ],
+        # 排名历史按 (news_item_id, crawl_time) 有序覆盖，聚合单条新闻的排名无需回表与排序
+        4: [
+            "CREATE INDEX IF NOT EXISTS idx_rank_history_item_time "
+            "ON rank_history(news_item_id, crawl_time, rank)",
+            "DROP INDEX IF EXISTS idx_rank_history_news",
+        ],
+    },
+    "rss": {
+        2: [lambda conn: _create_fts_index(conn, "rss")],
+    },
+}
+
+_SCHEMA_FILES = {
+    "news": "schema.sql",
+    "rss": "rss_schema.sql",
+    "news_fts": "schema_fts.sql",
+    "rss_fts": "rss_schema_fts.sql",
+    "postgres": "postgres_schema.sql",
+}
+
+
+@lru_cache(maxsize=None)
+def load_schema_sql(db_type: str = "news") -> str:
+    """
+    读取建表 DDL（每个进程只读取一次）
+
+    Args:
+        db_type: 数据库类型 ("news" 或 "rss"，全文索引为 "news_fts" / "rss_fts"，
+                 PostgreSQL 后端为 "postgres")
+
+    Returns:
+        schema SQL 文本
+    """
+    schema_path = Path(__file__).parent / _SCHEMA_FILES[db_type]
+    if not schema_path.exists():
+        raise FileNotFoundError(f"Schema file not found: {schema_path}")
+    with open(schema_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """读取数据库的表结构版本（未初始化或旧版本文件为 0）"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def has_table(cursor: Union[sqlite3.Connection, sqlite3.Cursor], table: str) -> bool:
+    """
+    检查表是否存在
+
+    已写入版本号的数据库必然包含完整表结构，只读取文件头中的 user_version；
+    仅对无版本号的旧文件回退到查询 sqlite_master。
+
+    Args:
+        cursor: 数据库连接或游标
+        table: 表名
+
+    Returns:
+        表是否存在
+    """
+    if cursor.execute("PRAGMA user_version").fetchone()[0] > 0:
+        return True
+    return cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (table,),
+    ).fetchone() is not None
+
+
+def ensure_schema(conn: sqlite3.Connection, db_type: str = "news") -> None:
+    """
+    确保数据库表结构为当前版本
+
+    - 版本一致：直接返回，不执行任何 DDL
+    - 新文件 / 无版本号的旧文件：执行基线 DDL（版本 1），再依次执行迁移
+    - 旧版本：依次执行增量迁移
+
+    Args:
+        conn: 数据库连接（可写）
+        db_type: 数据库类型 ("news" 或 "rss")
+    """
+    target = SCHEMA_VERSIONS[db_type]
+    version = get_schema_version(conn)
+
+    if version == target:
+        return
+
+    if version > target:
+        print(f"[存储] 数据库表结构版本 ({version}) 高于当前程序支持的版本 ({target})，跳过迁移")
+        return
+
+    if version == 0:
+        # 基线 DDL 均为 IF NOT EXISTS，可安全用于新文件和补齐旧文件
+        conn.executescript(load_schema_sql(db_type))
+        version = 1
+
+    migrations = SCHEMA_MIGRATIONS[db_type]
+    for next_version in range(version + 1, target + 1):
+        for step in migrations.get(next_version, []):
+            if callable(step):
+                step(conn)
+            else:
+                conn.execute(step)
+
+    conn.execute(f"PRAGMA user_version = {target}")
+    conn.commit()
+
+
+def _lookup_existing(
+    cursor: sqlite3.Cursor,
+    table: str,
+    owner_column: str,
+    keys: List[Tuple[str, str]],
+) -> Dict[Tuple[str, str], Tuple[int, str]]:
+    """
+    批量查询已存在的记录
+
+    将 (url, owner_id) 键写入临时表后与目标表 JOIN，
+    一次查询得到所有命中记录，避免逐条 SELECT 和超长 IN 列表。
+
+    Args:
+        cursor: 数据库游标
+        table: 目标表（news_items 或 rss_items）
+        owner_column: 所属列（platform_id 或 feed_id）
+        keys: (url, owner_id) 键列表
+
+    Returns:
+        {(url, owner_id): (id, title)}
+    """
+    if not keys:
+        return {}
+
+    cursor.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS batch_keys (
+            url TEXT NOT NULL,
+            owner_id TEXT NOT NULL
+        )
+    """)
+    cursor.execute("DELETE FROM batch_keys")
+    cursor.executemany(
+        "INSERT INTO batch_keys (url, owner_id) VALUES (?, ?)",
+        keys,
+    )
+    cursor.execute(f"""
+        SELECT t.url, t.{owner_column}, t.id, t.title
+        FROM batch_keys k
+        JOIN {table} t ON t.url = k.url AND t.{owner_column} = k.owner_id
+    """)
+    existing = {(row[0], row[1]): (row[2], row[3]) for row in cursor.fetchall()}
+    cursor.execute("DELETE FROM batch_keys")
+    return existing
+
+
+def _next_row_id(cursor: sqlite3.Cursor, table: str) -> int:
+    """获取 AUTOINCREMENT 表下一个可用的 id（与 SQLite 自身分配规则一致）"""
+    cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,))
+    row = cursor.fetchone()
+    seq = row[0] if row else 0
+    cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+    return max(seq, cursor.fetchone()[0]) + 1
+
+
+def upsert_news_batch(
+    cursor: sqlite3.Cursor,
+    data: NewsData,
+    now_str: str,
+) -> Tuple[int, int, int]:
+    """
+    批量写入一次抓取的新闻条目
+
+    语义与逐条处理一致：
+    - 标准化 URL + platform_id 已存在 → 更新记录、追加排名历史，标题变化时记录变更
+    - 不存在或 URL 为空 → 插入新记录并记录初始排名
+    - 同一批次内重复的 URL 按出现顺序依次视为插入、更新
+
+    Args:
+        cursor: 数据库游标
+        data: 新闻数据
+        now_str: 当前时间字符串（YYYY-MM-DD HH:MM:SS）
+
+    Returns:
+        (新增数, 更新数, 标题变更数) 元组
+    """
+    crawl_time = data.crawl_time
+
+    rows = []
+    for source_id, news_list in data.items.items():
+        for item in news_list:
+            # 标准化 URL（去除动态参数，如微博的 band_rank）
+            normalized_url = normalize_url(item.url, source_id) if item.url else ""
+            rows.append((source_id, normalized_url, item))
+
+    keys = list({(url, source_id) for source_id, url, _ in rows if url})
+    known = _lookup_existing(cursor, "news_items", "platform_id", keys)
+    next_id = _next_row_id(cursor, "news_items")
+
+    inserts = []
+    updates = []
+    rank_rows = []
+    title_change_rows = []
+
+    for source_id, url, item in rows:
+        existing = known.get((url, source_id)) if url else None
+
+        if existing:
+            existing_id, existing_title = existing
+            if existing_title != item.title:
+                title_change_rows.append((existing_id, existing_title, item.title, now_str))
+            updates.append((item.title, item.rank, item.mobile_url,
+                            crawl_time, now_str, existing_id))
+            rank_rows.append((existing_id, item.rank, crawl_time, now_str))
+            known[(url, source_id)] = (existing_id, item.title)
+        else:
+            new_id = next_id
+            next_id += 1
+            inserts.append((new_id, item.title, source_id, item.rank, url,
+                            item.mobile_url, crawl_time, crawl_time, now_str, now_str))
+            rank_rows.append((new_id, item.rank, crawl_time, now_str))
+            if url:
+                known[(url, source_id)] = (new_id, item.title)
+
+    cursor.executemany("""
+        INSERT INTO news_items
+        (id, title, platform_id, rank, url, mobile_url,
+         first_crawl_time, last_crawl_time, crawl_count,
+         created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+    """, inserts)
+
+    cursor.executemany("""
+        UPDATE news_items SET
+            title = ?,
+            rank = ?,
+            mobile_url = ?,
+            last_crawl_time = ?,
+            crawl_count = crawl_count + 1,
+            updated_at = ?
+        WHERE id = ?
+    """, updates)
+
+    cursor.executemany("""
+        INSERT INTO title_changes
+        (news_item_id, old_title, new_title, changed_at)
+        VALUES (?, ?, ?, ?)
+    """, title_change_rows)
+
+    cursor.executemany("""
+        INSERT INTO rank_history
+        (news_item_id, rank, crawl_time, created_at)
+        VALUES (?, ?, ?, ?)
+    """, rank_rows)
+
+    return len(inserts), len(updates), len(title_change_rows)
+
+
+def upsert_rss_batch(
+    cursor: sqlite3.Cursor,
+    data: RSSData,
+    now_str: str,
+    log_prefix: str = "[存储]",
+) -> Tuple[int, int]:
+    """
+    批量写入一次抓取的 RSS 条目
+
+    URL + feed_id 已存在（包括本批次前面已插入的）→ 更新记录；否则插入。
+    rss_items 对 (url, feed_id) 有唯一约束，重复的空 URL 条目会被跳过。
+
+    Args:
+        cursor: 数据库游标
+        data: RSS 数据
+        now_str: 当前时间字符串（YYYY-MM-DD HH:MM:SS）
+        log_prefix: 日志前缀
+
+    Returns:
+        (新增数, 更新数) 元组
+    """
+    crawl_time = data.crawl_time
+
+    keys = list({
+        (item.url or "", feed_id)
+        for feed_id, rss_list in data.items.items()
+        for item in rss_list
+    })
+    known = _lookup_existing(cursor, "rss_items", "feed_id", keys)
+    next_id = _next_row_id(cursor, "rss_items")
+
+    inserts = []
+    updates = []
+
+    for feed_id, rss_list in data.items.items():
+        for item in rss_list:
+            url = item.url or ""
+            existing = known.get((url, feed_id))
+
+            if existing and url:
+                updates.append((item.title, item.published_at, item.summary,
+                                item.author, crawl_time, now_str, existing[0]))
+            elif existing:
+                print(f"{log_prefix} 保存 RSS 条目失败 [{item.title[:30]}...]: URL 为空且已存在")
+            else:
+                inserts.append((next_id, item.title, feed_id, url, item.published_at,
+                                item.summary, item.author, crawl_time,
+                                crawl_time, now_str, now_str))
+                known[(url, feed_id)] = (next_id, item.title)
+                next_id += 1
+
+    cursor.executemany("""
+        INSERT INTO rss_items
+        (id, title, feed_id, url, published_at, summary, author,
+         first_crawl_time, last_crawl_time, crawl_count,
+         created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+    """, inserts)
+
+    cursor.executemany("""
+        UPDATE rss_items SET
+            title = ?,
+            published_at = ?,
+            summary = ?,
+            author = ?,
+            last_crawl_time = ?,
+            crawl_count = crawl_count + 1,
+            updated_at = ?
+        WHERE id = ?
+    """, updates)
+
+    return len(inserts), len(updates)
+
+
+def write_news_data(cursor: sqlite3.Cursor, data: NewsData, now_str: str) -> Tuple[int, int, int]:
+    """
+    写入一次热榜抓取：平台信息、新闻条目、抓取记录和各来源状态（不提交事务）
+
+    Args:
+        cursor: 当日新闻数据库游标
+        data: 新闻数据
+        now_str: 当前时间字符串
+
+    Returns:
+        (新增数, 更新数, 标题变更数)
+    """
+    # 首先同步平台信息到 platforms 表
+    cursor.executemany("""
+        INSERT INTO platforms (id, name, updated_at)
+        VALUES (?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            name = excluded.name,
+            updated_at = excluded.updated_at
+    """, [(source_id, source_name, now_str)
+          for source_id, source_name in data.id_to_name.items()])
+
+    # 批量写入新闻条目、排名历史和标题变更
+    success_sources = list(data.items.keys())
+    new_count, updated_count, title_changed_count = upsert_news_batch(
+        cursor, data, now_str
+    )
+
+    total_items = new_count + updated_count
+
+    # 记录抓取信息
+    cursor.execute("""
+        INSERT OR REPLACE INTO crawl_records
+        (crawl_time, total_items, created_at)
+        VALUES (?, ?, ?)
+    """, (data.crawl_time, total_items, now_str))
+
+    # 获取刚插入的 crawl_record 的 ID
+    cursor.execute("""
+        SELECT id FROM crawl_records WHERE crawl_time = ?
+    """, (data.crawl_time,))
+    record_row = cursor.fetchone()
+    if record_row:
+        crawl_record_id = record_row[0]
+
+        # 记录成功的来源
+        cursor.executemany("""
+            INSERT OR REPLACE INTO crawl_source_status
+            (crawl_record_id, platform_id, status)
+            VALUES (?, ?, 'success')
+        """, [(crawl_record_id, source_id) for source_id in success_sources])
+
+        # 记录失败的来源（确保失败的平台也在 platforms 表中）
+        cursor.executemany("""
+            INSERT OR IGNORE INTO platforms (id, name, updated_at)
+            VALUES (?, ?, ?)
+        """, [(failed_id, failed_id, now_str) for failed_id in data.failed_ids])
+
+        cursor.executemany("""
+            INSERT OR REPLACE INTO crawl_source_status
+            (crawl_record_id, platform_id, status)
+            VALUES (?, ?, 'failed')
+        """, [(crawl_record_id, failed_id) for failed_id in data.failed_ids])
+
+    return new_count, updated_count, title_changed_count
+
+
+def write_rss_data(
+    cursor: sqlite3.Cursor,
+    data: RSSData,
+    now_str: str,
+    log_prefix: str = "[存储]",
+) -> Tuple[int, int]:
+    """
+    写入一次 RSS 抓取：源信息、RSS 条目、抓取记录和各源状态（不提交事务）
+
+    Args:
+        cursor: 当日 RSS 数据库游标
+        data: RSS 数据
+        now_str: 当前时间字符串
+        log_prefix: 日志前缀
+
+    Returns:
+        (新增数, 更新数)
+    """
+    # 同步 RSS 源信息到 rss_feeds 表
+    cursor.executemany("""
+        INSERT INTO rss_feeds (id, name, updated_at)
+        VALUES (?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            name = excluded.name,
+            updated_at = excluded.updated_at
+    """, [(feed_id, feed_name, now_str)
+          for feed_id, feed_name in data.id_to_name.items()])
+
+    # 批量写入 RSS 条目
+    new_count, updated_count = upsert_rss_batch(
+        cursor, data, now_str, log_prefix=log_prefix
+    )
+
+    total_items = new_count + updated_count
+
+    # 记录抓取信息
+    cursor.execute("""
+        INSERT OR REPLACE INTO rss_crawl_records
+        (crawl_time, total_items, created_at)
+        VALUES (?, ?, ?)
+    """, (data.crawl_time, total_items, now_str))
+
+    # 记录抓取状态
+    cursor.execute("""
+        SELECT id FROM rss_crawl_records WHERE crawl_time = ?
+    """, (data.crawl_time,))
+    record_row = cursor.fetchone()
+    if record_row:
+        crawl_record_id = record_row[0]
+
+        # 记录成功的源
+        cursor.executemany("""
+            INSERT OR REPLACE INTO rss_crawl_status
+            (crawl_record_id, feed_id, status)
+            VALUES (?, ?, 'success')
+        """, [(crawl_record_id, feed_id) for feed_id in data.items.keys()])
+
+        # 记录失败的源
+        cursor.executemany("""
+            INSERT OR IGNORE INTO rss_feeds (id, name, updated_at)
+            VALUES (?, ?, ?)
+        """, [(failed_id, failed_id, now_str) for failed_id in data.failed_ids])
+
+        cursor.executemany("""
+            INSERT OR REPLACE INTO rss_crawl_status
+            (crawl_record_id, feed_id, status)
+            VALUES (?, ?, 'failed')
+        """, [(crawl_record_id, failed_id) for failed_id in data.failed_ids])
+
+    return new_count, updated_count
+
+
+def write_push_record(cursor: sqlite3.Cursor, date: str, report_type: str, now_str: str) -> None:
+    """
+    写入推送记录（不提交事务）
+
+    Args:
+        cursor: 当日新闻数据库游标
+        date: 日期字符串（YYYY-MM-DD）
+        report_type: 报告类型
+        now_str: 当前时间字符串
+    """
+    cursor.execute("""
+        INSERT INTO push_records (date, pushed, push_time, report_type, created_at)
+        VALUES (?, 1, ?, ?, ?)
+        ON CONFLICT(date) DO UPDATE SET
+            pushed = 1,
+            push_time = excluded.push_time,
+            report_type = excluded.report_type
+    """, (date, now_str, report_type, now_str))
+
+
+def detect_new_titles_in_db(conn: sqlite3.Connection, current_data: NewsData) -> Dict[str, Dict]:
+    """
+    基于当日数据库检测新增标题
+
+    只有在当前批次之前（first_crawl_time < 当前抓取时间）从未出现过的标题才算新增，
+    历史标题通过 idx_news_first_crawl 覆盖索引直接查询，无需加载当天全部数据。
+
+    Args:
+        conn: 当日新闻数据库连接
+        current_data: 当前抓取的数据
+
+    Returns:
+        新增的标题数据 {source_id: {title: NewsItem}}
+    """
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT 1 FROM news_items LIMIT 1")
+    if cursor.fetchone() is None:
+        # 没有历史数据，所有都是新的
+        return {
+            source_id: {item.title: item for item in news_list}
+            for source_id, news_list in current_data.items.items()
+        }
+
+    # 收集历史标题（first_time < current_time 的标题）
+    # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
+    cursor.execute(
+        "SELECT platform_id, title FROM news_items WHERE first_crawl_time < ?",
+        (current_data.crawl_time,),
+    )
+    historical_titles: Dict[str, set] = {}
+    for platform_id, title in cursor.fetchall():
+        historical_titles.setdefault(platform_id, set()).add(title)
+
+    if not historical_titles:
+        # 第一次抓取，没有"新增"概念
+        return {}
+
+    new_titles: Dict[str, Dict] = {}
+    for source_id, news_list in current_data.items.items():
+        hist_set = historical_titles.get(source_id, set())
+        for item in news_list:
+            if item.title not in hist_set:
+                new_titles.setdefault(source_id, {})[item.title] = item
+
+    return new_titles
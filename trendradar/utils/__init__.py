@@ -11,6 +11,12 @@ from trendradar.utils.time import (
     convert_time_for_display,
 )
 from trendradar.utils.url import normalize_url, get_url_signature
+from trendradar.utils.http_client import (
+    configure_http,
+    create_session,
+    get_session,
+    close_sessions,
+)
 
 __all__ = [
     "get_configured_time",
@@ -20,4 +26,8 @@ __all__ = [
     "convert_time_for_display",
     "normalize_url",
     "get_url_signature",
+    "configure_http",
+    "create_session",
+    "get_session",
+    "close_sessions",
 ]
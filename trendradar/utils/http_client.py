@@ -0,0 +1,141 @@
+# coding=utf-8
+"""
+HTTP 客户端模块
+
+爬虫和各通知渠道共用的 HTTP 会话：
+- 按代理地址共享会话，代理只在创建会话时设置一次
+- 每个主机独立的连接池，保持长连接，同一主机的多次请求复用 TCP/TLS 连接
+- 内置重试与退避：连接失败对所有请求重试；读取超时和 429/5xx 状态码只对
+  幂等请求（GET 等）重试，避免 webhook 推送重复发送
+"""
+
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 默认连接池配置
+DEFAULT_POOL_CONNECTIONS = 16  # 缓存的主机连接池数量
+DEFAULT_POOL_MAXSIZE = 16  # 每个主机保持的最大连接数（应不小于并发线程数）
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_BACKOFF_FACTOR = 0.5
+
+# 需要重试的状态码（仅幂等请求）
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_settings = {
+    "pool_connections": DEFAULT_POOL_CONNECTIONS,
+    "pool_maxsize": DEFAULT_POOL_MAXSIZE,
+    "max_retries": DEFAULT_MAX_RETRIES,
+    "backoff_factor": DEFAULT_BACKOFF_FACTOR,
+}
+
+# 代理地址（空字符串表示直连）-> 共享会话
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def configure_http(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+) -> None:
+    """
+    设置连接池与重试策略（已创建的共享会话会被关闭，之后按新配置重建）
+
+    Args:
+        pool_connections: 缓存的主机连接池数量
+        pool_maxsize: 每个主机保持的最大连接数
+        max_retries: 最大重试次数（0=不重试）
+        backoff_factor: 退避系数，第 n 次重试前等待 backoff_factor * 2^(n-1) 秒
+    """
+    _settings.update(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+        backoff_factor=backoff_factor,
+    )
+    close_sessions()
+
+
+def _create_retry(max_retries: Optional[int] = None) -> Retry:
+    """按当前配置创建重试策略（max_retries 为 None 时使用全局配置）"""
+    if max_retries is None:
+        max_retries = _settings["max_retries"]
+    return Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=_settings["backoff_factor"],
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+
+
+def create_session(
+    proxy_url: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+    max_retries: Optional[int] = None,
+) -> requests.Session:
+    """
+    创建使用共享连接池配置的会话（需要独立请求头时使用，如 RSS 抓取）
+
+    Args:
+        proxy_url: 代理 URL（可选）
+        headers: 默认请求头（可选）
+        max_retries: 重试次数（可选，默认使用全局配置；调用方自行重试时传 0）
+
+    Returns:
+        requests.Session 对象
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_settings["pool_connections"],
+        pool_maxsize=_settings["pool_maxsize"],
+        max_retries=_create_retry(max_retries),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if headers:
+        session.headers.update(headers)
+    if proxy_url:
+        session.proxies = {"http": proxy_url, "https": proxy_url}
+        # 配置的代理优先，不被 HTTP(S)_PROXY 等环境变量覆盖
+        session.trust_env = False
+    return session
+
+
+def get_session(proxy_url: Optional[str] = None) -> requests.Session:
+    """
+    获取共享会话（同一代理地址复用同一会话及其连接池）
+
+    Args:
+        proxy_url: 代理 URL（可选）
+
+    Returns:
+        requests.Session 对象
+    """
+    key = proxy_url or ""
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = create_session(proxy_url)
+                _sessions[key] = session
+    return session
+
+
+def close_sessions() -> None:
+    """关闭所有共享会话及其连接"""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()